@@ -9,11 +9,33 @@ from discord.ext.commands import Bot
 from discord_slash import SlashCommand
 
 from bdo_daily_bot.core.logger.logger import BotLogger
+from bdo_daily_bot.core.raid.table_render_pool import TableRenderPool
 from bdo_daily_bot.core.tools.common import MetaSingleton
 from bdo_daily_bot.core.tools.path_factory import ProjectPathFactory
+from bdo_daily_bot.core.tools.request_scheduler import RequestScheduler
+from bdo_daily_bot.core.tools.rest_client import RestClient
+from bdo_daily_bot.core.tools.update_coalescer import UpdateCoalescer
+from bdo_daily_bot.core.users_interactor.dm_dispatcher import DirectMessageDispatcher
 from bdo_daily_bot.settings import settings
 
 
+class DailyBot(Bot):
+    """
+    Discord bot that applies pending raid updates before closing connection
+    """
+
+    async def close(self):
+        """
+        Flush pending raid updates, direct messages and discord API requests, close shared REST API session
+        and discord connection
+        """
+        await UpdateCoalescer.flush_all()
+        await DirectMessageDispatcher.close()
+        await RequestScheduler.close()
+        await RestClient.close()
+        await super().close()
+
+
 class BdoDailyBot(metaclass=MetaSingleton):
     """
     Discord Black Desert Online Daily bot. Contain methods to initialize and run bot.
@@ -28,7 +50,10 @@ class BdoDailyBot(metaclass=MetaSingleton):
         """
         Run discord bot event loop
         """
-        self.bot.run(settings.TOKEN)
+        try:
+            self.bot.run(settings.TOKEN)
+        finally:
+            TableRenderPool.shutdown()
 
     @staticmethod
     def __initialize_bot() -> Bot:
@@ -38,7 +63,7 @@ class BdoDailyBot(metaclass=MetaSingleton):
         :return: discord bot
         """
         intents = discord.Intents(messages=True, guilds=True, reactions=True, members=True)
-        bot = Bot(command_prefix=settings.PREFIX, intents=intents)
+        bot = DailyBot(command_prefix=settings.PREFIX, intents=intents)
         SlashCommand(bot, sync_commands=True)
         return bot
 
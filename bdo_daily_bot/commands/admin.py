@@ -1,9 +1,7 @@
 """
 Module contain discord cog with name `Admin`. Provide server admin commands
 """
-from datetime import datetime, timedelta
-
-from discord import NotFound, Role
+from discord import Role
 from discord.ext import commands
 from discord.ext.commands import Bot, Context
 
@@ -12,10 +10,12 @@ from bdo_daily_bot.core.commands.admin import remove_notification_role, set_noti
 from bdo_daily_bot.core.commands_reporter.command_failure_reasons import CommandFailureReasons
 from bdo_daily_bot.core.commands_reporter.reporter import Reporter
 from bdo_daily_bot.core.database.manager import DatabaseManager
+from bdo_daily_bot.core.guild_managment.messages_purger import MessagesPurger
 from bdo_daily_bot.core.logger import log_template
 from bdo_daily_bot.core.parser.common_parser import CommonCommandInputParser
-from bdo_daily_bot.core.users_interactor.senders import ChannelsSender
+from bdo_daily_bot.core.users_interactor.senders import ChannelsSender, UsersSender
 from bdo_daily_bot.messages import command_names, help_text, messages
+from bdo_daily_bot.settings import settings
 
 
 class Admin(commands.Cog):
@@ -73,28 +73,18 @@ class Admin(commands.Cog):
             await self.reporter.report_unsuccessful_command(ctx, CommandFailureReasons.WRONG_CHANNEL_TO_DELETE_IN)
             return
 
-        messages_to_remove = []
-        msg_count = 0
-        # Collect all messages in current channel that not older 14 days and not pinned
-        async for msg in channel.history(limit=int(amount)):
-            is_time_has_passed = datetime.now() - msg.created_at > timedelta(days=14)
-
-            # Warning user if messages older than 14 days
-            if not msg.pinned and is_time_has_passed:
-                await ctx.author.send(
-                    messages.remove_msgs_fail_14.format(msg_count=msg_count, amount=amount)
-                )
-                break
-
-            if not msg.pinned:
-                messages_to_remove.append(msg)
-                msg_count += 1
-
-        # Remove messages from channel
-        try:
-            await channel.delete_messages(messages_to_remove)
-        except NotFound:
-            pass
+        # Collect all not pinned messages in current channel
+        messages_ids_to_remove = [msg.id async for msg in channel.history(limit=int(amount)) if not msg.pinned]
+
+        # Remove messages from channel by the bulk deletes, limited amount of messages older than 14 days one by one
+        deleted_amount = await MessagesPurger.purge_channel(
+            channel, messages_ids_to_remove, single_deletes_limit=settings.REMOVE_MSGS_SINGLE_DELETES_LIMIT)
+
+        # Warning user if not all messages were removed
+        if deleted_amount < len(messages_ids_to_remove):
+            UsersSender.dispatch_to_user(ctx.author, messages.remove_msgs_partially.format(
+                deleted_amount=deleted_amount, amount=len(messages_ids_to_remove),
+                limit=settings.REMOVE_MSGS_SINGLE_DELETES_LIMIT))
         await self.reporter.report_success_command(ctx)
 
     @commands.command(name=command_names.function_command.set_reaction_for_role, help=help_text.set_reaction_for_role)
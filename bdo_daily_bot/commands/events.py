@@ -5,13 +5,19 @@ import logging
 import sys
 import traceback
 
-from discord import DiscordException, Game, Member, Message, RawReactionActionEvent, Status, TextChannel
+from discord import DiscordException, Game, Guild, Member, Message, RawBulkMessageDeleteEvent, \
+    RawMessageDeleteEvent, RawReactionActionEvent, Status
+from discord.abc import GuildChannel
 from discord.ext import commands
 from discord.ext.commands import Bot, Context
 
 from bdo_daily_bot.bot import BdoDailyBot
 from bdo_daily_bot.core.commands_reporter.reporter import Reporter
+from bdo_daily_bot.core.database.database import Database
 from bdo_daily_bot.core.database.manager import DatabaseManager
+from bdo_daily_bot.core.database.settings_change_listener import SettingsChangeListener
+from bdo_daily_bot.core.discord_cache.channel_registry import ChannelRegistry
+from bdo_daily_bot.core.discord_cache.message_resolver import MessageResolver
 from bdo_daily_bot.core.guild_managers.managers_controller import ManagersController
 from bdo_daily_bot.core.guild_security.guild_security_manager import GuildSecurityManager
 from bdo_daily_bot.core.logger import log_template
@@ -55,19 +61,24 @@ class Events(commands.Cog):
         Listener to set bot main configuration
 
         Listener trigger after bot will ready to process commands. Sets bot main configuration such
-        as status and current game. Loads still active raids from the database.
+        as status and current game. Loads still active raids from the database. Reloads channel registry
+        on every ready event, because discord client creates new channels objects after the reconnection.
         """
         # Set custom status
         custom_status = 'Разрушаюсь и перестраиваюсь'
         await self.bot.change_presence(status=Status.online, activity=Game(custom_status))
 
         BdoDailyBot.bot = self.bot
+        ChannelRegistry.load()
         # Track unplanned bot reboot
         if not self.is_bot_ready:
             self.is_bot_ready = True
             logging.info(logger_msgs.bot_ready)
-            await ManagersController.load_managers()
-            await ManagersController.load_raids()
+            await Database().warm_up()
+            await Database().ensure_indexes()
+            if settings.SETTINGS_CHANGE_STREAM:
+                SettingsChangeListener.start()
+            await ManagersController.load()
             logging.debug("Bot initialization completed.")
         else:
             log_template.bot_restarted()
@@ -116,14 +127,16 @@ class Events(commands.Cog):
         if payload.user_id == settings.BOT_ID:
             return
 
-        ctx = await ReactionContextFactory.produce_by_raw_reaction_event(payload)
-        if handlers := await ReactionStrategy.get_add_reaction_handlers(ctx):
-            for handler in handlers:
-                await handler(ctx)
+        handlers = await ReactionStrategy.get_add_reaction_handlers(
+            payload.guild_id, payload.message_id, str(payload.emoji))
+        if not handlers:
+            logging.debug("{}/{}/{} No handler for reaction `{}`".format(
+                payload.guild_id, payload.channel_id, payload.user_id, payload.emoji))
             return
-        channel_name = ctx.channel.name if isinstance(ctx.channel, TextChannel) else ctx.channel
-        logging.debug("{}/{}/{}/{} No handler for reaction `{}`".format(
-            ctx.guild, channel_name, ctx.author.name, ctx.command.name, ctx.reaction))
+
+        ctx = await ReactionContextFactory.produce_by_raw_reaction_event(payload)
+        for handler in handlers:
+            await handler(ctx)
 
     @commands.Cog.listener()
     async def on_raw_reaction_remove(self, payload: RawReactionActionEvent):
@@ -135,14 +148,72 @@ class Events(commands.Cog):
         if payload.user_id == settings.BOT_ID:
             return
 
-        ctx = await ReactionContextFactory.produce_by_raw_reaction_event(payload)
-        if handlers := await ReactionStrategy.get_remove_reaction_handlers(ctx):
-            for handler in handlers:
-                await handler(ctx)
+        handlers = await ReactionStrategy.get_remove_reaction_handlers(
+            payload.guild_id, payload.message_id, str(payload.emoji))
+        if not handlers:
+            logging.debug("{}/{}/{} No handler for reaction `{}`".format(
+                payload.guild_id, payload.channel_id, payload.user_id, payload.emoji))
             return
-        channel_name = ctx.channel.name if isinstance(ctx.channel, TextChannel) else ctx.channel
-        logging.debug("{}/{}/{}/{} No handler for reaction `{}`".format(
-            ctx.guild, channel_name, ctx.author.name, ctx.command.name, ctx.reaction))
+
+        ctx = await ReactionContextFactory.produce_by_raw_reaction_event(payload)
+        for handler in handlers:
+            await handler(ctx)
+
+    @commands.Cog.listener()
+    async def on_guild_channel_create(self, channel: GuildChannel):
+        """
+        Listener to register created guild channel in the channel registry
+
+        :param channel: created discord guild channel
+        """
+        ChannelRegistry.add(channel)
+
+    @commands.Cog.listener()
+    async def on_guild_channel_delete(self, channel: GuildChannel):
+        """
+        Listener to remove deleted guild channel from the channel registry
+
+        :param channel: deleted discord guild channel
+        """
+        ChannelRegistry.remove(channel.id)
+        MessageResolver.forget_channel(channel.id)
+
+    @commands.Cog.listener()
+    async def on_guild_join(self, guild: Guild):
+        """
+        Listener to register channels of the joined guild in the channel registry
+
+        :param guild: joined discord guild
+        """
+        ChannelRegistry.add_guild(guild)
+
+    @commands.Cog.listener()
+    async def on_guild_remove(self, guild: Guild):
+        """
+        Listener to remove channels of the left guild from the channel registry
+
+        :param guild: left discord guild
+        """
+        ChannelRegistry.remove_guild(guild)
+
+    @commands.Cog.listener()
+    async def on_raw_message_delete(self, payload: RawMessageDeleteEvent):
+        """
+        Listener to mark deleted messages in the messages index
+
+        :param payload: discord raw message delete event payload
+        """
+        MessageResolver.forget_message(payload.channel_id, payload.message_id)
+
+    @commands.Cog.listener()
+    async def on_raw_bulk_message_delete(self, payload: RawBulkMessageDeleteEvent):
+        """
+        Listener to mark bulk deleted messages in the messages index
+
+        :param payload: discord raw bulk message delete event payload
+        """
+        for message_id in payload.message_ids:
+            MessageResolver.forget_message(payload.channel_id, message_id)
 
     @commands.Cog.listener()
     async def on_message(self, message: Message):
@@ -5,10 +5,11 @@ import logging
 from functools import wraps
 from typing import Callable, Union
 
-from discord import HTTPException, TextChannel
+from discord import TextChannel
 from discord.ext.commands import Context
 
 from bdo_daily_bot.core.models.context import ContextInterface, is_context
+from bdo_daily_bot.core.tools.request_scheduler import RequestPriority, RequestScheduler
 from bdo_daily_bot.core.users_interactor.message_reaction_interactor import MessagesReactions
 
 
@@ -32,27 +33,21 @@ def command_logging(command: Callable):
             command_result = await command(*args, **kwargs)
         except BaseException as error:
             logging.warning("{} Command failed with an error.\nError: {}".format(logging_prefix, error))
-            try:
-                if isinstance(ctx, Context):
-                    await ctx.message.add_reaction(MessagesReactions.COMMAND_FAILED_WITH_ERROR)
-            except HTTPException:
-                pass
+            if isinstance(ctx, Context):
+                RequestScheduler.dispatch(RequestPriority.HIGH, f"reaction/{ctx.channel.id}",
+                                          lambda: ctx.message.add_reaction(MessagesReactions.COMMAND_FAILED_WITH_ERROR))
             raise error
         else:
             if command_result:
                 logging.info("{} Command success".format(logging_prefix))
-                try:
-                    if isinstance(ctx, Context):
-                        await ctx.message.add_reaction(MessagesReactions.YES_EMOJI)
-                except HTTPException:
-                    pass
+                if isinstance(ctx, Context):
+                    RequestScheduler.dispatch(RequestPriority.LOW, f"reaction/{ctx.channel.id}",
+                                              lambda: ctx.message.add_reaction(MessagesReactions.YES_EMOJI))
             else:
                 logging.info("{} Command didn't passed, user choice".format(logging_prefix))
-                try:
-                    if isinstance(ctx, Context):
-                        await ctx.message.add_reaction(MessagesReactions.NO_EMOJI)
-                except HTTPException:
-                    pass
+                if isinstance(ctx, Context):
+                    RequestScheduler.dispatch(RequestPriority.HIGH, f"reaction/{ctx.channel.id}",
+                                              lambda: ctx.message.add_reaction(MessagesReactions.NO_EMOJI))
             return command_result
 
     return wrapper
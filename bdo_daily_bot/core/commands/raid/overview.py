@@ -11,6 +11,7 @@ from bdo_daily_bot.core.command_gates.raid_gate import RaidGate
 from bdo_daily_bot.core.commands.common import command_logging
 from bdo_daily_bot.core.database.manager import DatabaseManager
 from bdo_daily_bot.core.raid.raid_member import RaidMember
+from bdo_daily_bot.core.raid.table_render_pool import TableRenderPool
 
 __database = DatabaseManager()
 
@@ -27,6 +28,7 @@ async def show(ctx: Context, user_initiator: RaidMember, captain: RaidMember, ti
     :return: True if command success else False
     """
     if raid := await RaidGate.pick_and_check_raid(ctx, user_initiator, captain, time_leaving):
-        await ctx.channel.send(file=discord.File(raid.table.create_table()))
+        table_image = await TableRenderPool.render(raid.table)
+        await ctx.channel.send(file=discord.File(table_image, filename=raid.table.file_name))
         return True
     return False
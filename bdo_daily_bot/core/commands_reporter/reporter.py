@@ -6,17 +6,20 @@ from discord.ext.commands import Context
 
 from bdo_daily_bot.core.commands_reporter.command_failure_reasons import CommandFailureReasons
 from bdo_daily_bot.core.logger import log_template
+from bdo_daily_bot.core.tools.request_scheduler import RequestPriority, RequestScheduler
 from bdo_daily_bot.messages import logger_msgs, messages
 
 
 class Reporter:
     @staticmethod
     async def set_success_command_reaction(message: Message):
-        await message.add_reaction('✔')
+        RequestScheduler.dispatch(RequestPriority.LOW, f"reaction/{message.channel.id}",
+                                  lambda: message.add_reaction('✔'))
 
     @staticmethod
     async def set_fail_command_reaction(message: Message):
-        await message.add_reaction('❌')
+        RequestScheduler.dispatch(RequestPriority.HIGH, f"reaction/{message.channel.id}",
+                                  lambda: message.add_reaction('❌'))
 
     @staticmethod
     async def __discord_user_unsuccessful_command_message_report(user: User, failure_reason_message: str):
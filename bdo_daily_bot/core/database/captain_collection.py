@@ -5,6 +5,7 @@ from typing import Any, Dict, Optional
 
 from motor.motor_asyncio import AsyncIOMotorCollection
 
+from bdo_daily_bot.core.database.counter_buffer import CounterBuffer
 from bdo_daily_bot.core.database.database import Database
 from bdo_daily_bot.core.raid.raid_item import RaidItem
 from bdo_daily_bot.core.tools.common import MetaSingleton
@@ -14,6 +15,7 @@ from bdo_daily_bot.settings import settings
 class CaptainCollection(metaclass=MetaSingleton):
     """Responsible for working with the captain MongoDB collection."""
     _collection = None  # Contain database settings collection
+    _statistics_buffer = None  # Contain buffer of the captains statistics changes
 
     @property
     def collection(self) -> AsyncIOMotorCollection:
@@ -72,22 +74,28 @@ class CaptainCollection(metaclass=MetaSingleton):
         """
         return await self.find_captain_post(discord_id) or await self.create_captain(discord_id, captain_name)
 
+    @property
+    def statistics_buffer(self) -> CounterBuffer:
+        """
+        Buffer of the captains statistics changes
+
+        :return: captains statistics changes buffer
+        """
+        if not self._statistics_buffer:
+            self._statistics_buffer = CounterBuffer(lambda: self.collection, "Captain statistics")
+        return self._statistics_buffer
+
     async def update_captain(self, discord_id: int, raid_item: RaidItem):
         """
         Updates the captain information with the given raid item
 
+        Change is written with other captains statistics changes after the counters flush interval.
+
         :param discord_id: captain discord user id
         :param raid_item: captain raid attributes
         """
-        await self.collection.find_one_and_update(
-            {"discord_id": discord_id},
-            {
-                "$inc": {
-                    "raids_created": 1,
-                    "drove_people": len(raid_item.members)
-                },
-                "$set": {
-                    "last_created": raid_item.time_leaving
-                }
-            }
+        self.statistics_buffer.increment(
+            discord_id,
+            {"raids_created": 1, "drove_people": len(raid_item.members)},
+            {"last_created": raid_item.time_leaving}
         )
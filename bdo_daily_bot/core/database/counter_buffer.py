@@ -0,0 +1,156 @@
+"""
+Contain buffer that merges counters changes of the database documents into the one bulk write
+"""
+import logging
+from collections import defaultdict
+from typing import Any, Callable, DefaultDict, Dict, List, Optional, Union
+
+from motor.motor_asyncio import AsyncIOMotorCollection
+from pymongo import UpdateOne
+from pymongo.errors import PyMongoError
+
+from bdo_daily_bot.core.tools.update_coalescer import UpdateCoalescer
+from bdo_daily_bot.settings import settings
+
+
+class CounterBuffer:
+    """
+    Accumulate counters changes of the documents keyed by discord id and write them with one bulk write
+
+    Changes are accumulated in memory during settings.COUNTER_FLUSH_INTERVAL seconds, so opposite changes
+    of the same counter, for example join and leave of the same user, net out before the database.
+    Pending changes are written on the bot shutdown with the other pending updates. Changes that were
+    not written because of the database error are returned to the buffer.
+    """
+
+    # Structure: {"discord_id": {"field": difference}}
+    Deltas = DefaultDict[int, DefaultDict[str, int]]
+    # Structure: {"discord_id": {"field": value}}
+    Values = DefaultDict[int, Dict[str, Any]]
+
+    def __init__(self, get_collection: Callable[[], AsyncIOMotorCollection], name: str,
+                 non_negative: bool = False):
+        """
+        :param get_collection: function that returns database collection to write changes
+        :param name: buffer name for logs
+        :param non_negative: True if counters can't be decreased below zero
+        """
+        self.name = name
+        self.non_negative = non_negative
+        self.writes = 0
+        self.changes = 0
+
+        self.__get_collection = get_collection
+        self.__deltas: CounterBuffer.Deltas = self.__new_deltas()
+        self.__values: CounterBuffer.Values = defaultdict(dict)
+        self.__flusher = UpdateCoalescer(self.flush, name, settings.COUNTER_FLUSH_INTERVAL)
+
+    def increment(self, discord_id: int, deltas: Dict[str, int], values: Optional[Dict[str, Any]] = None):
+        """
+        Add counters changes and values to set of the document with the given discord id
+
+        :param discord_id: discord id of the document to change
+        :param deltas: counters and their differences
+        :param values: fields and their new values
+        """
+        self.changes += 1
+        for field, difference in deltas.items():
+            self.__deltas[discord_id][field] += difference
+        if values:
+            self.__values[discord_id].update(values)
+        self.__flusher.request()
+
+    async def flush(self):
+        """
+        Write all accumulated changes with one bulk write
+        """
+        deltas, values = self.__deltas, self.__values
+        self.__deltas, self.__values = self.__new_deltas(), defaultdict(dict)
+        if not (operations := self.__get_operations(deltas, values)):
+            return
+
+        try:
+            await self.__get_collection().bulk_write(operations, ordered=False)
+        except PyMongoError as error:
+            logging.error("{}: Failed to write {} counters changes. Changes are returned to the buffer.\n"
+                          "Error: {}".format(self.name, len(operations), error))
+            self.__restore(deltas, values)
+            self.__flusher.request()
+            return
+        self.writes += 1
+        logging.debug("{}: {} documents counters were written".format(self.name, len(operations)))
+
+    def __get_operations(self, deltas: Deltas, values: Values) -> List[UpdateOne]:
+        """
+        Gets update operations for all documents with not zero differences or values to set
+
+        :param deltas: counters differences by discord id
+        :param values: values to set by discord id
+        :return: update operations
+        """
+        operations = []
+        for discord_id in set(deltas) | set(values):
+            document_deltas = {field: difference for field, difference in deltas.get(discord_id, {}).items()
+                               if difference}
+            if update := self.__get_update(document_deltas, values.get(discord_id, {})):
+                operations.append(UpdateOne(self.__get_filter(discord_id, document_deltas), update))
+        return operations
+
+    def __get_filter(self, discord_id: int, deltas: Dict[str, int]) -> Dict[str, Any]:
+        """
+        Gets filter of the one document
+
+        Counters that can't be negative are decreased only if they are positive.
+
+        :param discord_id: discord id of the document
+        :param deltas: not zero counters differences
+        :return: document filter
+        """
+        document_filter = {"discord_id": discord_id}
+        if self.non_negative:
+            document_filter.update({field: {"$gt": 0} for field, difference in deltas.items() if difference < 0})
+        return document_filter
+
+    def __get_update(self, deltas: Dict[str, int], values: Dict[str, Any]) -> Union[Dict, List[Dict], None]:
+        """
+        Gets update of the one document
+
+        Decreased counters that can't be negative are updated with aggregation pipeline, so they stop at zero.
+
+        :param deltas: not zero counters differences
+        :param values: values to set
+        :return: update document or pipeline. None if document has nothing to update
+        """
+        if self.non_negative and any(difference < 0 for difference in deltas.values()):
+            counters = {field: {"$max": [0, {"$add": [{"$ifNull": [f"${field}", 0]}, difference]}]}
+                        for field, difference in deltas.items()}
+            literal_values = {field: {"$literal": value} for field, value in values.items()}
+            return [{"$set": {**counters, **literal_values}}]
+        update = {}
+        if deltas:
+            update["$inc"] = deltas
+        if values:
+            update["$set"] = values
+        return update or None
+
+    def __restore(self, deltas: Deltas, values: Values):
+        """
+        Return not written changes to the buffer before the newer changes
+
+        :param deltas: not written counters differences
+        :param values: not written values to set
+        """
+        for discord_id, document_deltas in deltas.items():
+            for field, difference in document_deltas.items():
+                self.__deltas[discord_id][field] += difference
+        for discord_id, document_values in values.items():
+            self.__values[discord_id] = {**document_values, **self.__values.get(discord_id, {})}
+
+    @staticmethod
+    def __new_deltas() -> Deltas:
+        """
+        Create empty counters differences
+
+        :return: empty counters differences by discord id
+        """
+        return defaultdict(lambda: defaultdict(int))
@@ -1,8 +1,14 @@
 """Module contain class to wrap MongoDB"""
+import asyncio
 import logging
+from typing import Union
 
 from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorDatabase
+from pymongo.errors import PyMongoError
 
+from bdo_daily_bot.core.database.index_bootstrapper import IndexBootstrapper
+from bdo_daily_bot.core.database.memory_database import MemoryDatabase
+from bdo_daily_bot.core.database.pool_monitor import PoolMonitor
 from bdo_daily_bot.core.tools.common import MetaSingleton
 from bdo_daily_bot.settings import settings
 
@@ -12,29 +18,62 @@ class Database(metaclass=MetaSingleton):
     Responsible for providing database.
 
     Responsible for responding the database and connecting to the database.
+    Database backend is chosen by settings.DATABASE_BACKEND: MongoDB with motor or the in-memory database
+    with the same collections interface. MongoDB client is configured by settings.DATABASE_CLIENT_OPTIONS
+    and its connection pool is watched by the pool monitor.
     """
     _cluster = None  # MongoDB cluster
 
-    def _connect(self) -> AsyncIOMotorDatabase:
+    def _connect(self) -> Union[AsyncIOMotorDatabase, MemoryDatabase]:
         """
         Responsible for providing the database.
 
         Responsible for providing the database. If this database exists, it returns it.
         If the database does not exist, then it is connect and provide.
 
-        :return: Mongo database
+        :return: Mongo database or in-memory database
         """
         if not self._cluster:
             logging.debug('Bot initialization: Initialisation database.')
-            self._cluster = AsyncIOMotorClient(settings.BD_STRING)[settings.CLUSTER_NAME]
+            if settings.DATABASE_BACKEND == 'memory':
+                self._cluster = MemoryDatabase(settings.CLUSTER_NAME)
+                logging.warning('Bot initialization: In-memory database is used. Data will be lost on the bot stop.')
+            else:
+                client = AsyncIOMotorClient(settings.BD_STRING, event_listeners=[PoolMonitor()],
+                                            **settings.DATABASE_CLIENT_OPTIONS)
+                self._cluster = client[settings.CLUSTER_NAME]
             logging.debug('Bot initialization: Database connected.')
         return self._cluster
 
     @property
-    def database(self) -> AsyncIOMotorDatabase:
+    def database(self) -> Union[AsyncIOMotorDatabase, MemoryDatabase]:
         """
-        Mongo database
+        Mongo database or in-memory database
 
-        :return: Mongo database
+        :return: Mongo database or in-memory database
         """
         return self._connect()
+
+    async def ensure_indexes(self):
+        """
+        Create declared indexes of all collections and report missing or unused indexes
+        """
+        await IndexBootstrapper.ensure_indexes(self.database)
+        await IndexBootstrapper.report_indexes(self.database)
+
+    async def warm_up(self):
+        """
+        Open the minimum amount of the pool connections
+
+        Connections are opened by the simultaneous ping commands, so the first queries after the bot start
+        don't wait for the connection setup.
+        """
+        if settings.DATABASE_BACKEND == 'memory':
+            return
+        connections_amount = settings.DATABASE_CLIENT_OPTIONS.get('minPoolSize', 0) or 1
+        try:
+            await asyncio.gather(*(self.database.command('ping') for _ in range(connections_amount)))
+        except PyMongoError as error:
+            logging.error("Bot initialization: Database warm up failed.\nError: {}".format(error))
+            return
+        PoolMonitor.report()
@@ -0,0 +1,124 @@
+"""
+Contain declared indexes of all database collections and their management
+"""
+import logging
+from typing import Dict, List, Set
+
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo import ASCENDING, IndexModel
+from pymongo.errors import OperationFailure
+
+from bdo_daily_bot.settings import settings
+
+
+class IndexBootstrapper:
+    """
+    Ensure declared indexes of all database collections
+
+    Indexes are declared per collection by the queries that collections do. Index creation is idempotent,
+    so indexes are ensured on each bot start. Raid time leaving index is TTL index if raid document TTL is set.
+    Indexes that are missed after creation or were not used since the database server start are reported in logs.
+    """
+    # Structure: {"collection_name": [IndexModel, ]}
+    INDEXES: Dict[str, List[IndexModel]] = {
+        settings.USER_COLLECTION: [
+            IndexModel([("discord_id", ASCENDING)], name="discord_id", unique=True),
+            IndexModel([("nickname", ASCENDING)], name="nickname"),
+        ],
+        settings.CAPTAIN_COLLECTION: [
+            IndexModel([("discord_id", ASCENDING)], name="discord_id", unique=True),
+        ],
+        settings.SETTINGS_COLLECTION: [
+            IndexModel([("guild_id", ASCENDING)], name="guild_id", unique=True),
+            IndexModel([("is_raids_enabled", ASCENDING)], name="is_raids_enabled"),
+        ],
+        settings.RAID_COLLECTION: [
+            IndexModel([("captain_name", ASCENDING), ("time_leaving", ASCENDING)],
+                       name="captain_name_time_leaving", unique=True),
+            IndexModel([("time_leaving", ASCENDING)], name="time_leaving",
+                       **({"expireAfterSeconds": settings.RAID_DOCUMENT_TTL}
+                          if settings.RAID_DOCUMENT_TTL is not None else {})),
+        ],
+        settings.RAID_ARCHIVE_COLLECTION: [
+            IndexModel([("time_leaving", ASCENDING)], name="time_leaving"),
+        ],
+    }
+
+    @classmethod
+    def get_index_names(cls, collection_name: str) -> Set[str]:
+        """
+        Gets names of the declared indexes of the given collection
+
+        :param collection_name: database collection name
+        :return: declared indexes names
+        """
+        return {index.document["name"] for index in cls.INDEXES.get(collection_name, [])}
+
+    @classmethod
+    async def ensure_indexes(cls, database: AsyncIOMotorDatabase):
+        """
+        Create declared indexes of all collections if they don't exist
+
+        Index that can't be created, for example because of duplicated documents for the unique index,
+        is reported and doesn't stop the creation of other indexes.
+
+        :param database: mongo database with collections to index
+        """
+        for collection_name, indexes in cls.INDEXES.items():
+            for index in indexes:
+                try:
+                    await database[collection_name].create_indexes([index])
+                except OperationFailure as error:
+                    logging.error("Bot initialization: Can't create index {} of the collection {}.\nError: {}".
+                                  format(index.document["name"], collection_name, error))
+        logging.debug("Bot initialization: Database indexes ensured")
+
+    @classmethod
+    async def get_missing_indexes(cls, database: AsyncIOMotorDatabase) -> Dict[str, Set[str]]:
+        """
+        Gets declared indexes that don't exist in the database
+
+        :param database: mongo database with indexed collections
+        :return: missing indexes names by collection name
+        """
+        missing_indexes = {}
+        for collection_name in cls.INDEXES:
+            existing_indexes = set((await database[collection_name].index_information()).keys())
+            if missing := cls.get_index_names(collection_name) - existing_indexes:
+                missing_indexes[collection_name] = missing
+        return missing_indexes
+
+    @classmethod
+    async def get_unused_indexes(cls, database: AsyncIOMotorDatabase) -> Dict[str, Set[str]]:
+        """
+        Gets indexes of the indexed collections that were not used since the database server start
+
+        :param database: mongo database with indexed collections
+        :return: unused indexes names by collection name
+        """
+        unused_indexes = {}
+        for collection_name in cls.INDEXES:
+            index_stats = database[collection_name].aggregate([{"$indexStats": {}}])
+            if unused := {stats["name"] async for stats in index_stats
+                          if stats["name"] != "_id_" and not stats["accesses"]["ops"]}:
+                unused_indexes[collection_name] = unused
+        return unused_indexes
+
+    @classmethod
+    async def report_indexes(cls, database: AsyncIOMotorDatabase):
+        """
+        Report missing and unused indexes of all collections in logs
+
+        :param database: mongo database with indexed collections
+        """
+        for collection_name, index_names in (await cls.get_missing_indexes(database)).items():
+            logging.warning("Bot initialization: Collection {} has no indexes {}".
+                            format(collection_name, ", ".join(sorted(index_names))))
+        try:
+            unused_indexes = await cls.get_unused_indexes(database)
+        except OperationFailure as error:
+            logging.debug("Bot initialization: Can't get indexes usage statistics.\nError: {}".format(error))
+            return
+        for collection_name, index_names in unused_indexes.items():
+            logging.info("Bot initialization: Collection {} indexes {} were not used since the database start".
+                         format(collection_name, ", ".join(sorted(index_names))))
@@ -0,0 +1,685 @@
+"""
+Contain in-memory database backend with the subset of the motor database interface used by the bot collections
+"""
+import copy
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+
+from bson import ObjectId
+from pymongo import DeleteOne, InsertOne, ReturnDocument, UpdateMany, UpdateOne
+from pymongo.errors import BulkWriteError, DuplicateKeyError, OperationFailure
+from pymongo.results import BulkWriteResult, DeleteResult, InsertOneResult, UpdateResult
+
+# Sentinel of the missed document field
+_MISSING = object()
+
+
+def _get_values(document: Any, path: str) -> List[Any]:
+    """
+    Gets all values of the document by the dotted path
+
+    Path parts go through the arrays like in MongoDB queries, so "members.nickname" gives nicknames of all members.
+
+    :param document: document or its nested value
+    :param path: dotted field path
+    :return: found values
+    """
+    key, _, rest = path.partition(".")
+    if isinstance(document, list):
+        if key.isdigit():
+            if int(key) >= len(document):
+                return []
+            return _get_values(document[int(key)], rest) if rest else [document[int(key)]]
+        return [value for item in document for value in _get_values(item, path)]
+    if not isinstance(document, dict) or key not in document:
+        return []
+    return _get_values(document[key], rest) if rest else [document[key]]
+
+
+def _compare(value: Any, other: Any) -> Optional[int]:
+    """
+    Compare two values of the comparable types
+
+    :param value: first value
+    :param other: second value
+    :return: -1, 0 or 1 as the result of the comparison. None if values can't be compared
+    """
+    numbers = (int, float)
+    if isinstance(value, numbers) and isinstance(other, numbers) or \
+            type(value) is type(other) and isinstance(value, (str, datetime)):
+        return (value > other) - (value < other)
+    return None
+
+
+def _match_condition(values: List[Any], condition: Any) -> bool:
+    """
+    Check that any of the field values satisfies the condition
+
+    :param values: field values, empty if field doesn't exist
+    :param condition: value to be equal or dict of the query operators
+    :return: True if the condition is satisfied else False
+    """
+    if isinstance(condition, dict) and condition and all(key.startswith("$") for key in condition):
+        return all(_match_operator(values, operator, argument) for operator, argument in condition.items())
+    return _match_operator(values, "$eq", condition)
+
+
+def _match_operator(values: List[Any], operator: str, argument: Any) -> bool:
+    """
+    Check that field values satisfy the query operator
+
+    :param values: field values, empty if field doesn't exist
+    :param operator: query operator
+    :param argument: query operator argument
+    :return: True if the operator is satisfied else False
+    """
+    # Arrays are matched by themselves and by their elements
+    candidates = values + [item for value in values if isinstance(value, list) for item in value]
+    if operator == "$eq":
+        return argument in candidates if candidates else argument is None
+    if operator == "$ne":
+        return not _match_operator(values, "$eq", argument)
+    if operator == "$in":
+        return any(_match_operator(values, "$eq", item) for item in argument)
+    if operator == "$nin":
+        return not _match_operator(values, "$in", argument)
+    if operator == "$exists":
+        return bool(values) == bool(argument)
+    comparisons = {"$gt": (1,), "$gte": (0, 1), "$lt": (-1,), "$lte": (-1, 0)}
+    if operator in comparisons:
+        return any(_compare(candidate, argument) in comparisons[operator] for candidate in candidates)
+    raise OperationFailure(f"Query operator {operator} is not supported by the memory database")
+
+
+def match(document: Dict[str, Any], query: Dict[str, Any]) -> bool:
+    """
+    Check that the document matches MongoDB query
+
+    :param document: document to check
+    :param query: MongoDB query
+    :return: True if the document matches the query else False
+    """
+    for key, condition in query.items():
+        if key == "$and":
+            matched = all(match(document, sub_query) for sub_query in condition)
+        elif key == "$or":
+            matched = any(match(document, sub_query) for sub_query in condition)
+        else:
+            matched = _match_condition(_get_values(document, key), condition)
+        if not matched:
+            return False
+    return True
+
+
+def _set_value(document: Dict[str, Any], path: str, value: Any):
+    """
+    Set value of the document by the dotted path creating missed nested documents
+
+    :param document: document to change
+    :param path: dotted field path
+    :param value: value to set
+    """
+    *parents, key = path.split(".")
+    for parent in parents:
+        document = document.setdefault(parent, {})
+    document[key] = value
+
+
+def _get_value(document: Dict[str, Any], path: str) -> Any:
+    """
+    Gets value of the document by the dotted path without going through the arrays
+
+    :param document: document
+    :param path: dotted field path
+    :return: found value or _MISSING
+    """
+    for key in path.split("."):
+        if not isinstance(document, dict) or key not in document:
+            return _MISSING
+        document = document[key]
+    return document
+
+
+def _unset_value(document: Dict[str, Any], path: str):
+    """
+    Remove value of the document by the dotted path
+
+    :param document: document to change
+    :param path: dotted field path
+    """
+    *parents, key = path.split(".")
+    parent = _get_value(document, ".".join(parents)) if parents else document
+    if isinstance(parent, dict):
+        parent.pop(key, None)
+
+
+def _evaluate(document: Dict[str, Any], expression: Any) -> Any:
+    """
+    Evaluate aggregation expression of the pipeline update for the document
+
+    :param document: document to evaluate expression for
+    :param expression: aggregation expression
+    :return: expression value
+    """
+    if isinstance(expression, str) and expression.startswith("$"):
+        value = _get_value(document, expression[1:])
+        return None if value is _MISSING else value
+    if isinstance(expression, list):
+        return [_evaluate(document, item) for item in expression]
+    if not isinstance(expression, dict):
+        return expression
+    if len(expression) != 1 or not next(iter(expression)).startswith("$"):
+        return {key: _evaluate(document, value) for key, value in expression.items()}
+
+    operator, arguments = next(iter(expression.items()))
+    if operator == "$literal":
+        return arguments
+    arguments = _evaluate(document, arguments)
+    if operator == "$ifNull":
+        return next((argument for argument in arguments if argument is not None), None)
+    if operator == "$add":
+        return None if None in arguments else sum(arguments)
+    if operator in ("$max", "$min"):
+        arguments = [argument for argument in arguments if argument is not None]
+        return (max if operator == "$max" else min)(arguments) if arguments else None
+    raise OperationFailure(f"Expression operator {operator} is not supported by the memory database")
+
+
+def apply_update(document: Dict[str, Any], update: Union[Dict[str, Any], List[Dict[str, Any]]],
+                 is_insert: bool = False):
+    """
+    Apply MongoDB update operators or update pipeline to the document
+
+    :param document: document to change
+    :param update: update operators or pipeline with $set stages
+    :param is_insert: True if the document is inserted by the upsert
+    """
+    if isinstance(update, list):
+        for stage in update:
+            for stage_name, fields in stage.items():
+                if stage_name not in ("$set", "$addFields"):
+                    raise OperationFailure(f"Pipeline stage {stage_name} is not supported by the memory database")
+                values = {path: _evaluate(document, expression) for path, expression in fields.items()}
+                for path, value in values.items():
+                    _set_value(document, path, value)
+        return
+    if not all(operator.startswith("$") for operator in update):
+        raise OperationFailure("Update document must contain only update operators")
+
+    for operator, fields in update.items():
+        for path, argument in fields.items():
+            current_value = _get_value(document, path)
+            if operator == "$set" or operator == "$setOnInsert" and is_insert:
+                _set_value(document, path, copy.deepcopy(argument))
+            elif operator == "$unset":
+                _unset_value(document, path)
+            elif operator == "$inc":
+                _set_value(document, path, (0 if current_value is _MISSING else current_value) + argument)
+            elif operator == "$push":
+                _set_value(document, path, ([] if current_value is _MISSING else current_value) + [argument])
+            elif operator == "$addToSet":
+                array = [] if current_value is _MISSING else current_value
+                _set_value(document, path, array if argument in array else array + [argument])
+            elif operator == "$pull":
+                if current_value is not _MISSING:
+                    _set_value(document, path, [item for item in current_value if not _match_pulled(item, argument)])
+            elif operator != "$setOnInsert":
+                raise OperationFailure(f"Update operator {operator} is not supported by the memory database")
+
+
+def _match_pulled(item: Any, condition: Any) -> bool:
+    """
+    Check that the array item matches $pull condition
+
+    :param item: array item
+    :param condition: value or query of the items to remove
+    :return: True if the item should be removed else False
+    """
+    if isinstance(condition, dict) and isinstance(item, dict):
+        return match(item, condition)
+    return _match_condition([item], condition)
+
+
+def project(document: Dict[str, Any], projection: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Gets copy of the document with the projected top level fields
+
+    :param document: document to project
+    :param projection: MongoDB projection with including or excluding fields
+    :return: projected copy of the document
+    """
+    document = copy.deepcopy(document)
+    if not projection:
+        return document
+    include_id = projection.get("_id", 1)
+    fields = {key: value for key, value in projection.items() if key != "_id"}
+    if any(fields.values()):
+        document = {key: value for key, value in document.items() if fields.get(key) or key == "_id"}
+    else:
+        document = {key: value for key, value in document.items() if key not in fields}
+    if not include_id:
+        document.pop("_id", None)
+    return document
+
+
+class MemoryCursor:
+    """
+    Cursor of the found documents
+    """
+
+    def __init__(self, collection: "MemoryCollection", query: Dict[str, Any], projection: Optional[Dict[str, Any]]):
+        """
+        :param collection: collection to find in
+        :param query: MongoDB query
+        :param projection: MongoDB projection
+        """
+        self.__collection = collection
+        self.__query = query
+        self.__documents = iter([project(document, projection) for document in collection.find_documents(query)])
+
+    def __aiter__(self) -> "MemoryCursor":
+        return self
+
+    async def __anext__(self) -> Dict[str, Any]:
+        try:
+            return next(self.__documents)
+        except StopIteration:
+            raise StopAsyncIteration
+
+    async def to_list(self, length: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Gets found documents as list
+
+        :param length: maximum amount of documents. All documents if not specified
+        :return: found documents
+        """
+        documents = []
+        for document in self.__documents:
+            if length and len(documents) >= length:
+                break
+            documents.append(document)
+        return documents
+
+    async def explain(self) -> Dict[str, Any]:
+        """
+        Gets query plan that scans the index with the most matched key prefix or the whole collection
+
+        :return: query plan in the MongoDB explain format
+        """
+        return {"queryPlanner": {"winningPlan": self.__collection.get_plan(self.__query)}}
+
+
+class MemoryCollection:
+    """
+    Collection that keeps documents in memory and provides the subset of the motor collection interface
+
+    Documents are copied on every write and read, so stored documents can't be changed outside the collection.
+    Unique indexes are checked on every write.
+    """
+
+    def __init__(self, name: str):
+        """
+        :param name: collection name
+        """
+        self.name = name
+        self.__documents: List[Dict[str, Any]] = []
+        # Structure: {"index_name": {"key": [("field", direction), ], "unique": bool}}
+        self.__indexes: Dict[str, Dict[str, Any]] = {"_id_": {"key": [("_id", 1)], "unique": True}}
+
+    def find_documents(self, query: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over the stored documents that match the query
+
+        :param query: MongoDB query
+        :return: stored documents
+        """
+        return (document for document in list(self.__documents) if match(document, query or {}))
+
+    def get_plan(self, query: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Gets query plan of the query
+
+        :param query: MongoDB query
+        :return: query plan with IXSCAN stage of the best index or COLLSCAN stage
+        """
+        best_index, best_prefix = None, 0
+        for index_name, index in self.__indexes.items():
+            prefix = 0
+            for field, _ in index["key"]:
+                if field not in query:
+                    break
+                prefix += 1
+            if prefix > best_prefix:
+                best_index, best_prefix = index_name, prefix
+        if not best_index:
+            return {"stage": "COLLSCAN"}
+        return {"stage": "FETCH", "inputStage": {"stage": "IXSCAN", "indexName": best_index}}
+
+    async def insert_one(self, document: Dict[str, Any]) -> InsertOneResult:
+        """
+        Insert the document. Document gets _id if it doesn't have it
+
+        :param document: document to insert
+        :return: insert result
+        """
+        document.setdefault("_id", ObjectId())
+        self.__store(copy.deepcopy(document))
+        return InsertOneResult(document["_id"], acknowledged=True)
+
+    async def insert_many(self, documents: List[Dict[str, Any]], **_):
+        """
+        Insert all given documents
+
+        :param documents: documents to insert
+        """
+        for document in documents:
+            await self.insert_one(document)
+
+    def find(self, query: Optional[Dict[str, Any]] = None, projection: Optional[Dict[str, Any]] = None) \
+            -> MemoryCursor:
+        """
+        Find documents that match the query
+
+        :param query: MongoDB query
+        :param projection: MongoDB projection
+        :return: cursor of the found documents
+        """
+        return MemoryCursor(self, query or {}, projection)
+
+    async def find_one(self, query: Optional[Dict[str, Any]] = None,
+                       projection: Optional[Dict[str, Any]] = None) -> Optional[Dict[str, Any]]:
+        """
+        Find the first document that matches the query
+
+        :param query: MongoDB query
+        :param projection: MongoDB projection
+        :return: copy of the found document or None
+        """
+        document = next(self.find_documents(query or {}), None)
+        return project(document, projection) if document else None
+
+    async def count_documents(self, query: Dict[str, Any]) -> int:
+        """
+        Count documents that match the query
+
+        :param query: MongoDB query
+        :return: amount of the found documents
+        """
+        return sum(1 for _ in self.find_documents(query))
+
+    async def find_one_and_update(self, query: Dict[str, Any], update: Union[Dict, List[Dict]],
+                                  projection: Optional[Dict[str, Any]] = None, upsert: bool = False,
+                                  return_document: bool = ReturnDocument.BEFORE) -> Optional[Dict[str, Any]]:
+        """
+        Update the first document that matches the query
+
+        :param query: MongoDB query
+        :param update: update operators or pipeline
+        :param projection: MongoDB projection of the returned document
+        :param upsert: insert document if nothing matches the query
+        :param return_document: return document before or after the update
+        :return: copy of the document before or after the update
+        """
+        before, after = self.__update(query, update, upsert, multi=False)[:2]
+        document = after if return_document == ReturnDocument.AFTER else before
+        return project(document, projection) if document else None
+
+    async def update_one(self, query: Dict[str, Any], update: Union[Dict, List[Dict]],
+                         upsert: bool = False) -> UpdateResult:
+        """
+        Update the first document that matches the query
+
+        :param query: MongoDB query
+        :param update: update operators or pipeline
+        :param upsert: insert document if nothing matches the query
+        :return: update result
+        """
+        _, _, result = self.__update(query, update, upsert, multi=False)
+        return UpdateResult(result, acknowledged=True)
+
+    async def update_many(self, query: Dict[str, Any], update: Union[Dict, List[Dict]],
+                          upsert: bool = False) -> UpdateResult:
+        """
+        Update all documents that match the query
+
+        :param query: MongoDB query
+        :param update: update operators or pipeline
+        :param upsert: insert document if nothing matches the query
+        :return: update result
+        """
+        _, _, result = self.__update(query, update, upsert, multi=True)
+        return UpdateResult(result, acknowledged=True)
+
+    async def delete_one(self, query: Dict[str, Any]) -> DeleteResult:
+        """
+        Delete the first document that matches the query
+
+        :param query: MongoDB query
+        :return: delete result
+        """
+        return self.__delete(query, multi=False)
+
+    async def delete_many(self, query: Dict[str, Any]) -> DeleteResult:
+        """
+        Delete all documents that match the query
+
+        :param query: MongoDB query
+        :return: delete result
+        """
+        return self.__delete(query, multi=True)
+
+    async def bulk_write(self, operations: List[Union[InsertOne, UpdateOne, UpdateMany, DeleteOne]],
+                         ordered: bool = True) -> BulkWriteResult:
+        """
+        Run write operations one by one
+
+        Failed operations are reported with BulkWriteError like in MongoDB, the unordered write applies all
+        other operations.
+
+        :param operations: pymongo write operations
+        :param ordered: stop on the first error if True
+        :return: bulk write result
+        """
+        result = {"nInserted": 0, "nMatched": 0, "nModified": 0, "nRemoved": 0, "nUpserted": 0, "upserted": []}
+        errors = []
+        for index, operation in enumerate(operations):
+            try:
+                if isinstance(operation, InsertOne):
+                    await self.insert_one(operation._doc)
+                    result["nInserted"] += 1
+                elif isinstance(operation, (UpdateOne, UpdateMany)):
+                    _, _, update_result = self.__update(operation._filter, operation._doc, bool(operation._upsert),
+                                                        multi=isinstance(operation, UpdateMany))
+                    result["nMatched"] += update_result["n"] - int("upserted" in update_result)
+                    result["nModified"] += update_result["nModified"]
+                    result["nUpserted"] += int("upserted" in update_result)
+                elif isinstance(operation, DeleteOne):
+                    result["nRemoved"] += self.__delete(operation._filter, multi=False).deleted_count
+                else:
+                    raise OperationFailure(f"Operation {operation} is not supported by the memory database")
+            except OperationFailure as error:
+                errors.append({"index": index, "code": error.code, "errmsg": str(error), "op": operation})
+                if ordered:
+                    break
+        if errors:
+            raise BulkWriteError({**result, "writeErrors": errors, "writeConcernErrors": []})
+        return BulkWriteResult(result, acknowledged=True)
+
+    async def create_indexes(self, indexes: List[Any]) -> List[str]:
+        """
+        Create indexes if they don't exist
+
+        Index options are not used by the memory collection, only unique constraint is checked on writes.
+
+        :param indexes: pymongo index models
+        :return: created indexes names
+        """
+        names = []
+        for index in indexes:
+            document = index.document
+            key = list(document["key"].items())
+            unique = document.get("unique", False)
+            existing_index = self.__indexes.get(document["name"])
+            if existing_index and (existing_index["key"] != key or existing_index["unique"] != unique):
+                raise OperationFailure(f"Index with name {document['name']} already exists with different options")
+            if unique and not existing_index:
+                self.__check_unique(key, self.__documents)
+            self.__indexes[document["name"]] = {"key": key, "unique": unique}
+            names.append(document["name"])
+        return names
+
+    async def index_information(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Gets information about the collection indexes
+
+        :return: index information by index name
+        """
+        return copy.deepcopy(self.__indexes)
+
+    def aggregate(self, pipeline: List[Dict[str, Any]], **_):
+        """
+        Aggregation is not supported by the memory collection
+
+        :param pipeline: aggregation pipeline
+        """
+        raise OperationFailure("Aggregation is not supported by the memory database")
+
+    def watch(self, *_, **__):
+        """
+        Change streams are not supported by the memory collection
+        """
+        raise OperationFailure("Change streams are not supported by the memory database")
+
+    async def drop(self):
+        """
+        Remove all documents and indexes of the collection
+        """
+        self.__documents.clear()
+        self.__indexes = {"_id_": {"key": [("_id", 1)], "unique": True}}
+
+    def __store(self, document: Dict[str, Any], replaced: Optional[Dict[str, Any]] = None):
+        """
+        Store new document or replace stored document after the unique indexes check
+
+        :param document: document to store
+        :param replaced: stored document to replace
+        """
+        for index_name, index in self.__indexes.items():
+            if not index["unique"]:
+                continue
+            value = self.__get_key_value(index["key"], document)
+            if any(self.__get_key_value(index["key"], stored) == value
+                   for stored in self.__documents if stored is not replaced):
+                raise DuplicateKeyError(f"Duplicate key error collection: {self.name} index: {index_name}", 11000)
+        if replaced is None:
+            self.__documents.append(document)
+        else:
+            self.__documents[self.__documents.index(replaced)] = document
+
+    def __check_unique(self, key: List[Tuple[str, int]], documents: List[Dict[str, Any]]):
+        """
+        Check that documents don't have the same values of the unique index key
+
+        :param key: unique index key
+        :param documents: documents to check
+        """
+        values = [self.__get_key_value(key, document) for document in documents]
+        for number, value in enumerate(values):
+            if value in values[number + 1:]:
+                raise DuplicateKeyError(f"Duplicate key error collection: {self.name} index key: {value}", 11000)
+
+    @staticmethod
+    def __get_key_value(key: List[Tuple[str, int]], document: Dict[str, Any]) -> List[Any]:
+        """
+        Gets values of the index key fields of the document. Missed fields are None like in MongoDB
+
+        :param key: index key
+        :param document: indexed document
+        :return: index key values
+        """
+        return [None if (value := _get_value(document, field)) is _MISSING else value for field, _ in key]
+
+    def __update(self, query: Dict[str, Any], update: Union[Dict, List[Dict]], upsert: bool, multi: bool) \
+            -> Tuple[Optional[Dict[str, Any]], Optional[Dict[str, Any]], Dict[str, Any]]:
+        """
+        Update documents that match the query or insert new document
+
+        :param query: MongoDB query
+        :param update: update operators or pipeline
+        :param upsert: insert document if nothing matches the query
+        :param multi: update all matched documents if True else the first one
+        :return: first document before and after the update and raw update result
+        """
+        matched = list(self.find_documents(query))
+        if not multi:
+            matched = matched[:1]
+        if not matched:
+            if not upsert:
+                return None, None, {"n": 0, "nModified": 0}
+            document = {key: copy.deepcopy(value) for key, value in query.items()
+                        if not key.startswith("$") and "." not in key and
+                        not (isinstance(value, dict) and any(str(operator).startswith("$") for operator in value))}
+            apply_update(document, update, is_insert=True)
+            document.setdefault("_id", ObjectId())
+            self.__store(document)
+            return None, copy.deepcopy(document), {"n": 1, "nModified": 0, "upserted": document["_id"]}
+
+        first_before = first_after = None
+        modified = 0
+        for stored in matched:
+            updated = copy.deepcopy(stored)
+            apply_update(updated, update)
+            if updated != stored:
+                self.__store(updated, replaced=stored)
+                modified += 1
+            first_before = first_before or copy.deepcopy(stored)
+            first_after = first_after or copy.deepcopy(updated)
+        return first_before, first_after, {"n": len(matched), "nModified": modified}
+
+    def __delete(self, query: Dict[str, Any], multi: bool) -> DeleteResult:
+        """
+        Delete documents that match the query
+
+        :param query: MongoDB query
+        :param multi: delete all matched documents if True else the first one
+        :return: delete result
+        """
+        matched = list(self.find_documents(query))
+        if not multi:
+            matched = matched[:1]
+        matched_ids = {id(document) for document in matched}
+        self.__documents = [document for document in self.__documents if id(document) not in matched_ids]
+        return DeleteResult({"n": len(matched)}, acknowledged=True)
+
+
+class MemoryDatabase:
+    """
+    Database that keeps collections in memory and provides the subset of the motor database interface
+
+    Used instead of MongoDB for the local bot runs, load tests and hermetic tests.
+    """
+
+    def __init__(self, name: str):
+        """
+        :param name: database name
+        """
+        self.name = name
+        self.__collections: Dict[str, MemoryCollection] = {}
+
+    def __getitem__(self, collection_name: str) -> MemoryCollection:
+        """
+        Gets collection with the given name or create it
+
+        :param collection_name: collection name
+        :return: memory collection
+        """
+        if collection_name not in self.__collections:
+            self.__collections[collection_name] = MemoryCollection(collection_name)
+        return self.__collections[collection_name]
+
+    async def drop(self):
+        """
+        Remove documents and indexes of all collections of the database
+        """
+        for collection in self.__collections.values():
+            await collection.drop()
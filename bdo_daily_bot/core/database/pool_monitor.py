@@ -0,0 +1,109 @@
+"""
+Contain listener that collects metrics of the MongoDB client connection pool
+"""
+import logging
+import threading
+import time
+from dataclasses import dataclass
+
+from pymongo import monitoring
+
+from bdo_daily_bot.settings import settings
+
+
+@dataclass
+class PoolMetrics:
+    """Class for keeping database connection pool metrics"""
+    connections: int = 0
+    in_use: int = 0
+    max_in_use: int = 0
+    checkouts: int = 0
+    failed_checkouts: int = 0
+    last_wait_time: float = 0
+    max_wait_time: float = 0
+    total_wait_time: float = 0
+    pool_clears: int = 0
+
+    @property
+    def average_wait_time(self) -> float:
+        """
+        Gets average time in seconds that queries wait for the free connection
+
+        :return: average connection checkout wait time
+        """
+        return self.total_wait_time / self.checkouts if self.checkouts else 0
+
+
+class PoolMonitor(monitoring.ConnectionPoolListener):
+    """
+    Collect connection pool metrics of the MongoDB client
+
+    Pymongo calls the listener in the threads that run database operations, connection checkout
+    is started and finished in the same thread, so the checkout start time is kept per thread.
+    """
+    metrics = PoolMetrics()
+
+    __lock = threading.Lock()
+    __checkout_start = threading.local()
+
+    @classmethod
+    def report(cls):
+        """
+        Log current connection pool metrics
+        """
+        logging.info("Database pool: {} connections, {} in use, max in use {}. {} checkouts, {} failed, "
+                     "average wait {:.3f}s, max wait {:.3f}s".
+                     format(cls.metrics.connections, cls.metrics.in_use, cls.metrics.max_in_use,
+                            cls.metrics.checkouts, cls.metrics.failed_checkouts,
+                            cls.metrics.average_wait_time, cls.metrics.max_wait_time))
+
+    def pool_created(self, event: monitoring.PoolCreatedEvent):
+        logging.debug("Database pool: Pool for {} created".format(event.address))
+
+    def pool_ready(self, event: monitoring.PoolReadyEvent):
+        logging.debug("Database pool: Pool for {} ready".format(event.address))
+
+    def pool_cleared(self, event: monitoring.PoolClearedEvent):
+        with self.__lock:
+            self.metrics.pool_clears += 1
+        logging.warning("Database pool: Pool for {} cleared".format(event.address))
+
+    def pool_closed(self, event: monitoring.PoolClosedEvent):
+        logging.debug("Database pool: Pool for {} closed".format(event.address))
+
+    def connection_created(self, event: monitoring.ConnectionCreatedEvent):
+        with self.__lock:
+            self.metrics.connections += 1
+
+    def connection_ready(self, event: monitoring.ConnectionReadyEvent):
+        pass
+
+    def connection_closed(self, event: monitoring.ConnectionClosedEvent):
+        with self.__lock:
+            self.metrics.connections -= 1
+
+    def connection_check_out_started(self, event: monitoring.ConnectionCheckOutStartedEvent):
+        self.__checkout_start.time = time.perf_counter()
+
+    def connection_check_out_failed(self, event: monitoring.ConnectionCheckOutFailedEvent):
+        with self.__lock:
+            self.metrics.failed_checkouts += 1
+        logging.warning("Database pool: Connection checkout from {} failed. Reason: {}".
+                        format(event.address, event.reason))
+
+    def connection_checked_out(self, event: monitoring.ConnectionCheckedOutEvent):
+        wait_time = time.perf_counter() - getattr(self.__checkout_start, 'time', time.perf_counter())
+        with self.__lock:
+            self.metrics.checkouts += 1
+            self.metrics.in_use += 1
+            self.metrics.max_in_use = max(self.metrics.max_in_use, self.metrics.in_use)
+            self.metrics.last_wait_time = wait_time
+            self.metrics.max_wait_time = max(self.metrics.max_wait_time, wait_time)
+            self.metrics.total_wait_time += wait_time
+        if wait_time > settings.DATABASE_SLOW_CHECKOUT:
+            logging.warning("Database pool: Slow connection checkout {:.3f}s, {} connections in use".
+                            format(wait_time, self.metrics.in_use))
+
+    def connection_checked_in(self, event: monitoring.ConnectionCheckedInEvent):
+        with self.__lock:
+            self.metrics.in_use -= 1
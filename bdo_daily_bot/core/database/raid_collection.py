@@ -4,7 +4,7 @@ Contain raid collection for storing and processing raid items
 import dataclasses
 import logging
 from datetime import datetime
-from typing import List, Optional
+from typing import Any, Dict, List, Optional, Union
 
 from motor.motor_asyncio import AsyncIOMotorCollection
 
@@ -15,7 +15,11 @@ from bdo_daily_bot.settings import settings
 
 
 class RaidCollection(metaclass=MetaSingleton):
-    """Responsible for working with the raid MongoDB collection."""
+    """
+    Responsible for working with the raid MongoDB collection.
+
+    Raid documents are identified by the captain name and time leaving, which are unique.
+    """
     _collection = None  # Contain database raid collection
 
     @property
@@ -34,6 +38,17 @@ class RaidCollection(metaclass=MetaSingleton):
             logging.debug('Bot initialization: Collection {} connected'.format(settings.RAID_COLLECTION))
         return self._collection
 
+    @staticmethod
+    def get_raid_key(captain_name: str, time_leaving: datetime) -> Dict[str, Any]:
+        """
+        Gets filter of the raid document by the raid key
+
+        :param captain_name: captain name of the raid document
+        :param time_leaving: time leaving of the raid document
+        :return: filter of the single raid document
+        """
+        return {'captain_name': captain_name, 'time_leaving': time_leaving}
+
     async def create_raid(self, raid_item: RaidItem):
         """
         Transform raid item to dict and save it in database
@@ -44,11 +59,11 @@ class RaidCollection(metaclass=MetaSingleton):
 
     async def delete(self, raid_item: RaidItem):
         """
-        Delete raid document from database by raid item
+        Delete raid document from database by raid item key
 
         :param raid_item: raid item to delete from database
         """
-        await self.collection.delete_one(dataclasses.asdict(raid_item))
+        await self.collection.delete_one(self.get_raid_key(raid_item.captain_name, raid_item.time_leaving))
 
     async def get_all_raids(self) -> List[Optional[RaidItem]]:
         """
@@ -66,41 +81,61 @@ class RaidCollection(metaclass=MetaSingleton):
         :param time_leaving: time leaving of raid document to find
         :return: founded single document
         """
-        return await self.collection.find_one({'captain_name': captain_name, 'time_leaving': time_leaving})
+        return await self.collection.find_one(self.get_raid_key(captain_name, time_leaving))
 
     async def update(self, raid_item: RaidItem):
         """
         Update raid item document by given raid item
 
-        Try to find raid item document by given raid item. If found, then update him.
-        If can't found then create a new raid item document.
+        Update raid document with the raid item key or create a new raid item document by the single request.
 
         :param raid_item: raid item to update
         """
-        old_post = await self.get_by_captain_name_and_time_leaving(raid_item.captain_name, raid_item.time_leaving)
-        if old_post:
-            await self.collection.find_one_and_update(old_post, {"$set": dataclasses.asdict(raid_item)})
-        else:
-            await self.create_raid(raid_item)
+        await self.collection.update_one(self.get_raid_key(raid_item.captain_name, raid_item.time_leaving),
+                                         {"$set": dataclasses.asdict(raid_item)}, upsert=True)
 
-    async def get_expired_raids_items(self) -> List[Optional[RaidItem]]:
+    async def add_member(self, captain_name: str, time_leaving: datetime,
+                         member_attributes: Dict[str, Union[str, int]]):
         """
-        Return all expired raid items from database
+        Add member to the raid document members if member with the same nickname is not there
 
-        Gets all raid documents from database, transform to raid item and
-        check expiration. If expired - add to list, then return the list of raid items
+        :param captain_name: captain name of the raid document
+        :param time_leaving: time leaving of the raid document
+        :param member_attributes: attributes of the member to add
+        """
+        raid_filter = self.get_raid_key(captain_name, time_leaving)
+        raid_filter["members.nickname"] = {"$ne": member_attributes.get("nickname")}
+        await self.collection.update_one(raid_filter, {"$push": {"members": member_attributes}})
 
-        :return: list of expired raid items
+    async def remove_member(self, captain_name: str, time_leaving: datetime, nickname: str):
         """
-        all_raids = await self.get_all_raids()
-        return [raid_item for raid_item in all_raids if raid_item.is_expired()]
+        Remove member with the given nickname from the raid document members
 
-    async def delete_expired_raids(self):
+        :param captain_name: captain name of the raid document
+        :param time_leaving: time leaving of the raid document
+        :param nickname: nickname of the member to remove
         """
-        Delete all expired raid documents in database
+        await self.collection.update_one(self.get_raid_key(captain_name, time_leaving),
+                                         {"$pull": {"members": {"nickname": nickname}}})
+
+    async def get_expired_raids_documents(self, expiration_time: datetime) -> List[Dict[str, Any]]:
+        """
+        Gets key and channels information of the raid documents that left before the given time
+
+        :param expiration_time: time before which raids are expired
+        :return: list of the expired raids documents with the raid key and channels information
+        """
+        find_cursor = self.collection.find({"time_leaving": {"$lt": expiration_time}},
+                                           {"_id": 0, "captain_name": 1, "time_leaving": 1, "channels_info": 1})
+        return [document async for document in find_cursor]
+
+    async def delete_expired_raids(self, expiration_time: datetime):
+        """
+        Delete all raid documents that left before the given time
+
+        :param expiration_time: time before which raids are expired
         """
-        expired_raid_items = await self.get_expired_raids_items()
-        for raid_item in expired_raid_items:
-            await self.delete(raid_item)
-            logging.info("Bot initialization: Raid {}/{} Raid was expired and deleted from the database.".
-                         format(raid_item.captain_name, raid_item.time_leaving))
+        result = await self.collection.delete_many({"time_leaving": {"$lt": expiration_time}})
+        if result.deleted_count:
+            logging.info("Bot initialization: {} expired raids were deleted from the database.".
+                         format(result.deleted_count))
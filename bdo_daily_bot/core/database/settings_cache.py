@@ -0,0 +1,98 @@
+"""Contain cache of the guilds settings documents"""
+import time
+from typing import Any, Dict, Optional, Tuple
+
+from bdo_daily_bot.settings import settings
+
+
+class SettingsCache:
+    """
+    Per guild cache of the settings documents
+
+    Cache entry lives settings.SETTINGS_CACHE_TTL seconds. Absence of the settings document is cached
+    too, so guilds without settings don't request database on every event. Entries are invalidated
+    by every settings collection setter and by the settings change listener.
+    """
+    # Structure: {"guild_id": (settings_document or None, expiration_time)}
+    __entries: Dict[int, Tuple[Optional[Dict[str, Any]], float]] = {}
+    # Structure: {"guild_id": amount of guild settings invalidations}
+    __versions: Dict[int, int] = {}
+    # Amount of whole cache invalidations
+    __epoch = 0
+
+    hits = 0
+    misses = 0
+
+    @classmethod
+    def get(cls, guild_id: int) -> Tuple[bool, Optional[Dict[str, Any]]]:
+        """
+        Gets cached settings document of the given guild
+
+        :param guild_id: discord guild id
+        :return: tuple of the cache hit check and cached settings document
+        """
+        entry = cls.__entries.get(guild_id)
+        if entry and entry[1] > time.monotonic():
+            cls.hits += 1
+            return True, entry[0]
+        if entry:
+            cls.__entries.pop(guild_id, None)
+        cls.misses += 1
+        return False, None
+
+    @classmethod
+    def put(cls, guild_id: int, settings_document: Optional[Dict[str, Any]],
+            version: Optional[Tuple[int, int]] = None):
+        """
+        Cache settings document of the given guild
+
+        Document is not cached if the guild settings were invalidated since the given version was taken,
+        so the document loaded before the change doesn't stay in the cache.
+
+        :param guild_id: discord guild id
+        :param settings_document: settings document or None if guild doesn't have settings
+        :param version: guild settings version taken before loading the document
+        """
+        if version is not None and cls.get_version(guild_id) != version:
+            return
+        cls.__entries[guild_id] = settings_document, time.monotonic() + settings.SETTINGS_CACHE_TTL
+
+    @classmethod
+    def invalidate(cls, guild_id: int):
+        """
+        Remove cached settings document of the given guild
+
+        :param guild_id: discord guild id
+        """
+        cls.__entries.pop(guild_id, None)
+        cls.__versions[guild_id] = cls.__versions.get(guild_id, 0) + 1
+
+    @classmethod
+    def clear(cls):
+        """
+        Remove all cached settings documents
+        """
+        cls.__entries.clear()
+        cls.__epoch += 1
+
+    @classmethod
+    def get_version(cls, guild_id: Optional[int]) -> Tuple[int, int]:
+        """
+        Gets version of the given guild settings
+
+        Version is changed on every invalidation of the guild settings, so values built from the guild
+        settings can check that they are still actual without database requests.
+
+        :param guild_id: discord guild id
+        :return: whole cache and guild settings invalidations amounts
+        """
+        return cls.__epoch, cls.__versions.get(guild_id, 0)
+
+    @classmethod
+    def get_versions(cls) -> Tuple[int, Dict[int, int]]:
+        """
+        Gets versions of all guilds settings, for example before loading settings of several guilds
+
+        :return: whole cache invalidations amount and guild settings invalidations amounts by guild id
+        """
+        return cls.__epoch, dict(cls.__versions)
@@ -0,0 +1,82 @@
+"""Contain listener of the settings collection changes made by other bot processes"""
+import asyncio
+import logging
+from typing import Any, AsyncIterable, AsyncIterator, Dict, Optional
+
+from pymongo.errors import PyMongoError
+
+from bdo_daily_bot.core.database.settings_cache import SettingsCache
+from bdo_daily_bot.core.database.settings_collection import SettingsCollection
+
+
+class SettingsChangeListener:
+    """
+    Invalidate cached guilds settings on the settings collection changes
+
+    Changes are read from the MongoDB change stream, which is available only on replica sets.
+    Any other async iterable of change events can be listened instead, for example in tests.
+    """
+    __task: Optional[asyncio.Task] = None
+
+    @classmethod
+    def start(cls, changes: Optional[AsyncIterable[Dict[str, Any]]] = None):
+        """
+        Start listening settings changes in background
+
+        :param changes: change events to listen. Settings collection change stream if not specified
+        """
+        if cls.__task and not cls.__task.done():
+            return
+        cls.__task = asyncio.create_task(cls.listen(changes or cls.__watch()))
+        logging.debug("Bot initialization: Settings change listener started")
+
+    @classmethod
+    def stop(cls):
+        """
+        Stop listening settings changes
+        """
+        if cls.__task:
+            cls.__task.cancel()
+            cls.__task = None
+
+    @classmethod
+    async def listen(cls, changes: AsyncIterable[Dict[str, Any]]):
+        """
+        Invalidate cached settings for every change event
+
+        :param changes: change events to listen
+        """
+        try:
+            async for change in changes:
+                cls.apply(change)
+        except PyMongoError as error:
+            SettingsCache.clear()
+            logging.warning("Settings change listener stopped. Settings are refreshed by cache TTL only.\n"
+                            "Error: {}".format(error))
+
+    @classmethod
+    def apply(cls, change: Dict[str, Any]):
+        """
+        Invalidate cached settings of the changed guild
+
+        If the change event has no guild id, for example on the document deletion, then all cached
+        settings are invalidated.
+
+        :param change: change event of the settings collection
+        """
+        guild_id = (change.get("fullDocument") or {}).get("guild_id")
+        if guild_id is None:
+            SettingsCache.clear()
+        else:
+            SettingsCache.invalidate(guild_id)
+
+    @classmethod
+    async def __watch(cls) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Read change events from the settings collection change stream
+
+        :return: settings collection change events
+        """
+        async with SettingsCollection().collection.watch(full_document="updateLookup") as change_stream:
+            async for change in change_stream:
+                yield change
@@ -1,17 +1,23 @@
 """Contains the class for working with the settings database collection."""
 import logging
+from copy import deepcopy
 from datetime import time
 from typing import Any, Dict, List, Optional
 
 from motor.motor_asyncio import AsyncIOMotorCollection
 
 from bdo_daily_bot.core.database.database import Database
+from bdo_daily_bot.core.database.settings_cache import SettingsCache
 from bdo_daily_bot.core.tools.common import MetaSingleton
 from bdo_daily_bot.settings import settings
 
 
 class SettingsCollection(metaclass=MetaSingleton):
-    """Responsible for working with the settings MongoDB collection"""
+    """
+    Responsible for working with the settings MongoDB collection
+
+    Settings documents are read through the settings cache. Every setter invalidates cached guild settings.
+    """
     _collection = None  # Contain database settings collection
 
     @property
@@ -33,10 +39,29 @@ class SettingsCollection(metaclass=MetaSingleton):
         """
         Returns settings document by the discord guild id
 
+        Returned document is a copy of the cached one, so it can be changed by the caller.
+
         :param guild_id: Discord guild id
         :return: Settings document or None
         """
-        return await self.collection.find_one({'guild_id': guild_id})
+        return deepcopy(await self.__find_cached_settings_post(guild_id))
+
+    async def __find_cached_settings_post(self, guild_id: int) -> Dict[str, Any] or None:
+        """
+        Returns cached settings document by the discord guild id or load it from the database
+
+        Returned document is shared with the cache and must not be changed. Loaded document is not cached if
+        the guild settings were invalidated during loading.
+
+        :param guild_id: Discord guild id
+        :return: Settings document or None
+        """
+        is_cached, settings_document = SettingsCache.get(guild_id)
+        if not is_cached:
+            version = SettingsCache.get_version(guild_id)
+            settings_document = await self.collection.find_one({'guild_id': guild_id})
+            SettingsCache.put(guild_id, settings_document, version)
+        return settings_document
 
     async def new_settings(self, guild_id: int, guild: str) -> Dict[str, Any]:
         """
@@ -51,6 +76,7 @@ class SettingsCollection(metaclass=MetaSingleton):
             'guild': guild
         }
         await self.collection.insert_one(new_settings_document)
+        SettingsCache.invalidate(guild_id)
         return new_settings_document
 
     async def find_or_new(self, guild_id: int, guild: str) -> Dict[str, Any]:
@@ -82,6 +108,7 @@ class SettingsCollection(metaclass=MetaSingleton):
             {'guild_id': guild_id},
             {'$set': {'can_remove_in_channels': allowed_channels}}
         )
+        SettingsCache.invalidate(guild_id)
 
     async def can_delete_there(self, guild_id: int, channel_id: int) -> bool:
         """
@@ -114,11 +141,12 @@ class SettingsCollection(metaclass=MetaSingleton):
         :param guild_name: discord guild name of the settings document
         :param category_channel_id: discord raids category channel id to set
         """
-        settings_document = await self.find_or_new(guild_id, guild_name)
+        await self.find_or_new(guild_id, guild_name)
         post_to_update = {"$set": {
             "category_channel_id": category_channel_id
         }}
-        await self.collection.find_one_and_update(settings_document, post_to_update)
+        await self.collection.find_one_and_update({"guild_id": guild_id}, post_to_update)
+        SettingsCache.invalidate(guild_id)
 
     async def get_information_channel_id_by_guild_id(self, guild_id: int) -> Optional[int]:
         """
@@ -138,11 +166,12 @@ class SettingsCollection(metaclass=MetaSingleton):
         :param guild_name: discord guild name of the settings document
         :param information_channel_id: discord raids information channel id to set
         """
-        settings_document = await self.find_or_new(guild_id, guild_name)
+        await self.find_or_new(guild_id, guild_name)
         post_to_update = {"$set": {
             "information_channel_id": information_channel_id
         }}
-        await self.collection.find_one_and_update(settings_document, post_to_update)
+        await self.collection.find_one_and_update({"guild_id": guild_id}, post_to_update)
+        SettingsCache.invalidate(guild_id)
 
     async def not_delete_there(self, guild_id: int, channel_id: int):
         """
@@ -168,6 +197,7 @@ class SettingsCollection(metaclass=MetaSingleton):
             "can_remove_in_channels": allowed_channels
         }}
         await self.collection.find_one_and_update({"guild_id": guild_id}, post_to_update)
+        SettingsCache.invalidate(guild_id)
 
     async def set_reaction_by_role(self, guild_id: int, guild: str, message_id: int, reaction: str, role_id: int):
         """
@@ -196,6 +226,7 @@ class SettingsCollection(metaclass=MetaSingleton):
             {'guild_id': guild_id},
             {'$set': {'role_from_reaction': role_from_reaction}}
         )
+        SettingsCache.invalidate(guild_id)
 
     async def remove_reaction_from_role(self, guild_id: int, message_id: int, reaction: str):
         """
@@ -233,6 +264,7 @@ class SettingsCollection(metaclass=MetaSingleton):
             {'guild_id': guild_id},
             update_post
         )
+        SettingsCache.invalidate(guild_id)
         return True
 
     async def get_reactions_for_action_with_roles(self, guild_id: int) -> Optional[List[str]]:
@@ -242,15 +274,23 @@ class SettingsCollection(metaclass=MetaSingleton):
         :param guild_id: discord guild id
         :return: list of reactions
         """
-        roles_from_reaction = await self.collection.find_one(
-            {"guild_id": guild_id},
-            {"role_from_reaction": 1}
-        )
+        settings_document = await self.__find_cached_settings_post(guild_id) or {}
         reactions = []
-        for messages_reactions_roles in roles_from_reaction.get("role_from_reaction", {}).values():
+        for messages_reactions_roles in settings_document.get("role_from_reaction", {}).values():
             reactions.extend(list(messages_reactions_roles))
         return reactions
 
+    async def get_reaction_roles(self, guild_id: int, message_id: int) -> Optional[Dict[str, int]]:
+        """
+        Return reactions and their roles of the given message for getting or removing roles
+
+        :param guild_id: discord guild id
+        :param message_id: discord message id with reactions for roles
+        :return: map of reactions and discord role ids or None if message is not for roles
+        """
+        settings_document = await self.__find_cached_settings_post(guild_id) or {}
+        return settings_document.get("role_from_reaction", {}).get(str(message_id))
+
     async def set_raids_enabled(self, guild_name: str, guild_id: int):
         """
         Set availability to initialize the raids in given guild
@@ -258,10 +298,10 @@ class SettingsCollection(metaclass=MetaSingleton):
         :param guild_name: discord guild name
         :param guild_id: discord guild id
         """
-        settings_document = await self.find_or_new(guild_id, guild_name)
-        settings_document["is_raids_enabled"] = True
-        updated_document = {"$set": settings_document}
+        await self.find_or_new(guild_id, guild_name)
+        updated_document = {"$set": {"is_raids_enabled": True}}
         await self.collection.find_one_and_update({"guild_id": guild_id}, updated_document)
+        SettingsCache.invalidate(guild_id)
 
     async def set_raids_disabled(self, guild_name: str, guild_id: int):
         """
@@ -270,19 +310,27 @@ class SettingsCollection(metaclass=MetaSingleton):
         :param guild_name: discord guild name
         :param guild_id: discord guild id
         """
-        settings_document = await self.find_or_new(guild_id, guild_name)
-        settings_document["is_raids_enabled"] = False
-        updated_document = {"$set": settings_document}
+        await self.find_or_new(guild_id, guild_name)
+        updated_document = {"$set": {"is_raids_enabled": False}}
         await self.collection.find_one_and_update({"guild_id": guild_id}, updated_document)
+        SettingsCache.invalidate(guild_id)
 
     async def get_guilds_ids_with_enabled_raids(self) -> List[Optional[int]]:
         """
         Gets guild ids where availability to initialize the raids is enabled
 
+        Found settings documents are cached, so settings of these guilds are preloaded at startup. Settings
+        invalidated during the search are not cached.
+
         :return: list of discord guild ids
         """
-        settings_documents = self.collection.find({"is_raids_enabled": True})
-        return [settings_document.get("guild_id") async for settings_document in settings_documents]
+        guilds_ids = []
+        epoch, versions = SettingsCache.get_versions()
+        async for settings_document in self.collection.find({"is_raids_enabled": True}):
+            guild_id = settings_document.get("guild_id")
+            SettingsCache.put(guild_id, settings_document, (epoch, versions.get(guild_id, 0)))
+            guilds_ids.append(guild_id)
+        return guilds_ids
 
     async def get_information_channel_attributes(self, guild_id: int) -> Optional[Dict[str, str]]:
         """
@@ -311,6 +359,7 @@ class SettingsCollection(metaclass=MetaSingleton):
         }}
         await self.find_or_new(guild_id, guild_name)
         await self.collection.find_one_and_update({"guild_id": guild_id}, {"$set": attributes})
+        SettingsCache.invalidate(guild_id)
 
     async def set_notification_role(self, guild_name: str, guild_id: int, *,
                                     role_name: str, role_id: int,
@@ -325,16 +374,15 @@ class SettingsCollection(metaclass=MetaSingleton):
         :param start_time: beginning of the time when this role can be used for notification
         :param end_time: ending of the time when this role can be used for notification
         """
-        settings_document = await self.find_or_new(guild_id, guild_name)
-        notification_roles = settings_document.get("notification_roles", [])
-        notification_roles.append({
+        await self.find_or_new(guild_id, guild_name)
+        query_to_update = {"$push": {"notification_roles": {
             "role_id": role_id,
             "role_name": role_name,
             "start_time": (start_time.hour, start_time.minute),
             "end_time": (end_time.hour, end_time.minute),
-        })
-        query_to_update = {"$set": {"notification_roles": notification_roles}}
+        }}}
         await self.collection.find_one_and_update({"guild_id": guild_id}, query_to_update)
+        SettingsCache.invalidate(guild_id)
 
     async def remove_notification_role(self, guild_id: int, guild_name: str, role_id: int):
         """
@@ -344,11 +392,10 @@ class SettingsCollection(metaclass=MetaSingleton):
         :param guild_name: discord guild name of the settings document
         :type role_id: discord role id to remove from mention
         """
-        settings_document = await self.find_or_new(guild_id, guild_name)
-        notification_roles = settings_document.get("notification_roles", [])
-        updated_roles = filter(lambda role: role.get("role_id") != role_id, notification_roles)
-        settings_document["notification_roles"] = updated_roles
-        await self.collection.find_one_and_update({"guild_id": guild_id}, {"$set": settings_document})
+        await self.find_or_new(guild_id, guild_name)
+        query_to_update = {"$pull": {"notification_roles": {"role_id": role_id}}}
+        await self.collection.find_one_and_update({"guild_id": guild_id}, query_to_update)
+        SettingsCache.invalidate(guild_id)
 
     async def get_notification_roles(self, guild_id: int) -> Optional[List[dict]]:
         """
@@ -358,11 +405,11 @@ class SettingsCollection(metaclass=MetaSingleton):
         :return: list of notification role ids
         """
         notification_roles = []
-        settings_document = await self.collection.find_one({"guild_id": guild_id}, {"notification_roles": 1})
+        settings_document = await self.__find_cached_settings_post(guild_id) or {}
         for notification_role in settings_document.get("notification_roles", []):
             start_hour, start_minutes = notification_role.get("start_time")
-            notification_role["start_time"] = time(hour=start_hour, minute=start_minutes)
             end_hour, end_minutes = notification_role.get("end_time")
-            notification_role["end_time"] = time(hour=end_hour, minute=end_minutes)
-            notification_roles.append(notification_role)
+            notification_roles.append(dict(notification_role,
+                                           start_time=time(hour=start_hour, minute=start_minutes),
+                                           end_time=time(hour=end_hour, minute=end_minutes)))
         return notification_roles
@@ -0,0 +1,100 @@
+"""Contain cache of the users documents"""
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+from bdo_daily_bot.settings import settings
+
+
+class UserCache:
+    """
+    Bounded LRU cache of the users documents keyed by discord id and by game nickname
+
+    Cache keeps settings.USER_CACHE_SIZE least recently used documents, every entry lives
+    settings.USER_CACHE_TTL seconds. Absence of the user document is cached by discord id too,
+    so not registered users don't request database on every reaction. User collection setters
+    write changed documents through the cache.
+    """
+    # Structure: {"discord_id": (user_document or None, expiration_time)}
+    __entries: "OrderedDict[int, Tuple[Optional[Dict[str, Any]], float]]" = OrderedDict()
+    # Structure: {"nickname": "discord_id"}
+    __ids_by_nickname: Dict[str, int] = {}
+
+    hits = 0
+    misses = 0
+
+    @classmethod
+    def get_by_id(cls, discord_id: int) -> Tuple[bool, Optional[Dict[str, Any]]]:
+        """
+        Gets cached user document by discord id
+
+        :param discord_id: user discord id
+        :return: tuple of the cache hit check and copy of the cached user document
+        """
+        entry = cls.__entries.get(discord_id)
+        if entry and entry[1] > time.monotonic():
+            cls.__entries.move_to_end(discord_id)
+            cls.hits += 1
+            return True, dict(entry[0]) if entry[0] else None
+        if entry:
+            cls.invalidate(discord_id)
+        cls.misses += 1
+        return False, None
+
+    @classmethod
+    def get_by_nickname(cls, nickname: str) -> Tuple[bool, Optional[Dict[str, Any]]]:
+        """
+        Gets cached user document by game nickname
+
+        :param nickname: user game nickname
+        :return: tuple of the cache hit check and copy of the cached user document
+        """
+        discord_id = cls.__ids_by_nickname.get(nickname)
+        if discord_id is None:
+            cls.misses += 1
+            return False, None
+        return cls.get_by_id(discord_id)
+
+    @classmethod
+    def put(cls, discord_id: int, user_document: Optional[Dict[str, Any]]):
+        """
+        Cache user document and evict least recently used documents over the cache size
+
+        :param discord_id: user discord id
+        :param user_document: user document or None if user isn't registered
+        """
+        cls.invalidate(discord_id)
+        user_document = dict(user_document) if user_document else None
+        cls.__entries[discord_id] = user_document, time.monotonic() + settings.USER_CACHE_TTL
+        if user_document and user_document.get('nickname'):
+            cls.__ids_by_nickname[user_document['nickname']] = discord_id
+        while len(cls.__entries) > settings.USER_CACHE_SIZE:
+            cls.invalidate(next(iter(cls.__entries)))
+
+    @classmethod
+    def invalidate(cls, discord_id: int):
+        """
+        Remove cached user document
+
+        :param discord_id: user discord id
+        """
+        user_document, _ = cls.__entries.pop(discord_id, (None, 0))
+        if user_document and cls.__ids_by_nickname.get(user_document.get('nickname')) == discord_id:
+            del cls.__ids_by_nickname[user_document['nickname']]
+
+    @classmethod
+    def clear(cls):
+        """
+        Remove all cached users documents
+        """
+        cls.__entries.clear()
+        cls.__ids_by_nickname.clear()
+
+    @classmethod
+    def size(cls) -> int:
+        """
+        Gets amount of cached users documents
+
+        :return: amount of cached users documents
+        """
+        return len(cls.__entries)
@@ -1,10 +1,13 @@
 """Contains the class for working with the user database collection."""
 import logging
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
 from motor.motor_asyncio import AsyncIOMotorCollection
+from pymongo import ReturnDocument
 
+from bdo_daily_bot.core.database.counter_buffer import CounterBuffer
 from bdo_daily_bot.core.database.database import Database
+from bdo_daily_bot.core.database.user_cache import UserCache
 from bdo_daily_bot.core.tools.common import MetaSingleton
 from bdo_daily_bot.settings import settings
 
@@ -36,8 +39,13 @@ class UserNotExists(Exception):
 
 
 class UserCollection(metaclass=MetaSingleton):
-    """Responsible for working with the user MongoDB collection."""
+    """
+    Responsible for working with the user MongoDB collection.
+
+    Users documents are read through the user cache, setters write changed documents through it.
+    """
     _collection = None  # Contain database user collection
+    _entries_buffer = None  # Contain buffer of the users raids entries changes
 
     @property
     def collection(self) -> AsyncIOMotorCollection:
@@ -55,6 +63,21 @@ class UserCollection(metaclass=MetaSingleton):
             logging.debug("Bot initialization: Collection {} connected".format(settings.USER_COLLECTION))
         return self._collection
 
+    @staticmethod
+    def __write_through(discord_id: int, user_document: Optional[Dict[str, Any]]):
+        """
+        Cache the changed user document or remove it from the cache if the document wasn't changed
+
+        :param discord_id: User discord id.
+        :type discord_id: int
+        :param user_document: Changed user document or None if nothing was changed.
+        :type user_document: dict or None
+        """
+        if user_document:
+            UserCache.put(discord_id, user_document)
+        else:
+            UserCache.invalidate(discord_id)
+
     async def is_user_exist(self, discord_id: int) -> bool:
         """
         Checks the existence of a user in the database by its discord id.
@@ -64,8 +87,7 @@ class UserCollection(metaclass=MetaSingleton):
         :return: The existence or lack of a user in the database.
         :rtype: bool
         """
-        user_post = await self.collection.find_one({'discord_id': discord_id})
-        return bool(user_post)
+        return bool(await self.get_user_by_id(discord_id))
 
     async def get_user_by_id(self, discord_id: int) -> dict or None:
         """
@@ -76,7 +98,11 @@ class UserCollection(metaclass=MetaSingleton):
         :return: Search results.
         :rtype: dict
         """
-        return await self.collection.find_one({'discord_id': discord_id})
+        is_cached, user_document = UserCache.get_by_id(discord_id)
+        if not is_cached:
+            user_document = await self.collection.find_one({'discord_id': discord_id})
+            UserCache.put(discord_id, user_document)
+        return user_document
 
     async def get_user_nickname(self, discord_id: int) -> str or None:
         """
@@ -99,7 +125,12 @@ class UserCollection(metaclass=MetaSingleton):
         :return: Search results.
         :rtype: dict
         """
-        return await self.collection.find_one({'nickname': nickname})
+        is_cached, user_document = UserCache.get_by_nickname(nickname)
+        if not is_cached:
+            user_document = await self.collection.find_one({'nickname': nickname})
+            if user_document:
+                UserCache.put(user_document.get('discord_id'), user_document)
+        return user_document
 
     async def register_user(self, discord_id: int, discord_user: str, nickname: str):
         """
@@ -122,11 +153,14 @@ class UserCollection(metaclass=MetaSingleton):
             'entries': 0,
         }
         self.collection.insert_one(new_user_post)
+        UserCache.put(discord_id, new_user_post)
 
     async def re_register_user(self, discord_id: int, discord_user: str, nickname: str):
         """
         Reregister user data by its discord id in the user database collection.
 
+        Raids entries are not changed, so the buffered entries changes are not lost or counted twice.
+
         :param discord_id: User discord id.
         :type discord_id: int
         :param discord_user: User discord name.
@@ -137,41 +171,63 @@ class UserCollection(metaclass=MetaSingleton):
         old_user_document = await self.get_user_by_id(discord_id)
 
         if old_user_document:
-            user_entries = old_user_document.get("entries", 0)
-
-            new_user_document = {'$set': {
-                'discord_id': discord_id,
-                'discord_user': discord_user,
-                'nickname': nickname,
-                'entries': user_entries,
-            }}
-            await self.collection.update_one(old_user_document, new_user_document)
-        else:
-            await self.register_user(discord_id, discord_user, nickname)
+            new_user_fields = {'discord_user': discord_user, 'nickname': nickname}
+            update_result = await self.collection.update_one({'discord_id': discord_id}, {'$set': new_user_fields})
+            if update_result.matched_count:
+                UserCache.put(discord_id, {**old_user_document, **new_user_fields})
+                return
+            UserCache.invalidate(discord_id)
+        await self.register_user(discord_id, discord_user, nickname)
+
+    @property
+    def entries_buffer(self) -> CounterBuffer:
+        """
+        Buffer of the users raids entries changes
+
+        :return: users raids entries changes buffer
+        """
+        if not self._entries_buffer:
+            self._entries_buffer = CounterBuffer(lambda: self.collection, "User entries", non_negative=True)
+        return self._entries_buffer
 
     async def user_joined_raid(self, discord_id: int):
         """
         Write to the user database collection that the user visited the raid.
 
+        Change is written with other raids entries changes after the counters flush interval.
+
         :param discord_id: User discord id.
         :type discord_id: int
         """
-        await self.collection.find_one_and_update(
-            {'discord_id': discord_id},
-            {'$inc': {'entries': 1}}
-        )
+        self.entries_buffer.increment(discord_id, {'entries': 1})
+        self.__change_cached_entries(discord_id, 1)
 
     async def user_leave_raid(self, discord_id: int):
         """
         Write to the user database collection that the user leave the raid.
 
+        Change is written with other raids entries changes after the counters flush interval.
+
         :param discord_id: User discord id.
         :type discord_id: int
         """
-        await self.collection.find_one_and_update(
-            {'$and': [{'discord_id': discord_id}, {'entries': {'$gt': 0}}]},
-            {'$inc': {'entries': -1}}
-        )
+        self.entries_buffer.increment(discord_id, {'entries': -1})
+        self.__change_cached_entries(discord_id, -1)
+
+    @staticmethod
+    def __change_cached_entries(discord_id: int, difference: int):
+        """
+        Change raids entries of the cached user document, so the cache doesn't wait for the counters flush.
+
+        :param discord_id: User discord id.
+        :type discord_id: int
+        :param difference: Raids entries difference.
+        :type difference: int
+        """
+        _, user_document = UserCache.get_by_id(discord_id)
+        if user_document:
+            user_document['entries'] = max(user_document.get('entries', 0) + difference, 0)
+            UserCache.put(discord_id, user_document)
 
     async def set_notify_off(self, discord_id: int):
         """
@@ -180,10 +236,12 @@ class UserCollection(metaclass=MetaSingleton):
         :param discord_id: User discord id.
         :type discord_id: int
         """
-        await self.collection.find_one_and_update(
+        user_document = await self.collection.find_one_and_update(
             {'discord_id': discord_id},
-            {'$set': {'not_notify': True}}
+            {'$set': {'not_notify': True}},
+            return_document=ReturnDocument.AFTER
         )
+        self.__write_through(discord_id, user_document)
 
     async def set_notify_on(self, discord_id: int):
         """
@@ -192,10 +250,12 @@ class UserCollection(metaclass=MetaSingleton):
         :param discord_id: User discord id.
         :type discord_id: int
         """
-        await self.collection.find_one_and_update(
+        user_document = await self.collection.find_one_and_update(
             {'discord_id': discord_id},
-            {'$set': {'not_notify': False}}
+            {'$set': {'not_notify': False}},
+            return_document=ReturnDocument.AFTER
         )
+        self.__write_through(discord_id, user_document)
 
     async def not_notify_status(self, discord_id: int) -> bool:
         """
@@ -220,10 +280,33 @@ class UserCollection(metaclass=MetaSingleton):
         :param discord_id: User discord id.
         :type discord_id: int
         """
-        await self.collection.find_one_and_update(
+        user_document = await self.collection.find_one_and_update(
             {'discord_id': discord_id},
+            {'$set': {'first_notification': True}},
+            return_document=ReturnDocument.AFTER
+        )
+        self.__write_through(discord_id, user_document)
+
+    async def set_first_notifications(self, discord_ids: List[int]):
+        """
+        Set the fact of receipt the first notification by the several users with the one database request.
+
+        :param discord_ids: Users discord ids.
+        :type discord_ids: list
+        """
+        if not discord_ids:
+            return
+        await self.collection.update_many(
+            {'discord_id': {'$in': list(discord_ids)}},
             {'$set': {'first_notification': True}}
         )
+        for discord_id in discord_ids:
+            is_cached, user_document = UserCache.get_by_id(discord_id)
+            if is_cached and user_document:
+                user_document['first_notification'] = True
+                UserCache.put(discord_id, user_document)
+            else:
+                UserCache.invalidate(discord_id)
 
     async def first_notification_status(self, discord_id: int) -> bool:
         """
@@ -245,11 +328,46 @@ class UserCollection(metaclass=MetaSingleton):
         """
         Returns a list of users documents based on their game nicknames.
 
+        Cached users documents are taken from the user cache, others are requested with one request.
+
         :param nicknames_list: users game nicknames
         :return: users documents
         """
-        users_documents_cursor = self.collection.find(
-            {'nickname': {'$in': nicknames_list}},
-            {'discord_id': 1, 'not_notify': 1, 'first_notification': 1, '_id': 0}
-        )
-        return [document async for document in users_documents_cursor]
+        users_documents, missed_nicknames = [], []
+        for nickname in nicknames_list:
+            is_cached, user_document = UserCache.get_by_nickname(nickname)
+            if is_cached and user_document:
+                users_documents.append(user_document)
+            elif not is_cached:
+                missed_nicknames.append(nickname)
+        if missed_nicknames:
+            users_documents_cursor = self.collection.find(
+                {'nickname': {'$in': missed_nicknames}},
+                {'discord_id': 1, 'nickname': 1, 'not_notify': 1, 'first_notification': 1, '_id': 0}
+            )
+            users_documents.extend([document async for document in users_documents_cursor])
+        return users_documents
+
+    async def get_users_by_ids(self, discord_ids: List[int]) -> List[Dict[str, Any]]:
+        """
+        Returns a list of users documents based on their discord ids.
+
+        Cached users documents are taken from the user cache, others are requested with one request.
+
+        :param discord_ids: users discord ids
+        :return: users documents with discord id and game nickname
+        """
+        users_documents, missed_ids = [], []
+        for discord_id in discord_ids:
+            is_cached, user_document = UserCache.get_by_id(discord_id)
+            if is_cached and user_document:
+                users_documents.append(user_document)
+            elif not is_cached:
+                missed_ids.append(discord_id)
+        if missed_ids:
+            users_documents_cursor = self.collection.find(
+                {'discord_id': {'$in': missed_ids}},
+                {'discord_id': 1, 'nickname': 1, '_id': 0}
+            )
+            users_documents.extend([document async for document in users_documents_cursor])
+        return users_documents
@@ -0,0 +1,112 @@
+"""
+Contain class for getting discord guild channels by their ids
+"""
+import logging
+from typing import Dict, Optional, Set
+
+from discord import Forbidden, Guild, HTTPException, NotFound
+from discord.abc import GuildChannel
+
+from bdo_daily_bot.bot import BdoDailyBot
+
+
+class ChannelRegistry:
+    """
+    Registry of all bot visible guild channels keyed by channel id
+
+    Registry is filled from the client cache on every ready event and kept in sync by the channel and guild
+    events. Channel is fetched from discord only if it is missed in the registry.
+    """
+    __channels: Dict[int, GuildChannel] = {}
+    __missing_channels_ids: Set[int] = set()
+    __is_loaded = False
+
+    @classmethod
+    def load(cls):
+        """
+        Fill registry with all channels from the client cache
+        """
+        cls.__channels = {channel.id: channel for channel in BdoDailyBot.bot.get_all_channels()}
+        cls.__missing_channels_ids = set()
+        cls.__is_loaded = True
+        logging.debug("Bot initialization: Channel registry loaded with {} channels".format(len(cls.__channels)))
+
+    @classmethod
+    def get(cls, channel_id: Optional[int]) -> Optional[GuildChannel]:
+        """
+        Gets channel with given channel id from the registry
+
+        :param channel_id: discord channel id
+        :return: discord channel with given id if registered else None
+        """
+        if not cls.__is_loaded:
+            cls.load()
+        return cls.__channels.get(channel_id)
+
+    @classmethod
+    async def get_or_fetch(cls, channel_id: Optional[int]) -> Optional[GuildChannel]:
+        """
+        Gets channel with given channel id from the registry or fetch it from discord
+
+        :param channel_id: discord channel id
+        :return: discord channel with given id if found else None
+        """
+        if not channel_id:
+            return None
+        if channel := cls.get(channel_id):
+            return channel
+        if channel_id in cls.__missing_channels_ids:
+            return None
+
+        try:
+            channel = await BdoDailyBot.bot.fetch_channel(channel_id)
+        except (NotFound, Forbidden):
+            logging.debug("Channel {} not found or forbidden. Marked as missing".format(channel_id))
+            cls.__missing_channels_ids.add(channel_id)
+            return None
+        except HTTPException as error:
+            logging.warning("Can't fetch channel {}. HTTPException.\nError: {}".format(channel_id, error))
+            return None
+        if isinstance(channel, GuildChannel):
+            cls.add(channel)
+            return channel
+        return None
+
+    @classmethod
+    def add(cls, channel: GuildChannel):
+        """
+        Add given channel in the registry
+
+        :param channel: discord guild channel to add
+        """
+        cls.__channels[channel.id] = channel
+        cls.__missing_channels_ids.discard(channel.id)
+
+    @classmethod
+    def remove(cls, channel_id: int):
+        """
+        Remove channel with given id from the registry
+
+        :param channel_id: discord channel id to remove
+        """
+        cls.__channels.pop(channel_id, None)
+
+    @classmethod
+    def add_guild(cls, guild: Guild):
+        """
+        Add all channels of the given guild in the registry
+
+        :param guild: discord guild with channels to add
+        """
+        for channel in guild.channels:
+            cls.add(channel)
+
+    @classmethod
+    def remove_guild(cls, guild: Guild):
+        """
+        Remove all channels of the given guild from the registry
+
+        :param guild: discord guild with channels to remove
+        """
+        for channel in guild.channels:
+            cls.remove(channel.id)
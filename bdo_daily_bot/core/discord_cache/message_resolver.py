@@ -0,0 +1,129 @@
+"""
+Contain class for resolving discord messages by their ids without scanning channel history
+"""
+import logging
+from collections import OrderedDict, defaultdict
+from typing import DefaultDict, NewType, Optional
+
+from discord import Forbidden, HTTPException, Message, NotFound, TextChannel
+
+from bdo_daily_bot.settings import settings
+
+
+class MessageResolver:
+    """
+    Resolve discord messages by their ids
+
+    Keep per channel index of the known bot messages and of the messages that are known as deleted.
+    On the cache miss message is requested directly by id, so the channel history is never scanned.
+    Every channel keeps at most settings.MESSAGE_RESOLVER_CHANNEL_SIZE known and deleted messages,
+    least recently used messages are removed first.
+    """
+
+    # Structure: {"channel_id": {"message_id": Message}}
+    KnownMessages = NewType("KnownMessages", DefaultDict[int, "OrderedDict[int, Message]"])
+    # Structure: {"channel_id": {"message_id": None}}
+    MissingMessages = NewType("MissingMessages", DefaultDict[int, "OrderedDict[int, None]"])
+
+    __known_messages: KnownMessages = defaultdict(OrderedDict)
+    __missing_messages: MissingMessages = defaultdict(OrderedDict)
+
+    @classmethod
+    async def get_message(cls, channel: TextChannel, message_id: Optional[int]) -> Optional[Message]:
+        """
+        Gets message with given id in given discord text channel
+
+        Return message from the index if it is known. Return None without any request if message is
+        known as deleted. Otherwise fetch message by id and index the result.
+
+        :param channel: discord text channel to find in it
+        :param message_id: discord message id to find
+        :return: discord message if was found else None
+        """
+        if not channel or not message_id:
+            return None
+        if message_id in cls.__missing_messages.get(channel.id, ()):
+            cls.__missing_messages[channel.id].move_to_end(message_id)
+            return None
+        if message := cls.__known_messages.get(channel.id, {}).get(message_id):
+            cls.__known_messages[channel.id].move_to_end(message_id)
+            return message
+
+        try:
+            message = await channel.fetch_message(message_id)
+        except NotFound:
+            logging.debug("{}/{}: Message {} not found. Marked as deleted".
+                          format(channel.guild, channel, message_id))
+            cls.mark_deleted(channel.id, message_id)
+            return None
+        except Forbidden:
+            logging.warning("{}/{}: Can't fetch message {}. Forbidden".format(channel.guild, channel, message_id))
+            return None
+        except HTTPException as error:
+            logging.warning("{}/{}: Can't fetch message {}. HTTPException.\nError: {}".
+                            format(channel.guild, channel, message_id, error))
+            return None
+        cls.remember(message)
+        return message
+
+    @classmethod
+    def remember(cls, message: Optional[Message]):
+        """
+        Add given discord message to the index of known messages
+
+        :param message: discord message to remember
+        """
+        if not message:
+            return
+        cls.__put(cls.__known_messages[message.channel.id], message.id, message)
+        if missing_messages := cls.__missing_messages.get(message.channel.id):
+            missing_messages.pop(message.id, None)
+
+    @classmethod
+    def mark_deleted(cls, channel_id: int, message_id: int):
+        """
+        Remove message from the index of known messages and remember that it was deleted
+
+        :param channel_id: discord channel id of the deleted message
+        :param message_id: discord deleted message id
+        """
+        if known_messages := cls.__known_messages.get(channel_id):
+            known_messages.pop(message_id, None)
+        cls.__put(cls.__missing_messages[channel_id], message_id, None)
+
+    @classmethod
+    def forget_message(cls, channel_id: int, message_id: int):
+        """
+        Mark message as deleted only if it is known in the index
+
+        Used for the deletion events from all channels, so messages not related to the bot don't grow the index.
+
+        :param channel_id: discord channel id of the deleted message
+        :param message_id: discord deleted message id
+        """
+        if message_id in cls.__known_messages.get(channel_id, {}):
+            cls.mark_deleted(channel_id, message_id)
+
+    @classmethod
+    def forget_channel(cls, channel_id: int):
+        """
+        Remove all known and deleted messages of the given channel from the index
+
+        :param channel_id: discord channel id to forget
+        """
+        cls.__known_messages.pop(channel_id, None)
+        cls.__missing_messages.pop(channel_id, None)
+
+    @staticmethod
+    def __put(channel_messages: OrderedDict, message_id: int, message: Optional[Message]):
+        """
+        Put message in the channel index and remove least recently used messages over the channel size
+
+        :param channel_messages: known or deleted messages of the channel
+        :param message_id: discord message id
+        :param message: discord message or None for the deleted message
+        """
+        channel_messages[message_id] = message
+        channel_messages.move_to_end(message_id)
+        while len(channel_messages) > settings.MESSAGE_RESOLVER_CHANNEL_SIZE:
+            channel_messages.popitem(last=False)
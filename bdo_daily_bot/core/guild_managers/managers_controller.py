@@ -4,7 +4,10 @@ Other application modules should use only this class for managing guilds and rai
 """
 import asyncio
 import logging
-from typing import Optional
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Dict, Iterable, Iterator, List, Optional
 
 from discord import Guild
 
@@ -16,6 +19,8 @@ from bdo_daily_bot.core.raid.raid_channel import RaidChannel
 from bdo_daily_bot.core.raid.raid_flow import RaidFlow
 from bdo_daily_bot.core.raid.raid_item import RaidItem
 from bdo_daily_bot.core.raid.raid_item_factory import RaidItemFactory
+from bdo_daily_bot.core.tools.fan_out import fan_out
+from bdo_daily_bot.settings import settings
 
 
 class ManagersController:
@@ -23,6 +28,8 @@ class ManagersController:
     Response for controlling, containing and resending requests to Raid Guild Managers
     """
     guilds_managers = {}
+    # Structure: {"startup stage name": duration in seconds}
+    startup_durations: Dict[str, float] = {}
     __database = DatabaseManager()
 
     @classmethod
@@ -58,17 +65,6 @@ class ManagersController:
         """
         return cls.get(guild) or await cls.create(guild)
 
-    @classmethod
-    async def load_managers(cls):
-        """
-        Load managers for guilds from the database where raids enables
-        """
-        logging.info("Bot initialization: Loading managers for guilds")
-        guild_ids = await cls.__database.settings.get_guilds_ids_with_enabled_raids()
-        for guild_id in guild_ids:
-            guild = BdoDailyBot.bot.get_guild(guild_id)
-            await cls.get_or_create(guild)
-
     @classmethod
     async def create_raid(cls, guild: Guild, raid_item: RaidItem) -> Raid:
         """
@@ -88,33 +84,63 @@ class ManagersController:
         return raid_to_create
 
     @classmethod
-    async def load_raids(cls):
+    async def load(cls):
+        """
+        Load guilds managers and all not expired raids from the database and start raids flows
+
+        Startup goes through the stages, every stage is timed and logged:
+        1. Clear database from expired raids and delete their channels.
+        2. Fetch guilds with enabled raids and all actual raids items with one request for each.
+        3. Restore raids from raids items concurrently.
+        4. Initialize managers of guilds with enabled raids and guilds of raids channels concurrently.
+        5. Add raids to managers and start raids flows.
+        """
+        cls.startup_durations.clear()
+        with cls.__startup_stage("clear expired raids"):
+            await cls.__clear_expired_raids()
+        with cls.__startup_stage("fetch guilds and raids"):
+            guilds_ids, raid_items = await asyncio.gather(
+                cls.__database.settings.get_guilds_ids_with_enabled_raids(), cls.__database.raid.get_all_raids())
+        with cls.__startup_stage("restore raids"):
+            raids = await RaidItemFactory.get_raids(raid_items) if raid_items else []
+        with cls.__startup_stage("initialize guilds managers"):
+            await cls.load_managers(cls.__get_guilds(guilds_ids, raids))
+        with cls.__startup_stage("start raids"):
+            cls.start_raids(raids)
+
+    @classmethod
+    async def load_managers(cls, guilds: Iterable[Guild]):
         """
-        Load all not expired raids from database and start raids flow
+        Initialize managers of the given guilds concurrently
+
+        Guild manager that failed to initialize is logged and skipped, raids of this guild are loaded without it.
 
-        Clear database from expired raids, gets all actual raids items and
-        transform them to raids. Gets managers and tells them to add loaded raids or
-        create them if channels from database was deleted or not existed.
-        Then starts raid flow and clear managers raids lists after raids flows was ended.
+        :param guilds: discord guilds to initialize managers
         """
-        logging.info("Bot initialisation: Starting loading raids from database")
-        await cls.__clear_expired_raids()
-        all_raid_items = await cls.__database.raid.get_all_raids()
-        if not all_raid_items:
+        logging.info("Bot initialization: Loading managers for guilds")
+        await fan_out(guilds, cls.get_or_create, limit=settings.STARTUP_CONCURRENCY,
+                      description="guild manager initialization")
+
+    @classmethod
+    def start_raids(cls, raids: List[Raid]):
+        """
+        Add loaded raids to managers of their channels guilds and start raids flows
+
+        :param raids: raids loaded from the database
+        """
+        if not raids:
             logging.info("Bot initialisation: No actual raids was loaded from database")
             return
 
-        raids = [await RaidItemFactory.get_raid(raid_item) for raid_item in all_raid_items]
         for raid in raids:
-            if raid.channels:
-                for channel in raid.channels:
-                    manager = await cls.get_or_create(channel.guild)
-                    manager.add_raid(raid)
-            else:
+            if not raid.channels:
                 logging.warning("Bot initialisation: Raid {}/{}: Channels from the database are empty. "
                                 "Can't load raid raid. Need to manually remove the defect document.".
                                 format(raid.captain.nickname, raid.time.normal_time_leaving))
                 continue
+            for channel in raid.channels:
+                if manager := cls.get(channel.guild):
+                    manager.add_raid(raid)
             asyncio.ensure_future(cls.__start_raid_flow(raid))
             logging.info("Bot initialisation: Raid {}/{}: Raid from the database was loaded and started.".
                          format(raid.captain.nickname, raid.time.kebab_time_leaving))
@@ -137,10 +163,13 @@ class ManagersController:
         """
         Delete expired raid channels and clear database
         """
-        expired_raids_items = await cls.__database.raid.get_expired_raids_items()
-        for raid_item in expired_raids_items:
-            await RaidChannel.delete_channels_by_channels_info(raid_item.channels_info)
-        await cls.__database.raid.delete_expired_raids()
+        expiration_time = datetime.now()
+        expired_raids_documents = await cls.__database.raid.get_expired_raids_documents(expiration_time)
+        for raid_document in expired_raids_documents:
+            await RaidChannel.delete_channels_by_channels_info(raid_document.get("channels_info", []))
+            logging.info("Bot initialization: Raid {}/{} Raid was expired and deleted from the database.".
+                         format(raid_document["captain_name"], raid_document["time_leaving"]))
+        await cls.__database.raid.delete_expired_raids(expiration_time)
 
     @classmethod
     async def __start_raid_flow(cls, raid_to_start: Raid):
@@ -159,3 +188,38 @@ class ManagersController:
 
         logging.info("Raid {}/{}: Raid was completely ended."
                      .format(raid_to_start.captain.nickname, raid_to_start.time.kebab_time_leaving))
+
+    @classmethod
+    def __get_guilds(cls, guilds_ids: List[int], raids: List[Raid]) -> List[Guild]:
+        """
+        Gets guilds with enabled raids and guilds of the raids channels without duplicates
+
+        :param guilds_ids: discord ids of the guilds with enabled raids
+        :param raids: raids loaded from the database
+        :return: discord guilds to initialize managers
+        """
+        guilds = {}
+        for guild_id in guilds_ids:
+            if guild := BdoDailyBot.bot.get_guild(guild_id):
+                guilds[guild.id] = guild
+            else:
+                logging.warning("Bot initialization: Guild {} with enabled raids is not available.".format(guild_id))
+        for raid in raids:
+            for channel in raid.channels:
+                guilds.setdefault(channel.guild.id, channel.guild)
+        return list(guilds.values())
+
+    @classmethod
+    @contextmanager
+    def __startup_stage(cls, stage_name: str) -> Iterator[None]:
+        """
+        Time and log the bot startup stage
+
+        :param stage_name: startup stage name for logs
+        """
+        logging.info("Bot initialization: Stage '{}' started.".format(stage_name))
+        start_time = time.perf_counter()
+        yield
+        cls.startup_durations[stage_name] = time.perf_counter() - start_time
+        logging.info("Bot initialization: Stage '{}' finished in {:.3f}s.".
+                     format(stage_name, cls.startup_durations[stage_name]))
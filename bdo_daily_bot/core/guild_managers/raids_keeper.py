@@ -2,20 +2,40 @@
 Contain class that contain all active raids
 """
 import logging
+from collections import defaultdict
 from datetime import datetime
-from typing import List, Optional
+from typing import DefaultDict, Dict, List, NewType, Optional, Set, TYPE_CHECKING
 
-from bdo_daily_bot.core.raid.raid import Raid
 from bdo_daily_bot.core.raid.raid_item import RaidItem
 from bdo_daily_bot.core.raid.raid_member import RaidMember
 from bdo_daily_bot.messages import messages
 
+if TYPE_CHECKING:
+    # Raid updates keeper indexes on members changes, so raid is imported only for type hints
+    from bdo_daily_bot.core.raid.raid import Raid
+
 
 class RaidsKeeper:
     """
     Contain and provide all active raids
+
+    Raids are indexed by captain name and time leaving, by time leaving, by members nicknames and
+    by collection messages ids. Indexes are updated on raid and member adding and removing, so
+    all lookups don't scan active raids.
     """
-    __raids = []
+    # Structure: {"captain_name": {"time_leaving": Raid}}
+    RaidsByCaptain = NewType("RaidsByCaptain", DefaultDict[str, Dict[datetime, "Raid"]])
+    # Structure: {"time_leaving": {Raid, }}
+    RaidsByTime = NewType("RaidsByTime", DefaultDict[datetime, Set["Raid"]])
+    # Structure: {"member_nickname": {Raid, }}
+    RaidsByMember = NewType("RaidsByMember", DefaultDict[str, Set["Raid"]])
+
+    __raids: Set["Raid"] = set()
+    __raids_by_captain: RaidsByCaptain = defaultdict(dict)
+    __raids_by_time: RaidsByTime = defaultdict(set)
+    __raids_by_member: RaidsByMember = defaultdict(set)
+    __raids_by_collection_message: Dict[int, "Raid"] = {}
+    __collection_messages_by_raid: Dict["Raid", Set[int]] = {}
 
     @classmethod
     def has_member_on_same_time(cls, member: RaidMember, time_leaving: datetime) -> bool:
@@ -26,10 +46,7 @@ class RaidsKeeper:
         :param time_leaving: time leaving of raids to find
         :return: boolean valued of check
         """
-        for raid in cls.__raids:
-            if raid.time.time_leaving == time_leaving and raid.has_member(member):
-                return True
-        return False
+        return any(raid.time.time_leaving == time_leaving for raid in cls.__raids_by_member.get(member.nickname, ()))
 
     @classmethod
     def has_raid_with_raid_item(cls, raid_item: RaidItem) -> bool:
@@ -39,17 +56,48 @@ class RaidsKeeper:
         :param raid_item: raid item to check wit
         :return: boolean valued of check
         """
-        return any(raid.raid_item == raid_item for raid in cls.__raids)
+        raid = cls.get_by_captain_name_and_time_leaving(raid_item.captain_name, raid_item.time_leaving)
+        return bool(raid) and raid.raid_item == raid_item
 
     @classmethod
-    def get_raids_by_captain_name(cls, captain_name: str) -> List[Optional[Raid]]:
+    def get_raids_by_captain_name(cls, captain_name: str) -> List[Optional["Raid"]]:
         """
         Checks that raids has given captain name
 
         :param captain_name: captain name to find in active raids
         :return: list of raids with given captain name
         """
-        return [raid for raid in cls.__raids if raid.captain.nickname == captain_name]
+        return list(cls.__raids_by_captain.get(captain_name, {}).values())
+
+    @classmethod
+    def get_raids_by_time_leaving(cls, time_leaving: datetime) -> List["Raid"]:
+        """
+        Gets all raids with given time leaving
+
+        :param time_leaving: time leaving to find raids
+        :return: list of raids with given time leaving
+        """
+        return list(cls.__raids_by_time.get(time_leaving, ()))
+
+    @classmethod
+    def get_raids_by_member(cls, member: RaidMember) -> List["Raid"]:
+        """
+        Gets all raids where given member is registered
+
+        :param member: member to find raids
+        :return: list of raids with given member
+        """
+        return list(cls.__raids_by_member.get(member.nickname, ()))
+
+    @classmethod
+    def get_by_collection_message_id(cls, collection_message_id: int) -> Optional["Raid"]:
+        """
+        Gets raid that has collection message with given id
+
+        :param collection_message_id: discord collection message id to find raid
+        :return: founded raid or None
+        """
+        return cls.__raids_by_collection_message.get(collection_message_id)
 
     @classmethod
     def get_captain_raids_message(cls, captain_name: str) -> Optional[str]:
@@ -71,7 +119,7 @@ class RaidsKeeper:
         return '\n'.join(message_parts)
 
     @classmethod
-    def get_by_captain_name_and_time_leaving(cls, captain_name: str, time_leaving: datetime) -> Optional[Raid]:
+    def get_by_captain_name_and_time_leaving(cls, captain_name: str, time_leaving: datetime) -> Optional["Raid"]:
         """
         Gets raid by given captain name and time leaving
 
@@ -79,36 +127,82 @@ class RaidsKeeper:
         :param time_leaving: time leaving to find raid
         :return: founded raid or None
         """
-        for raid in cls.__raids:
-            if raid.captain.nickname == captain_name and raid.time.time_leaving == time_leaving:
-                return raid
-        return None
+        return cls.__raids_by_captain.get(captain_name, {}).get(time_leaving)
 
     @classmethod
-    def add_raid(cls, new_raid: Raid):
+    def add_raid(cls, new_raid: "Raid"):
         """
-        Add new raid in keeper store
+        Add new raid in keeper store and index it
 
         :param new_raid: new raid to add
         """
-        if new_raid not in cls.__raids:
-            cls.__raids.append(new_raid)
+        if new_raid in cls.__raids:
+            return
+        cls.__raids.add(new_raid)
+        cls.__raids_by_captain[new_raid.captain.nickname][new_raid.time.time_leaving] = new_raid
+        cls.__raids_by_time[new_raid.time.time_leaving].add(new_raid)
+        for member in new_raid.members:
+            cls.__raids_by_member[member.nickname].add(new_raid)
+        for channel in new_raid.channels:
+            if channel.collection_message and channel.collection_message.message:
+                cls.add_collection_message(new_raid, channel.collection_message.message.id)
 
     @classmethod
-    def remove_raid(cls, raid_to_remove: Raid):
+    def remove_raid(cls, raid_to_remove: "Raid"):
         """
-        Remove given raid from keeper store
+        Remove given raid from keeper store and from all indexes
 
         :param raid_to_remove: raid to be removed
         """
-        if raid_to_remove in cls.__raids:
-            cls.__raids.remove(raid_to_remove)
-        else:
+        if raid_to_remove not in cls.__raids:
             logging.warning("Raid {}/{}: Trying to remove not existed raid. Ignoring."
                             .format(raid_to_remove.captain.nickname, raid_to_remove.time.normal_time_leaving))
+            return
+        cls.__raids.remove(raid_to_remove)
+
+        captain_name, time_leaving = raid_to_remove.captain.nickname, raid_to_remove.time.time_leaving
+        cls.__discard(cls.__raids_by_captain, captain_name, time_leaving)
+        cls.__discard(cls.__raids_by_time, time_leaving, raid_to_remove)
+        for member in raid_to_remove.members:
+            cls.__discard(cls.__raids_by_member, member.nickname, raid_to_remove)
+        for collection_message_id in cls.__collection_messages_by_raid.pop(raid_to_remove, ()):
+            cls.__raids_by_collection_message.pop(collection_message_id, None)
 
     @classmethod
-    def sort_raids_by_time_leaving(cls, raids: List[Raid]) -> List[Raid]:
+    def add_member(cls, raid: "Raid", member: RaidMember):
+        """
+        Index given member as registered in the given raid
+
+        :param raid: raid with the new member
+        :param member: added raid member
+        """
+        if raid in cls.__raids:
+            cls.__raids_by_member[member.nickname].add(raid)
+
+    @classmethod
+    def remove_member(cls, raid: "Raid", member: RaidMember):
+        """
+        Remove given member from the given raid index
+
+        :param raid: raid with the removed member
+        :param member: removed raid member
+        """
+        cls.__discard(cls.__raids_by_member, member.nickname, raid)
+
+    @classmethod
+    def add_collection_message(cls, raid: "Raid", collection_message_id: int):
+        """
+        Index given collection message id of the given raid
+
+        :param raid: raid of the collection message
+        :param collection_message_id: discord collection message id
+        """
+        if raid in cls.__raids:
+            cls.__raids_by_collection_message[collection_message_id] = raid
+            cls.__collection_messages_by_raid.setdefault(raid, set()).add(collection_message_id)
+
+    @classmethod
+    def sort_raids_by_time_leaving(cls, raids: List["Raid"]) -> List["Raid"]:
         """
         Sorts given raids by time leaving
 
@@ -116,3 +210,22 @@ class RaidsKeeper:
         :return: list of sorted raids by time leaving
         """
         return sorted(raids.copy(), key=lambda raid: raid.time.time_leaving)
+
+    @staticmethod
+    def __discard(index: dict, key, value):
+        """
+        Remove value from the given index bucket and drop the bucket if it became empty
+
+        :param index: raids index to update
+        :param key: index key of the bucket
+        :param value: value to remove from the bucket. For dict buckets it is the key in the bucket
+        """
+        bucket = index.get(key)
+        if bucket is None:
+            return
+        if isinstance(bucket, dict):
+            bucket.pop(value, None)
+        else:
+            bucket.discard(value)
+        if not bucket:
+            del index[key]
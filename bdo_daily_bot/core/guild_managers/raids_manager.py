@@ -94,13 +94,13 @@ class RaidsGuildManager:
         """
         Gets raid from manager active raids that has collection message with given id
 
+        Raid is found by the raids keeper index, raids of the other guilds are not returned.
+
         :param collection_message_id: discord collection message id to search
         :return: raid with this collection message id or None if not exist
         """
-        for raid in self.active_raids:
-            if raid.has_collection_message_with_id(collection_message_id):
-                return raid
-        return None
+        raid = RaidsKeeper.get_by_collection_message_id(collection_message_id)
+        return raid if raid and self.has_raid(raid) else None
 
     def has_raid(self, raid: Raid) -> bool:
         """
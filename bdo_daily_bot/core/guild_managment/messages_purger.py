@@ -0,0 +1,135 @@
+"""
+Module contain class to delete many messages in several channels
+"""
+import logging
+from collections import defaultdict
+from datetime import datetime, timedelta
+from typing import DefaultDict, Final, Iterable, List, Optional, Tuple
+
+from discord import HTTPException, NotFound, TextChannel, utils
+
+from bdo_daily_bot.core.discord_cache.channel_registry import ChannelRegistry
+from bdo_daily_bot.core.discord_cache.message_resolver import MessageResolver
+from bdo_daily_bot.core.tools.fan_out import fan_out
+from bdo_daily_bot.core.tools.request_scheduler import RequestPriority, RequestScheduler
+
+
+class MessagesPurger:
+    """
+    Delete messages by ids without fetching them
+
+    Messages are grouped by channels, channels are purged concurrently. Messages of the channel are deleted
+    by the bulk deletes of BULK_DELETE_LIMIT messages, messages older than the bulk delete allows are deleted
+    one by one. Requests go through the request scheduler, so they respect the routes rate limits.
+    """
+    BULK_DELETE_LIMIT: Final[int] = 100
+    # Discord doesn't bulk delete messages older than 14 days, the hour is left for the purge itself
+    BULK_DELETE_MAX_AGE: Final[timedelta] = timedelta(days=14, hours=-1)
+
+    @classmethod
+    async def purge(cls, messages_ids: Iterable[Tuple[int, int]],
+                    priority: RequestPriority = RequestPriority.MEDIUM) -> int:
+        """
+        Delete messages in several channels
+
+        :param messages_ids: tuples with channel id and message id of the messages to delete
+        :param priority: priority of the delete requests
+        :return: amount of the deleted messages
+        """
+        # Structure: {"channel_id": [message_id, ]}
+        channels_messages_ids: DefaultDict[int, List[int]] = defaultdict(list)
+        for channel_id, message_id in messages_ids:
+            channels_messages_ids[channel_id].append(message_id)
+
+        async def purge_channel(channel_messages_ids: Tuple[int, List[int]]) -> int:
+            channel_id, message_ids = channel_messages_ids
+            if not (channel := await ChannelRegistry.get_or_fetch(channel_id)):
+                logging.warning("Can't purge messages in channel {}. Channel not found".format(channel_id))
+                return 0
+            return await cls.purge_channel(channel, message_ids, priority)
+
+        results = await fan_out(channels_messages_ids.items(), purge_channel, description="messages purge")
+        return sum(result for result in results if isinstance(result, int))
+
+    @classmethod
+    async def purge_channel(cls, channel: TextChannel, message_ids: Iterable[int],
+                            priority: RequestPriority = RequestPriority.MEDIUM,
+                            single_deletes_limit: Optional[int] = None) -> int:
+        """
+        Delete messages in the channel
+
+        :param channel: discord text channel with messages
+        :param message_ids: ids of the messages to delete
+        :param priority: priority of the delete requests
+        :param single_deletes_limit: maximum amount of the old messages to delete one by one, the first ones
+            are deleted. Not limited if not specified
+        :return: amount of the deleted messages
+        """
+        bulk_delete_border = datetime.utcnow() - cls.BULK_DELETE_MAX_AGE
+        recent_message_ids, old_message_ids = [], []
+        for message_id in dict.fromkeys(message_ids):
+            if utils.snowflake_time(message_id) > bulk_delete_border:
+                recent_message_ids.append(message_id)
+            else:
+                old_message_ids.append(message_id)
+        if single_deletes_limit is not None and len(old_message_ids) > single_deletes_limit:
+            logging.info("{}/{}: {} old messages were skipped, only {} old messages are deleted one by one".
+                         format(channel.guild, channel, len(old_message_ids) - single_deletes_limit,
+                                single_deletes_limit))
+            old_message_ids = old_message_ids[:single_deletes_limit]
+
+        deleted_amount = 0
+        for chunk_start in range(0, len(recent_message_ids), cls.BULK_DELETE_LIMIT):
+            chunk = recent_message_ids[chunk_start:chunk_start + cls.BULK_DELETE_LIMIT]
+            if len(chunk) > 1 and await cls.__bulk_delete(channel, chunk, priority):
+                deleted_amount += len(chunk)
+            else:
+                old_message_ids.extend(chunk)
+        for message_id in old_message_ids:
+            deleted_amount += await cls.__delete(channel, message_id, priority)
+
+        logging.info("{}/{}: {} messages were purged".format(channel.guild, channel, deleted_amount))
+        return deleted_amount
+
+    @classmethod
+    async def __bulk_delete(cls, channel: TextChannel, message_ids: List[int], priority: RequestPriority) -> bool:
+        """
+        Delete messages with the one request
+
+        :param channel: discord text channel with messages
+        :param message_ids: ids of the 2-100 messages not older than 14 days
+        :param priority: priority of the delete request
+        :return: True if messages were deleted else False
+        """
+        messages = [channel.get_partial_message(message_id) for message_id in message_ids]
+        try:
+            await RequestScheduler.run(priority, f"bulk_delete/{channel.id}", lambda: channel.delete_messages(messages))
+        except HTTPException as error:
+            logging.warning("{}/{}: Can't bulk delete {} messages, deleting one by one.\nError: {}".
+                            format(channel.guild, channel, len(message_ids), error))
+            return False
+        for message_id in message_ids:
+            MessageResolver.forget_message(channel.id, message_id)
+        return True
+
+    @classmethod
+    async def __delete(cls, channel: TextChannel, message_id: int, priority: RequestPriority) -> bool:
+        """
+        Delete the one message
+
+        :param channel: discord text channel with message
+        :param message_id: id of the message to delete
+        :param priority: priority of the delete request
+        :return: True if message was deleted else False
+        """
+        message = channel.get_partial_message(message_id)
+        try:
+            await RequestScheduler.run(priority, f"delete/{channel.id}", message.delete)
+        except NotFound:
+            return False
+        except HTTPException as error:
+            logging.warning("{}/{}: Can't delete message {}.\nError: {}".
+                            format(channel.guild, channel, message_id, error))
+            return False
+        MessageResolver.forget_message(channel.id, message_id)
+        return True
@@ -1,13 +1,12 @@
 """
 Module contain classes to punish guild users
 """
+import logging
 from datetime import datetime, timedelta
 
-import aiohttp
-from discord import NotFound, User
+from discord import HTTPException, User
 
-from bdo_daily_bot.bot import BdoDailyBot
-from bdo_daily_bot.settings import settings
+from bdo_daily_bot.core.tools.rest_client import RestClient
 
 
 class Punishments:
@@ -25,13 +24,13 @@ class Punishments:
         :param user_id: user id to timeout
         :param timeout: timeout in minutes
         """
-        headers = {"Authorization": f"Bot {settings.TOKEN}"}
-        url = f"https://discord.com/api/v9/guilds/{guild_id}/members/{user_id}"
         timeout = (datetime.utcnow() + timedelta(minutes=timeout)).isoformat()
         json = {'communication_disabled_until': timeout}
-        session = aiohttp.ClientSession()
-        await session.patch(url, json=json, headers=headers)
-        await session.close()
+        try:
+            await RestClient.request("PATCH", "/guilds/{guild_id}/members/{user_id}", json=json,
+                                     guild_id=guild_id, user_id=user_id)
+        except HTTPException as error:
+            logging.warning("Can't timeout user {} in guild {}.\nError: {}".format(user_id, guild_id, error))
 
     @classmethod
     async def punish_for_spam(cls, guild_id: int, user: User):
@@ -42,20 +41,3 @@ class Punishments:
         :param user: discord user
         """
         await cls.__timeout_user(guild_id, user.id, cls.SPAM_TIMEOUT_PUNISHMENT)
-
-    @classmethod
-    async def delete_message(cls, channel_id: int, message_id: int):
-        """
-        Delete the specific message in the specific channel
-
-        :param channel_id: discord channel id
-        :param message_id: discord message id
-        """
-        channel = BdoDailyBot.bot.get_channel(channel_id)
-        async for message in channel.history(limit=50):
-            if message.id == message_id:
-                try:
-                    await message.delete()
-                except NotFound:
-                    return
-                return
@@ -2,14 +2,15 @@
 
 Module contain classes to protect guilds against bad peoples as spammers.
 """
-import asyncio
 import logging
-from collections import defaultdict
-from typing import DefaultDict, Dict, Final, NewType, Set, Tuple
+import time
+from collections import OrderedDict, deque
+from typing import Deque, Final, Set, Tuple
 
 from discord import Message
 
 from bdo_daily_bot.bot import BdoDailyBot
+from bdo_daily_bot.core.guild_managment.messages_purger import MessagesPurger
 from bdo_daily_bot.core.guild_managment.punishments import Punishments
 from bdo_daily_bot.core.users_interactor.senders import ChannelsSender, UsersSender
 from bdo_daily_bot.settings import settings
@@ -18,12 +19,19 @@ from bdo_daily_bot.settings import settings
 class MessageContainer:
     """
     Container to store discord messages information for some time
+
+    Every user has the bounded history of the recent messages, expired messages are removed lazily when
+    the user history is accessed and by the sweep of all histories every settings.SPAM_SWEEP_INTERVAL
+    seconds. No more than settings.SPAM_USERS_LIMIT users histories are stored, the history of the least
+    recently active user is evicted first.
     """
     MESSAGE_LIFECYCLE_IN_SECONDS: Final[int] = 60
 
-    # Structure: {"user_id": {"message_hash": [("channel_id", "message_id"), ]}}
-    Container = NewType("Container", DefaultDict[int, Dict[int, Set[Tuple[int, int]]]])
-    __message_container: Container = defaultdict(lambda: defaultdict(lambda: set()))
+    # Structure: (time of adding, message hash, channel id, message id)
+    MessageRecord = Tuple[float, int, int, int]
+    # Structure: {"user_id": deque([message_record, ])} in the order of the users last messages
+    __message_container: "OrderedDict[int, Deque[MessageRecord]]" = OrderedDict()
+    __next_sweep_time: float = 0
 
     @classmethod
     async def add_message(cls, message: Message):
@@ -32,24 +40,40 @@ class MessageContainer:
 
         :param message: discord message to store
         """
-        cls.__message_container[message.author.id][cls.get_message_hash(message)].add((message.channel.id, message.id))
-        asyncio.ensure_future(cls.__enable_message_lifecycle(message))
+        now = time.monotonic()
+        if now >= cls.__next_sweep_time:
+            cls.sweep()
+        if not (user_history := cls.__message_container.get(message.author.id)):
+            user_history = cls.__message_container[message.author.id] = deque(maxlen=settings.SPAM_USER_HISTORY_SIZE)
+            if len(cls.__message_container) > settings.SPAM_USERS_LIMIT:
+                cls.__message_container.popitem(last=False)
+        cls.__message_container.move_to_end(message.author.id)
+        user_history.append((now, cls.get_message_hash(message), message.channel.id, message.id))
 
     @classmethod
-    async def __enable_message_lifecycle(cls, message: Message):
+    def sweep(cls):
+        """
+        Remove expired messages of all users and users without messages
         """
-        Delete discord message from container after some time
+        now = time.monotonic()
+        for user_id in list(cls.__message_container):
+            if not cls.__get_user_history(user_id):
+                cls.__message_container.pop(user_id)
+        cls.__next_sweep_time = now + settings.SPAM_SWEEP_INTERVAL
 
-        :param message: discord message to delete after some time
+    @classmethod
+    def __get_user_history(cls, user_id: int) -> Deque[MessageRecord]:
         """
-        await asyncio.sleep(cls.MESSAGE_LIFECYCLE_IN_SECONDS)
-        message_hash = cls.get_message_hash(message)
-        if cls.__message_container[message.author.id][message_hash]:
-            cls.__message_container[message.author.id][message_hash].remove((message.channel.id, message.id))
-        if not cls.__message_container[message.author.id][message_hash]:
-            cls.__message_container[message.author.id].pop(message_hash)
-        if not cls.__message_container[message.author.id]:
-            cls.__message_container.pop(message.author.id)
+        Gets user history of the messages without expired messages
+
+        :param user_id: discord user id
+        :return: user messages records from the oldest to the newest
+        """
+        user_history = cls.__message_container.get(user_id, deque())
+        expiration_time = time.monotonic() - cls.MESSAGE_LIFECYCLE_IN_SECONDS
+        while user_history and user_history[0][0] <= expiration_time:
+            user_history.popleft()
+        return user_history
 
     @classmethod
     def get_messages_amount(cls, message: Message) -> int:
@@ -59,7 +83,8 @@ class MessageContainer:
         :param message: discord message
         :return: amount of stored user identical messages
         """
-        return len(cls.__message_container.get(message.author.id, {}).get(cls.get_message_hash(message), set()))
+        message_hash = cls.get_message_hash(message)
+        return sum(1 for record in cls.__get_user_history(message.author.id) if record[1] == message_hash)
 
     @classmethod
     def get_user_messages_id(cls, message: Message) -> Set[Tuple[int, int]]:
@@ -69,7 +94,9 @@ class MessageContainer:
         :param message: discord message
         :return: set of tuple with channel_id, message_id for message and author
         """
-        return cls.__message_container[message.author.id][cls.get_message_hash(message)]
+        message_hash = cls.get_message_hash(message)
+        return {(channel_id, message_id) for _, record_hash, channel_id, message_id
+                in cls.__get_user_history(message.author.id) if record_hash == message_hash}
 
     @classmethod
     def clear_user_history(cls, user_id: int):
@@ -78,7 +105,7 @@ class MessageContainer:
 
         :param user_id: discord user id
         """
-        cls.__message_container.pop(user_id)
+        cls.__message_container.pop(user_id, None)
 
     @classmethod
     def get_message_hash(cls, message: Message) -> int:
@@ -111,8 +138,7 @@ class GuildSecurityManager:
         await MessageContainer.add_message(message)
         if MessageContainer.get_messages_amount(message) >= cls.SPAM_MESSAGES_AMOUNT_TO_PREVENT:
             await Punishments.punish_for_spam(message.guild.id, message.author)
-            for channel_id, message_id in MessageContainer.get_user_messages_id(message):
-                await Punishments.delete_message(channel_id, message_id)
+            await MessagesPurger.purge(MessageContainer.get_user_messages_id(message))
             channel = BdoDailyBot.bot.get_channel(settings.CHANNEL_ID_TO_REPORT)
             await ChannelsSender.send_spam_report(channel, message)
             await UsersSender.send_user_message_for_spam(message.author)
@@ -5,7 +5,7 @@ from abc import ABC
 from dataclasses import dataclass
 from typing import Any, Optional, Union
 
-from discord import DMChannel, Guild, Message, TextChannel, User
+from discord import DMChannel, Guild, Message, PartialMessage, TextChannel, User
 from discord.ext.commands import Command, Context
 from typing_extensions import TypeGuard
 
@@ -29,18 +29,32 @@ class ContextInterface(ABC):
 class ReactionContext(ContextInterface):
     """
     Reaction context for handle reaction actions
+
+    Context message is a partial message with id and channel only. Full message is fetched only
+    by the handlers that need message content.
     """
 
     ADD_ACTION_TYPE = "REACTION_ADD"
     REMOVE_ACTION_TYPE = "REACTION_REMOVE"
     EXPECTED_REACTION_ACTIONS = {ADD_ACTION_TYPE, REMOVE_ACTION_TYPE}
 
+    message: Union[Message, PartialMessage]
     reaction_type: str
     reaction: str
 
     def __hash__(self) -> int:
         return hash((self.guild.id, self.reaction_type, self.reaction))
 
+    async def fetch_message(self) -> Message:
+        """
+        Fetch full discord message of the reaction and replace context partial message with it
+
+        :return: full discord message
+        """
+        if not isinstance(self.message, Message):
+            self.message = await self.message.fetch()
+        return self.message
+
     def __post_init__(self):
         """
         Validate and replace command with plug after instance initialization
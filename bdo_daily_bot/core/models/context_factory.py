@@ -17,12 +17,14 @@ class ReactionContextFactory:
         """
         Produce reaction context by the given raw reaction event payload
 
+        Reaction message is not fetched, context contains partial message with the message id.
+
         :param event: discord raw reaction event with the state
         :return: produced reaction context
         """
-        channel = BdoDailyBot.bot.get_channel(event.channel_id)
+        channel = BdoDailyBot.bot.get_channel(event.channel_id) or await BdoDailyBot.bot.fetch_channel(event.channel_id)
         guild = None if isinstance(channel, DMChannel) else channel.guild
-        message = await channel.fetch_message(event.message_id)
+        message = channel.get_partial_message(event.message_id)
         user = BdoDailyBot.bot.get_user(event.user_id)
         reaction = str(event.emoji)
         return ReactionContext(guild=guild, channel=channel, message=message,
@@ -0,0 +1,57 @@
+"""
+Contain class for checking reaction messages by the raw reaction event attributes
+"""
+from typing import Optional
+
+from bdo_daily_bot.core.database.manager import DatabaseManager
+from bdo_daily_bot.core.guild_managers.raids_keeper import RaidsKeeper
+
+
+class ReactionMessageFilter:
+    """
+    Check that reaction handler is responsible for the reaction message
+
+    Checks use only guild id, message id and reaction, so not related reactions are rejected
+    without requesting discord.
+    """
+
+    __database = DatabaseManager()
+
+    @classmethod
+    async def is_collection_message(cls, guild_id: Optional[int], message_id: int, reaction: str) -> bool:
+        """
+        Check that message is the collection message of the active raid
+
+        :param guild_id: discord guild id or None for direct messages
+        :param message_id: discord message id
+        :param reaction: reaction on the message
+        :return: True if message is raid collection message else False
+        """
+        return bool(guild_id) and RaidsKeeper.get_by_collection_message_id(message_id) is not None
+
+    @classmethod
+    async def is_direct_message(cls, guild_id: Optional[int], message_id: int, reaction: str) -> bool:
+        """
+        Check that message is a direct message. Notification controller messages are sent only to users
+
+        :param guild_id: discord guild id or None for direct messages
+        :param message_id: discord message id
+        :param reaction: reaction on the message
+        :return: True if message is direct message else False
+        """
+        return guild_id is None
+
+    @classmethod
+    async def is_role_message(cls, guild_id: Optional[int], message_id: int, reaction: str) -> bool:
+        """
+        Check that message gives role by the given reaction
+
+        :param guild_id: discord guild id or None for direct messages
+        :param message_id: discord message id
+        :param reaction: reaction on the message
+        :return: True if reaction on the message gives role else False
+        """
+        if not guild_id:
+            return False
+        reaction_roles = await cls.__database.settings.get_reaction_roles(guild_id, message_id)
+        return bool(reaction_roles) and reaction in reaction_roles
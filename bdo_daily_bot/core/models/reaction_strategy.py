@@ -1,14 +1,18 @@
 """
 Contain classes for picking handlers for the specific reactions
 """
-from typing import Any, Callable, Coroutine, Dict, List, NewType, Optional
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Coroutine, Dict, List, NewType, Optional, Tuple
 
 from bdo_daily_bot.core.commands.raid.joining import join_raid_by_reaction, leave_raid_by_reaction
 from bdo_daily_bot.core.commands.raid.settings import not_notify_me, notify_me
 from bdo_daily_bot.core.commands.roles import add_role_from_reaction, remove_role_from_reaction
 from bdo_daily_bot.core.database.manager import DatabaseManager
-from bdo_daily_bot.core.models.context import ReactionContext
+from bdo_daily_bot.core.database.settings_cache import SettingsCache
+from bdo_daily_bot.core.models.reaction_message_filter import ReactionMessageFilter
 from bdo_daily_bot.core.users_interactor.message_reaction_interactor import MessagesReactions
+from bdo_daily_bot.settings import settings
 
 
 class DynamicReactionsFactory:
@@ -19,35 +23,50 @@ class DynamicReactionsFactory:
     __database = DatabaseManager()
 
     ReactionsFactoryMethod = NewType("ReactionsFactoryMethod",
-                                     Callable[[ReactionContext], Coroutine[Any, Any, List[str]]])
+                                     Callable[[Optional[int]], Coroutine[Any, Any, List[str]]])
 
     @classmethod
-    async def get_reactions_to_role_action(cls, ctx: ReactionContext) -> ReactionsFactoryMethod:
+    async def get_reactions_to_role_action(cls, guild_id: Optional[int]) -> List[str]:
         """
         Return reactions to role action from the database
 
-        :param ctx: discord reaction context
+        :param guild_id: discord guild id or None for direct messages
         :return: list of reactions
         """
-        if ctx.guild:
-            return await cls.__database.settings.get_reactions_for_action_with_roles(ctx.guild.id) or []
+        if guild_id:
+            return await cls.__database.settings.get_reactions_for_action_with_roles(guild_id) or []
         return []
 
 
+@dataclass
+class DispatchTable:
+    """Compiled reactions and their handlers for the specific guild"""
+    add_handlers: Dict[str, Tuple[Callable, ...]] = field(default_factory=dict)
+    remove_handlers: Dict[str, Tuple[Callable, ...]] = field(default_factory=dict)
+    settings_version: Tuple[int, int] = (0, 0)
+    expiration_time: float = 0
+
+
 class ReactionStrategy:
     """
     Responsible for providing method to handle the reaction that user adds or removes
 
-    Provide handlers to call by the given reaction context and reaction from the static and dynamic maps.
+    Provide handlers to call by the given guild and reaction from the static and dynamic maps.
     Static reactions maps contain reactions and handlers that can't be changed via commands.
     Dynamic reactions maps contain reactions and handlers that can be changed via commands.
     To add new reaction strategy, need to update static or dynamic map.
+
+    Maps are compiled to the dispatch table once per guild. Table is compiled again only if the guild
+    settings were changed or the table lives longer than the settings cache TTL.
+    Handlers from the table are filtered by their message filters, so handler is called only for the
+    messages it is responsible for.
     """
 
     Handler = Callable[[Any], Coroutine[Any, Any, Any]]
     StaticReactionsMap = NewType("StaticReactionsMap", Dict[str, List[Handler]])
     DynamicReactionsMap = NewType("DynamicReactionsMap", Dict[DynamicReactionsFactory.ReactionsFactoryMethod, Handler])
-    ReactionMap = Dict[str, List[Handler]]
+    ReactionMap = Dict[str, Tuple[Handler, ...]]
+    MessageFilter = Callable[[Optional[int], int, str], Coroutine[Any, Any, bool]]
 
     __static_add_reaction_map: StaticReactionsMap = {
         MessagesReactions.COLLECTION_EMOJI: [join_raid_by_reaction],
@@ -65,84 +84,130 @@ class ReactionStrategy:
         DynamicReactionsFactory.get_reactions_to_role_action: remove_role_from_reaction,
     }
 
+    __message_filters: Dict[Handler, MessageFilter] = {
+        join_raid_by_reaction: ReactionMessageFilter.is_collection_message,
+        leave_raid_by_reaction: ReactionMessageFilter.is_collection_message,
+        not_notify_me: ReactionMessageFilter.is_direct_message,
+        notify_me: ReactionMessageFilter.is_direct_message,
+        add_role_from_reaction: ReactionMessageFilter.is_role_message,
+        remove_role_from_reaction: ReactionMessageFilter.is_role_message,
+    }
+
+    # Structure: {"guild_id": DispatchTable}
+    __dispatch_tables: Dict[Optional[int], DispatchTable] = {}
+
+    @classmethod
+    async def get_add_reaction_handlers(cls, guild_id: Optional[int], message_id: int,
+                                        reaction: str) -> List[Handler]:
+        """
+        Gets add reaction handlers for the specific guild, message and reaction
+
+        :param guild_id: discord guild id or None for direct messages
+        :param message_id: discord message id with added reaction
+        :param reaction: added reaction
+        :return: add reaction handlers to call
+        """
+        dispatch_table = await cls.get_dispatch_table(guild_id)
+        return await cls.__filter_handlers(dispatch_table.add_handlers.get(reaction), guild_id, message_id, reaction)
+
     @classmethod
-    async def get_add_reaction_handlers(cls, ctx: ReactionContext) -> Optional[List[Handler]]:
+    async def get_remove_reaction_handlers(cls, guild_id: Optional[int], message_id: int,
+                                           reaction: str) -> List[Handler]:
         """
-        Gets add reaction handlers for the specific guild and reaction from the given reaction context
+        Gets remove reaction handlers for the specific guild, message and reaction
 
-        :param ctx: discord reaction context
-        :return: list of add reaction handlers to call
+        :param guild_id: discord guild id or None for direct messages
+        :param message_id: discord message id with removed reaction
+        :param reaction: removed reaction
+        :return: remove reaction handlers to call
         """
-        reaction_map = await cls.__get_add_reaction_map(ctx)
-        return reaction_map.get(ctx.reaction)
+        dispatch_table = await cls.get_dispatch_table(guild_id)
+        return await cls.__filter_handlers(dispatch_table.remove_handlers.get(reaction), guild_id, message_id, reaction)
 
     @classmethod
-    async def get_remove_reaction_handlers(cls, ctx: ReactionContext) -> Optional[List[Handler]]:
+    async def get_dispatch_table(cls, guild_id: Optional[int]) -> DispatchTable:
         """
-        Gets remove reaction handlers for the specific guild and reaction from the given reaction context
+        Gets compiled dispatch table of the given guild. Compile it if it is missed or outdated
 
-        :param ctx: discord reaction context
-        :return: list of remove reaction handlers to call
+        :param guild_id: discord guild id or None for direct messages
+        :return: guild dispatch table
         """
-        reaction_map = await cls.__get_remove_reaction_map(ctx)
-        return reaction_map.get(ctx.reaction)
+        dispatch_table = cls.__dispatch_tables.get(guild_id)
+        if not dispatch_table or dispatch_table.settings_version != SettingsCache.get_version(guild_id) \
+                or dispatch_table.expiration_time < time.monotonic():
+            dispatch_table = await cls.compile(guild_id)
+        return dispatch_table
 
     @classmethod
-    async def __get_add_reaction_map(cls, ctx: ReactionContext) -> ReactionMap:
+    async def compile(cls, guild_id: Optional[int]) -> DispatchTable:
         """
-        Return map with reaction and their add reaction handlers
+        Compile static and dynamic reaction maps to the dispatch table of the given guild
 
-        :param ctx: discord reaction context
-        :return: map with reaction and their add reaction handlers
+        :param guild_id: discord guild id or None for direct messages
+        :return: compiled guild dispatch table
         """
-        dynamic_add_reaction_map = await cls.__produce_dynamic_map(ctx, cls.__dynamic_add_reaction_map)
-        return cls.__union_maps(cls.__static_add_reaction_map, dynamic_add_reaction_map)
+        settings_version = SettingsCache.get_version(guild_id)
+        dispatch_table = DispatchTable(
+            add_handlers=cls.__union_maps(
+                cls.__static_add_reaction_map,
+                await cls.__produce_dynamic_map(guild_id, cls.__dynamic_add_reaction_map)),
+            remove_handlers=cls.__union_maps(
+                cls.__static_remove_reaction_map,
+                await cls.__produce_dynamic_map(guild_id, cls.__dynamic_remove_reaction_map)),
+            settings_version=settings_version,
+            expiration_time=time.monotonic() + settings.SETTINGS_CACHE_TTL,
+        )
+        cls.__dispatch_tables[guild_id] = dispatch_table
+        return dispatch_table
 
     @classmethod
-    async def __get_remove_reaction_map(cls, ctx: ReactionContext) -> ReactionMap:
+    async def __filter_handlers(cls, handlers: Optional[Tuple[Handler, ...]], guild_id: Optional[int],
+                                message_id: int, reaction: str) -> List[Handler]:
         """
-        Return map with reaction and their remove reaction handlers
+        Filter handlers that are responsible for the given reaction message
 
-        :param ctx: discord reaction context
-        :return: map with reaction and their remove reaction handlers
+        :param handlers: reaction handlers from the dispatch table
+        :param guild_id: discord guild id or None for direct messages
+        :param message_id: discord message id with reaction
+        :param reaction: reaction on the message
+        :return: handlers to call
         """
-        dynamic_remove_reaction_map = await cls.__produce_dynamic_map(ctx, cls.__dynamic_remove_reaction_map)
-        return cls.__union_maps(cls.__static_remove_reaction_map, dynamic_remove_reaction_map)
+        filtered_handlers = []
+        for handler in handlers or ():
+            message_filter = cls.__message_filters.get(handler)
+            if not message_filter or await message_filter(guild_id, message_id, reaction):
+                filtered_handlers.append(handler)
+        return filtered_handlers
 
     @classmethod
-    def __union_maps(cls, *reaction_maps: ReactionMap) -> ReactionMap:
+    def __union_maps(cls, *reaction_maps: Dict[str, List[Handler]]) -> ReactionMap:
         """
-        Union given reaction maps to the one
+        Union given reaction maps to the one without changing given maps
 
         :param reaction_maps: list of reaction maps to union
         :return: united maps
         """
-        united_map: cls.ReactionMap = {}
+        united_map: Dict[str, List[ReactionStrategy.Handler]] = {}
         for reaction_map in reaction_maps:
             for reaction, handlers in reaction_map.items():
-                exist_handlers = united_map.get(reaction)
-                if exist_handlers:
-                    exist_handlers.extend(handlers)
-                else:
-                    united_map[reaction] = handlers
-        return united_map
+                united_map.setdefault(reaction, []).extend(handlers)
+        return {reaction: tuple(handlers) for reaction, handlers in united_map.items()}
 
     @classmethod
-    async def __produce_dynamic_map(cls, ctx: ReactionContext,
-                                    dynamic_reaction_map: DynamicReactionsMap) -> ReactionMap:
+    async def __produce_dynamic_map(cls, guild_id: Optional[int],
+                                    dynamic_reaction_map: DynamicReactionsMap) -> Dict[str, List[Handler]]:
         """
         Call factory methods from the dynamic reaction map and produce reaction map
 
-        :param ctx: discord reaction context
+        :param guild_id: discord guild id or None for direct messages
         :param dynamic_reaction_map: reaction map with the method to produce roles and their handlers
         :return: reaction map from the dynamic reaction map
         """
-        reactions_map: cls.ReactionMap = {}
+        reactions_map: Dict[str, List[ReactionStrategy.Handler]] = {}
         for reactions_source, handler in dynamic_reaction_map.items():
-            reactions: List[str] = await reactions_source(ctx)
+            reactions: List[str] = await reactions_source(guild_id)
             for reaction in reactions:
-                if handlers := reactions_map.get(reaction):
+                handlers = reactions_map.setdefault(reaction, [])
+                if handler not in handlers:
                     handlers.append(handler)
-                else:
-                    reactions_map[reaction] = [handler]
         return reactions_map
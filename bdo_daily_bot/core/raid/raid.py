@@ -8,6 +8,7 @@ from typing import List, Optional
 from discord import Guild, TextChannel
 
 from bdo_daily_bot.core.database.manager import DatabaseManager
+from bdo_daily_bot.core.guild_managers.raids_keeper import RaidsKeeper
 from bdo_daily_bot.core.raid.raid_item import RaidItem
 from bdo_daily_bot.core.raid.raid_member import RaidMember
 from bdo_daily_bot.core.raid.raid_table import RaidTable
@@ -43,6 +44,8 @@ class Raid:
         self.information_channels = []
         self.flow = None
 
+        self.__table = RaidTable(self)
+
     @property
     def members_amount(self) -> int:
         """
@@ -75,9 +78,11 @@ class Raid:
         """
         Gets raid table image with raid information
 
+        Table is kept for the whole raid life to reuse the last rendered image.
+
         :return: raid table image with raid information
         """
-        return RaidTable(self)
+        return self.__table
 
     @property
     def raid_item(self) -> RaidItem:
@@ -110,22 +115,30 @@ class Raid:
         """
         Add the given member to the raid members list
 
+        Member is added to the raid document at once. Raid messages are updated at the end of the
+        raid flow update window.
+
         :param member: member to add
         """
         self.members.append(member)
-        await self.flow.update()
-        await self.save()
+        RaidsKeeper.add_member(self, member)
+        self.flow.request_update()
+        await DatabaseManager().raid.add_member(self.captain.nickname, self.time.time_leaving, member.attributes)
 
     async def remove_member(self, member: RaidMember):
         """
         Remove the given member from the raid members list
 
+        Member is removed from the raid document at once. Raid messages are updated at the end of the
+        raid flow update window.
+
         :param member: member to remove
         """
         raid_member = self.get_member(member)
         self.members.remove(raid_member)
-        await self.flow.update()
-        await self.save()
+        RaidsKeeper.remove_member(self, raid_member)
+        self.flow.request_update()
+        await DatabaseManager().raid.remove_member(self.captain.nickname, self.time.time_leaving, raid_member.nickname)
 
     async def save(self):
         """
@@ -8,7 +8,8 @@ from typing import Dict, List, Optional
 
 from discord import CategoryChannel, Forbidden, Guild, HTTPException, Message, NotFound, TextChannel
 
-from bdo_daily_bot.bot import BdoDailyBot
+from bdo_daily_bot.core.discord_cache.channel_registry import ChannelRegistry
+from bdo_daily_bot.core.discord_cache.message_resolver import MessageResolver
 from bdo_daily_bot.core.raid.raid import Raid
 from bdo_daily_bot.core.raid.raid_messages import RaidCollectionMessage, RaidLeaveMessage, RaidReservationMessage, \
     RaidTableMessage
@@ -57,6 +58,7 @@ class RaidChannel:
         self.channel = await self.guild.create_text_channel(name=self.name, category=raid_category,
                                                             position=position, topic=messages.raid_channel_topic,
                                                             reason=messages.raid_channel_creation_reason)
+        ChannelRegistry.add(self.channel)
         logging.info("{}/{}: Raid {}/{}: Raid channel was created".
                      format(self.guild.name, self.channel.name, self.raid.captain.nickname,
                             self.raid.time.normal_time_leaving))
@@ -67,6 +69,8 @@ class RaidChannel:
         """
         try:
             await self.channel.delete()
+            ChannelRegistry.remove(self.channel.id)
+            MessageResolver.forget_channel(self.channel.id)
             logging.info("{}/{}: Raid {}/{}: Raid channel was deleted".
                          format(self.guild.name, self.channel.name, self.raid.captain.nickname,
                                 self.raid.time.normal_time_leaving))
@@ -154,23 +158,17 @@ class RaidChannel:
         :param message_id: discord message id to find
         :return: discord message if was found else None
         """
-        async for message in channel.history(limit=100):
-            if message.id == message_id:
-                return message
-        return None
+        return await MessageResolver.get_message(channel, message_id)
 
     @classmethod
-    def get_channel_by_id(cls, channel_id: int) -> Optional[TextChannel]:
+    async def get_channel_by_id(cls, channel_id: int) -> Optional[TextChannel]:
         """
         Gets channel of all bot visible channel with given channel id
 
         :param channel_id: discord channel id
         :return: discord channel with given id if found else None
         """
-        for channel in BdoDailyBot.bot.get_all_channels():
-            if channel.id == channel_id:
-                return channel
-        return None
+        return await ChannelRegistry.get_or_fetch(channel_id)
 
     @classmethod
     async def delete_expired_channel(cls, expired_channel: TextChannel):
@@ -181,6 +179,8 @@ class RaidChannel:
         """
         try:
             await expired_channel.delete(reason="Рейд уже был отвезён")
+            ChannelRegistry.remove(expired_channel.id)
+            MessageResolver.forget_channel(expired_channel.id)
             logging.info("{}/{}: Expired raid channel was deleted.".
                          format(expired_channel.guild.name, expired_channel.name))
         except NotFound:
@@ -195,7 +195,7 @@ class RaidChannel:
         :param channels_info: list of dict of the raid channels information
         """
         for channel_info in channels_info:
-            expired_channel = cls.get_channel_by_id(channel_info.get('channel_id'))
+            expired_channel = await cls.get_channel_by_id(channel_info.get('channel_id'))
             if expired_channel:
                 await cls.delete_expired_channel(expired_channel)
 
@@ -214,7 +214,7 @@ class RaidChannel:
             return raid_channels
 
         for channel_info in channels_info:
-            channel = cls.get_channel_by_id(channel_info.get('channel_id'))
+            channel = await cls.get_channel_by_id(channel_info.get('channel_id'))
             if not channel:
                 continue
             raid_channel = RaidChannel(channel.guild, raid)
@@ -9,11 +9,19 @@ from bdo_daily_bot.core.database.manager import DatabaseManager
 from bdo_daily_bot.core.guild_managers.raids_keeper import RaidsKeeper
 from bdo_daily_bot.core.raid.raid import Raid
 from bdo_daily_bot.core.raid.raid_notifier import RaidNotifier
+from bdo_daily_bot.core.tools.fan_out import fan_out
+from bdo_daily_bot.core.tools.scheduler import Scheduler
+from bdo_daily_bot.core.tools.update_coalescer import UpdateCoalescer
 
 
 class RaidFlow:
     """
     Response for controlling raid flow
+
+    Every step for several raid or information channels runs for all channels concurrently.
+    Raid members changes are collected during the update window and applied to messages by the one update.
+    Timed steps are scheduler jobs with the absolute deadlines from the raid time, so the flow of the raid
+    loaded after the bot restart continues from the next step.
     """
     __database = DatabaseManager()
 
@@ -22,60 +30,48 @@ class RaidFlow:
         :param raid: raid for controlling
         """
         self.raid = raid
+        self.key = "{}/{}".format(raid.captain.nickname, raid.time.time_leaving.isoformat())
 
-        self.sleep_until_collection_task = None
-        self.sleep_until_update_task = None
-        self.sleep_after_leaving_task = None
-        self.notification_task = None
+        self.update_coalescer = UpdateCoalescer(
+            self.update, "Raid {}/{}".format(raid.captain.nickname, raid.time.normal_time_leaving))
 
         self.flow_is_started = False
+        self.__flow_is_ended = asyncio.Event()
 
     async def start(self):
         """
-        Starts raid flow
+        Starts raid flow and wait its end
 
         Starts raid flow consist of:
-            sending collection message
-            updating collection message
-            updating collection table
+            sending reservation message
+            sending collection message at the reservation open time
+            updating collection message and collection table at the display times
             notifying members and captain about leaving
-            sending leaving message
-            deleting discord guild channel
+            sending leaving message at the leaving time
+            deleting discord guild channel after leaving
         """
         if self.flow_is_started:
             return
         self.flow_is_started = True
         await self.__send_reservation_messages()
         await self.update_raids_information_channels()
-        await self.__sleep_until_collection()
-        await self.__send_collection_messages()
-        await self.__update_table_messages()
-        await self.__notify_raid_members()
-
-        for secs_to_update in self.raid.time.get_secs_to_display_generator():
-            await self.__sleep_until_update(secs_to_update)
-            await self.update_collection_messages()
-            await self.__update_table_messages()
-
-        await self.__send_leave_messages()
-        await self.__database.captain.update_captain(self.raid.captain.user.id, self.raid.raid_item)
-        await self.__archive_raid(archive=True)
-        await self.update_raids_information_channels()
-        await self.__sleep_after_leaving()
-        await self.end()
+        self.__schedule_steps()
+        await self.__flow_is_ended.wait()
 
     async def end(self):
         """
         End raid flow
 
-        Cancel all active tasks, remove raid channels, remove raid from keeper and database
+        Cancel all scheduled steps, remove raid channels, remove raid from keeper and database
         """
+        await self.update_coalescer.flush()
         self.raid.flow = None
-        self.__cancel_all_tasks()
+        Scheduler.cancel(self.key)
         await self.__archive_raid()
         RaidsKeeper.remove_raid(self.raid)
         await self.__remove_all_channels()
         await self.update_raids_information_channels()
+        self.__flow_is_ended.set()
         logging.debug("Raid with captain {} and time leaving {} completely removed".format(
             self.raid.captain.nickname, self.raid.time.kebab_time_leaving))
 
@@ -86,19 +82,25 @@ class RaidFlow:
         await self.update_collection_messages()
         await self.update_raids_information_channels()
 
+    def request_update(self):
+        """
+        Request update of raid messages at the end of the update window
+        """
+        self.update_coalescer.request()
+
     async def update_collection_messages(self):
         """
         Update all raid collection messages in raid channels
         """
-        for channel in self.raid.channels:
-            await channel.update_collection_message()
+        await fan_out(self.raid.channels, lambda channel: channel.update_collection_message(),
+                      description="collection message update")
 
     async def update_raids_information_channels(self):
         """
         Update all information channels with specific raid
         """
-        for information_channel in self.raid.information_channels:
-            await information_channel.update()
+        await fan_out(self.raid.information_channels, lambda information_channel: information_channel.update(),
+                      description="information channel update")
 
     async def __archive_raid(self, *, archive: bool = False):
         """
@@ -110,26 +112,65 @@ class RaidFlow:
         if archive:
             await self.__database.raid_archive.archive(self.raid.raid_item)
 
+    def __schedule_steps(self):
+        """
+        Schedule raid flow steps at the raid time deadlines
+        """
+        raid_time = self.raid.time
+        Scheduler.schedule(self.key, "collection", raid_time.time_reservation_open, self.__open_collection)
+        if raid_time.time_to_notify >= max(datetime.now(), raid_time.time_reservation_open):
+            Scheduler.schedule(self.key, "notification", raid_time.time_to_notify, self.__notify_raid_members)
+        else:
+            logging.info("Raid {}/{}: Members will not be notified. Little time left before raid left".
+                         format(self.raid.captain.nickname, raid_time.normal_time_leaving))
+        for display_time in raid_time.display_times:
+            Scheduler.schedule(self.key, "display", display_time, self.__display)
+        Scheduler.schedule(self.key, "leaving", raid_time.time_leaving, self.__leave)
+        Scheduler.schedule(self.key, "end", raid_time.time_channel_deleting, self.end)
+
+    async def __open_collection(self):
+        """
+        Send collection messages and table messages
+        """
+        await self.__send_collection_messages()
+        await self.__update_table_messages()
+
+    async def __display(self):
+        """
+        Update collection messages and table messages
+        """
+        await self.update_collection_messages()
+        await self.__update_table_messages()
+
+    async def __leave(self):
+        """
+        Send leave messages, update captain statistics and archive raid
+        """
+        await self.update_coalescer.flush()
+        await self.__send_leave_messages()
+        await self.__database.captain.update_captain(self.raid.captain.user.id, self.raid.raid_item)
+        await self.__archive_raid(archive=True)
+        await self.update_raids_information_channels()
+
     async def __notify_raid_members(self):
         """
         Notify raid members and captain before raid left
         """
-        self.notification_task = asyncio.create_task(RaidNotifier.notify_about_leaving(self.raid))
-        asyncio.ensure_future(self.notification_task)
+        await RaidNotifier.notify_about_leaving(self.raid)
 
     async def __send_table_messages(self):
         """
         Send table messages in all guild raid channels
         """
-        for channel in self.raid.channels:
-            await channel.send_table_message()
+        await fan_out(self.raid.channels, lambda channel: channel.send_table_message(),
+                      description="table message sending")
 
     async def __update_table_messages(self):
         """
         Update all table messages in raid channels
         """
-        for channel in self.raid.channels:
-            await channel.update_table_message()
+        await fan_out(self.raid.channels, lambda channel: channel.update_table_message(),
+                      description="table message update")
         await self.raid.save()
 
     async def __send_reservation_messages(self):
@@ -137,68 +178,31 @@ class RaidFlow:
         Send collection messages in raid channels
         """
         if datetime.now() < self.raid.time.time_reservation_open:
-            for channel in self.raid.channels:
-                if not channel.reservation_message:
-                    await channel.send_reservation_message()
+            channels = [channel for channel in self.raid.channels if not channel.reservation_message]
+            await fan_out(channels, lambda channel: channel.send_reservation_message(),
+                          description="reservation message sending")
             await self.raid.save()
 
     async def __send_collection_messages(self):
         """
         Send collection messages in raid channels
         """
-        for channel in self.raid.channels:
-            if not channel.collection_message:
-                await channel.send_collection_message()
+        channels = [channel for channel in self.raid.channels if not channel.collection_message]
+        await fan_out(channels, lambda channel: channel.send_collection_message(),
+                      description="collection message sending")
         await self.raid.save()
 
     async def __send_leave_messages(self):
         """
         Send leave messages in all raid channels
         """
-        for channel in self.raid.channels:
-            await channel.send_leave_message()
-
-    async def __sleep_until_update(self, secs_to_update: int):
-        """
-        Sleep until time to update tables. Block method.
-
-        :param secs_to_update: secs before next update
-        """
-        self.sleep_until_update_task = asyncio.create_task(asyncio.sleep(secs_to_update))
-        await self.sleep_until_update_task
-
-    async def __sleep_after_leaving(self):
-        """
-        Sleep after raid was left. Block method.
-        """
-        self.sleep_after_leaving_task = asyncio.create_task(asyncio.sleep(self.raid.time.secs_after_leaving))
-        await self.sleep_after_leaving_task
-
-    def __cancel_all_tasks(self):
-        """
-        Cancel all raid flow tasks
-        """
-        if self.sleep_until_collection_task:
-            self.sleep_until_collection_task.cancel()
-        if self.sleep_until_update_task:
-            self.sleep_until_update_task.cancel()
-        if self.sleep_after_leaving_task:
-            self.sleep_after_leaving_task.cancel()
-        if self.notification_task:
-            self.notification_task.cancel()
+        await fan_out(self.raid.channels, lambda channel: channel.send_leave_message(),
+                      description="leave message sending")
 
     async def __remove_all_channels(self):
         """
         Delete all raid discord channels
         """
-        for channel in self.raid.channels:
-            if channel.is_created():
-                await channel.delete()
+        channels = [channel for channel in self.raid.channels if channel.is_created()]
+        await fan_out(channels, lambda channel: channel.delete(), description="raid channel deletion")
         self.raid.channels = []
-
-    async def __sleep_until_collection(self):
-        """
-        Wait time before open raid collection
-        """
-        self.sleep_until_collection_task = asyncio.create_task(asyncio.sleep(self.raid.time.secs_before_collection))
-        await self.sleep_until_collection_task
@@ -1,10 +1,14 @@
 """
 Contain class for producing raid items
 """
+import asyncio
+from typing import Dict, List
+
 from bdo_daily_bot.core.raid.raid import Raid
 from bdo_daily_bot.core.raid.raid_channel import RaidChannel
 from bdo_daily_bot.core.raid.raid_item import RaidItem
-from bdo_daily_bot.core.raid.raid_member import RaidMemberFactory
+from bdo_daily_bot.core.raid.raid_member import RaidMember, RaidMemberFactory
+from bdo_daily_bot.settings import settings
 
 
 class RaidItemFactory:
@@ -20,17 +24,38 @@ class RaidItemFactory:
         :param raid_item: main raid information
         :return: raid from raid item
         """
-        captain = await RaidMemberFactory.produce_by_nickname(raid_item.captain_name)
-        new_raid = Raid(
-            captain=captain,
-            bdo_server=raid_item.game_server,
-            time_leaving=raid_item.time_leaving,
-            time_reservation_open=raid_item.time_reservation_open,
-            reservation_count=raid_item.reservation_amount,
-        )
-        new_raid.time.creation_time = raid_item.creation_time
-        new_raid.members = await RaidMemberFactory.produce_by_list_of_attributes(raid_item.members)
-        new_raid.channels = await RaidChannel.get_channels_from_channels_info(raid_item.channels_info, new_raid)
+        return (await cls.get_raids([raid_item]))[0]
+
+    @classmethod
+    async def get_raids(cls, raid_items: List[RaidItem]) -> List[Raid]:
+        """
+        Gets raids from raid items
+
+        Captains of all raids are requested from the database with one request. Raids channels and messages
+        are restored concurrently, no more than settings.STARTUP_CONCURRENCY raids at the same time.
+
+        :param raid_items: main raids information
+        :return: raids from raid items
+        """
+        captains = await cls.__get_captains(raid_items)
+        slots = asyncio.Semaphore(settings.STARTUP_CONCURRENCY)
+        return list(await asyncio.gather(*(
+            cls.__hydrate_raid(raid_item, captains[raid_item.captain_name], slots) for raid_item in raid_items)))
+
+    @classmethod
+    async def __hydrate_raid(cls, raid_item: RaidItem, captain: RaidMember, slots: asyncio.Semaphore) -> Raid:
+        """
+        Create raid with members and channels from raid item
+
+        :param raid_item: main raid information
+        :param captain: raid captain
+        :param slots: semaphore that bounds amount of raids restored at the same time
+        :return: raid from raid item
+        """
+        async with slots:
+            new_raid = cls.__create_raid(raid_item, captain)
+            new_raid.members = await RaidMemberFactory.produce_by_list_of_attributes(raid_item.members)
+            new_raid.channels = await RaidChannel.get_channels_from_channels_info(raid_item.channels_info, new_raid)
         return new_raid
 
     @classmethod
@@ -41,7 +66,45 @@ class RaidItemFactory:
         :param raid_item: main raid information
         :return: raid from raid item
         """
-        captain = await RaidMemberFactory.produce_by_nickname(raid_item.captain_name)
+        return (await cls.lazy_get_raids([raid_item]))[0]
+
+    @classmethod
+    async def lazy_get_raids(cls, raid_items: List[RaidItem]) -> List[Raid]:
+        """
+        Gets raids from raid items without members and channels processing
+
+        Captains of all raids are requested from the database with one request.
+
+        :param raid_items: main raids information
+        :return: raids from raid items
+        """
+        captains = await cls.__get_captains(raid_items)
+        raids = []
+        for raid_item in raid_items:
+            new_raid = cls.__create_raid(raid_item, captains[raid_item.captain_name])
+            new_raid.members = raid_item.members
+            raids.append(new_raid)
+        return raids
+
+    @classmethod
+    async def __get_captains(cls, raid_items: List[RaidItem]) -> Dict[str, RaidMember]:
+        """
+        Gets captains of the given raid items
+
+        :param raid_items: main raids information
+        :return: captains by their nicknames
+        """
+        return await RaidMemberFactory.produce_by_nicknames(raid_item.captain_name for raid_item in raid_items)
+
+    @classmethod
+    def __create_raid(cls, raid_item: RaidItem, captain: RaidMember) -> Raid:
+        """
+        Create raid with main information from raid item
+
+        :param raid_item: main raid information
+        :param captain: raid captain
+        :return: raid without members and channels
+        """
         new_raid = Raid(
             captain=captain,
             bdo_server=raid_item.game_server,
@@ -50,5 +113,4 @@ class RaidItemFactory:
             reservation_count=raid_item.reservation_amount,
         )
         new_raid.time.creation_time = raid_item.creation_time
-        new_raid.members = raid_item.members
         return new_raid
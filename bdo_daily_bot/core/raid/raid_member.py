@@ -1,7 +1,7 @@
 """
 Module contain class for describing raid member
 """
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, Iterable, List, Optional, Union
 
 from discord import User
 
@@ -85,10 +85,27 @@ class RaidMemberFactory:
         :param nickname: member game name
         :return: raid member model
         """
-        if member_attributes := await cls.__database.user.find_user_by_nickname(nickname):
-            user = BdoDailyBot.bot.get_user(member_attributes.get('discord_id'))
-            return RaidMember(user, nickname)
-        return RaidMember(nickname=nickname)
+        return (await cls.produce_by_nicknames([nickname]))[nickname]
+
+    @classmethod
+    async def produce_by_nicknames(cls, nicknames: Iterable[str]) -> Dict[str, RaidMember]:
+        """
+        Return members by the given nicknames
+
+        Return members with the given nicknames and discord users. All users are requested
+        from the database with one request, discord users are taken from the bot cache.
+
+        :param nicknames: members game names
+        :return: raid member models by their nicknames
+        """
+        members = {nickname: RaidMember(nickname=nickname) for nickname in nicknames}
+        if not members:
+            return members
+        for member_attributes in await cls.__database.user.get_users_by_nicknames(list(members)):
+            nickname = member_attributes.get('nickname')
+            if user := BdoDailyBot.bot.get_user(member_attributes.get('discord_id')):
+                members[nickname] = RaidMember(user, nickname)
+        return members
 
     @classmethod
     async def produce_by_discord_user(cls, user: User) -> RaidMember:
@@ -115,12 +132,31 @@ class RaidMemberFactory:
         :param user_id: discord user id
         :return: raid member model
         """
-        if member_attributes := await cls.__database.user.get_user_by_id(user_id):
+        return (await cls.produce_by_discord_users_ids([user_id]))[user_id]
+
+    @classmethod
+    async def produce_by_discord_users_ids(cls, users_ids: Iterable[int]) -> Dict[int, RaidMember]:
+        """
+        Return members by the discord users ids
+
+        Return members with the given discord users and nicknames. All nicknames are requested
+        from the database with one request, discord users are taken from the bot cache.
+        Member is empty if user is not registered in the database.
+
+        :param users_ids: discord users ids
+        :return: raid member models by their discord users ids
+        """
+        members = {user_id: RaidMember() for user_id in users_ids}
+        if not members:
+            return members
+        for member_attributes in await cls.__database.user.get_users_by_ids(list(members)):
+            user_id = member_attributes.get('discord_id')
             nickname = member_attributes.get('nickname')
             if user := BdoDailyBot.bot.get_user(user_id):
-                return RaidMember(user, nickname)
-            return RaidMember(nickname=nickname)
-        return RaidMember()
+                members[user_id] = RaidMember(user, nickname)
+            else:
+                members[user_id] = RaidMember(nickname=nickname)
+        return members
 
     @classmethod
     def produce_by_attributes(cls, attributes: Dict[str, Union[str, int]]) -> RaidMember:
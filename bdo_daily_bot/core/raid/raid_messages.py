@@ -7,9 +7,13 @@ from abc import ABC, abstractmethod
 import discord
 from discord import Forbidden, HTTPException, NotFound, TextChannel
 
-from bdo_daily_bot.bot import BdoDailyBot
+from bdo_daily_bot.core.discord_cache.channel_registry import ChannelRegistry
+from bdo_daily_bot.core.discord_cache.message_resolver import MessageResolver
+from bdo_daily_bot.core.guild_managers.raids_keeper import RaidsKeeper
 from bdo_daily_bot.core.raid.raid import Raid
 from bdo_daily_bot.core.raid.raid_notifier import RaidNotifier
+from bdo_daily_bot.core.raid.table_render_pool import TableRenderPool
+from bdo_daily_bot.core.tools.request_scheduler import RequestPriority, RequestScheduler
 from bdo_daily_bot.core.users_interactor.message_reaction_interactor import MessagesReactions
 from bdo_daily_bot.messages import messages
 
@@ -44,6 +48,7 @@ class RaidMessage(ABC):
         """
         try:
             self.message = await self.channel.send(await self.text)
+            MessageResolver.remember(self.message)
             logging.info("{}/{}/{}: Raid {}/{}: Message was send".
                          format(self.type, self.channel.name, self.channel.guild.name,
                                 self.raid.captain.nickname, self.raid.time.normal_time_leaving))
@@ -62,10 +67,12 @@ class RaidMessage(ABC):
         """
         try:
             await self.message.delete()
+            MessageResolver.mark_deleted(self.channel.id, self.message.id)
             logging.info("{}/{}/{}: Raid {}/{}: Message was deleted".
                          format(self.type, self.channel.guild.name, self.channel.name,
                                    self.raid.captain.nickname, self.raid.time.normal_time_leaving))
         except NotFound:
+            MessageResolver.mark_deleted(self.channel.id, self.message.id)
             logging.warning("{}/{}/{}: Raid {}/{}: Failed to delete message. Message not found.".
                             format(self.type, self.channel.guild.name, self.channel.name,
                                    self.raid.captain.nickname, self.raid.time.normal_time_leaving))
@@ -81,13 +88,22 @@ class RaidMessage(ABC):
     async def update(self):
         """
         Update discord message
+
+        Edits waiting in the queue of the discord API requests are merged into the one edit.
         """
         if self.message:
+            message = self.message
+
+            async def edit_message():
+                await message.edit(content=await self.text)
+
             try:
-                await self.message.edit(content=await self.text)
+                await RequestScheduler.run(RequestPriority.MEDIUM, f"message/{self.channel.id}", edit_message,
+                                           coalesce_key=f"edit/{message.id}")
                 logging.info("{}/{}/{}: Message was edited".
                              format(self.type, self.channel.guild.name, self.channel.name))
             except NotFound:
+                MessageResolver.mark_deleted(self.channel.id, self.message.id)
                 logging.info("{}/{}/{}: Message was not edited. Not found. Sending new".
                              format(self.type, self.channel.guild.name, self.channel.name))
                 await self.send()
@@ -100,7 +116,7 @@ class RaidMessage(ABC):
 
         :param channel_id: discord channel id
         """
-        self.channel = BdoDailyBot.bot.get_channel(channel_id)
+        self.channel = await ChannelRegistry.get_or_fetch(channel_id)
 
     async def set_message(self, message_id: int):
         """
@@ -109,7 +125,7 @@ class RaidMessage(ABC):
         :param message_id: discord message id
         """
         if self.channel:
-            self.message = await self.channel.fetch_message(message_id)
+            self.message = await MessageResolver.get_message(self.channel, message_id)
         else:
             logging.error("{}: Raid {}/{}: Can't set message. Missed channel"
                           .format(self.type, self.raid.captain.nickname, self.raid.time.normal_time_leaving))
@@ -170,10 +186,14 @@ class RaidCollectionMessage(RaidMessage):
 
     async def send(self):
         """
-        Send collection message and add collection reaction
+        Send collection message, index it and add collection reaction
         """
         await super().send()
-        await self.message.add_reaction(MessagesReactions.COLLECTION_EMOJI)
+        if self.message:
+            RaidsKeeper.add_collection_message(self.raid, self.message.id)
+            message = self.message
+            await RequestScheduler.run(RequestPriority.MEDIUM, f"reaction/{self.channel.id}",
+                                       lambda: message.add_reaction(MessagesReactions.COLLECTION_EMOJI))
 
 
 class RaidTableMessage(RaidMessage):
@@ -200,7 +220,9 @@ class RaidTableMessage(RaidMessage):
         """
         Send message with table file
         """
-        self.message = await self.channel.send(file=discord.File(self.raid.table.create_table()))
+        table_image = await TableRenderPool.render(self.raid.table)
+        self.message = await self.channel.send(file=discord.File(table_image, filename=self.raid.table.file_name))
+        MessageResolver.remember(self.message)
 
     async def update(self):
         """
@@ -29,12 +29,6 @@ class RaidNotifier:
 
         :param raid: raid to notify
         """
-        secs_before_notification = raid.time.secs_before_notification
-        if secs_before_notification < 0:
-            logging.info("Raid {}/{}: Members will not be notified. Little time left before raid left".
-                         format(raid.captain.nickname, raid.time.normal_time_leaving))
-            return
-        await cls.__wait_until_notification_time(raid.time.secs_before_notification)
         await cls.__notify_users(raid)
         if raid.captain not in raid.members:
             await cls.__notify_captain_about_leaving(raid.captain.nickname)
@@ -74,15 +68,18 @@ class RaidNotifier:
         """
         Send notification message to raid members
 
+        First notifications and leaving notifications are sent concurrently through the direct messages
+        dispatcher, the fact of receipt the first notification is saved for all members with the one request.
+
         :param raid: raid to notify
         """
         if raid.members:
             member_nicknames = [member.nickname for member in raid.members]
             users_documents = await cls.__database.user.get_users_by_nicknames(member_nicknames)
-            for user, user_document in cls.__users_generator(users_documents):
-                if not user_document.get('first_notification'):
-                    await cls.__send_first_notification(user)
-                await UsersSender.send_to_member_leaving_notification(user)
+            users = list(cls.__users_generator(users_documents))
+            users_to_introduce = [user for user, user_document in users if not user_document.get('first_notification')]
+            await cls.__send_first_notifications(users_to_introduce)
+            await asyncio.gather(*(UsersSender.send_to_member_leaving_notification(user) for user, _ in users))
 
     @classmethod
     async def __send_first_notification(cls, user: User):
@@ -91,19 +88,25 @@ class RaidNotifier:
 
         :param user: user to send first notification message
         """
-        message = await UsersSender.send_first_notification_message(user)
-        await cls.__database.user.set_first_notification(user.id)
-        await MessageReactionInteractor.set_notification_controller(message)
-        logging.info("Private/{}: First notification message was sent".format(user.name))
+        await cls.__send_first_notifications([user])
 
     @classmethod
-    async def __wait_until_notification_time(cls, secs_before_notification: int):
+    async def __send_first_notifications(cls, users: List[User]):
         """
-        Sleep time before send notification to raid members
+        Send first notification messages to users
 
-        :param secs_before_notification: seconds before notification
+        :param users: users to send first notification message
         """
-        await asyncio.sleep(secs_before_notification)
+        if not users:
+            return
+        notification_messages = await asyncio.gather(*(
+            UsersSender.send_first_notification_message(user) for user in users))
+        await cls.__database.user.set_first_notifications([user.id for user in users])
+        for user, message in zip(users, notification_messages):
+            if not message:
+                continue
+            await MessageReactionInteractor.set_notification_controller(message)
+            logging.info("Private/{}: First notification message was sent".format(user.name))
 
     @classmethod
     def __users_generator(cls, raid_members_documents: List[Dict[str, str]]) \
@@ -1,19 +1,26 @@
 """
 Contain class for producing raid table image
 """
+import io
 import os
 import random
+import threading
+from functools import lru_cache
+from typing import Optional, Tuple
 
 import cv2
 import numpy as np
 from PIL import Image, ImageDraw, ImageFont
 
-from bdo_daily_bot.settings.settings import BOT_DATA_PATH
-
 
 class RaidTable:
     """
     Class for producing raid table images
+
+    Static table grid with the reservation band is cached per table width and reservation count. Table keeps
+    the last rendered image and redraws only the nickname rows that were changed since the last render.
+    If raid members and reservation count were not changed, then the last encoded image is returned
+    without rendering.
     """
     # Text settings
 
@@ -41,45 +48,215 @@ class RaidTable:
     # Table frame
     COLUMNS = 21
     LINE_WIDTH = 1
+    ROW_HEIGHT = HEIGHT // COLUMNS  # px
+    RESERVATION_COLOR = (0, 0, 255)  # bgr
+
+    # Image state that affects rendering: title, members nicknames and reservation count
+    TableState = Tuple[str, Tuple[str, ...], int]
 
     def __init__(self, raid):
         self.raid = raid
-        self.old_member_dict = self.raid.members.copy()
-        self.old_reservation_count = self.raid.reservation_count
-        self.title = f"{self.raid.captain.nickname} {self.raid.bdo_server} {self.raid.time.normal_time_leaving}"
-        self.table_path = None
-
-    def get_width(self):
-        title_width = RaidTable.FONT.getsize(self.title)[0]
-        if self.raid.members:
-            max_name = max([member.nickname for member in self.raid.members])
+        # Random title colour chosen once, so the title row is stable between renders
+        # RGB(..., ..., ...). ... - [0: 255]. For readability exclude absolute white and black colors
+        self.title_color = (random.randrange(30, 230), random.randrange(30, 230), random.randrange(30, 230))
+
+        self.__rendered_state: Optional[RaidTable.TableState] = None
+        self.__base_image: Optional[np.ndarray] = None
+        self.__image: Optional[np.ndarray] = None
+        self.__png: Optional[bytes] = None
+        # Table can be rendered from the rendering pool threads
+        self.__lock = threading.Lock()
+
+    @property
+    def title(self) -> str:
+        """
+        Gets title of the raid table
+
+        :return: raid table title
+        """
+        return f"{self.raid.captain.nickname} {self.raid.bdo_server} {self.raid.time.normal_time_leaving}"
+
+    @property
+    def file_name(self) -> str:
+        """
+        Gets file name of the raid table image to upload
+
+        :return: raid table image file name
+        """
+        return f"{self.raid.captain.nickname}_{self.raid.time.kebab_time_leaving}.png"
+
+    @property
+    def state(self) -> TableState:
+        """
+        Gets current raid state that affects table image
+
+        :return: title, members nicknames and reservation count
+        """
+        return self.title, tuple(member.nickname for member in self.raid.members), self.raid.reservation_count
+
+    def get_width(self) -> int:
+        """
+        Gets width of the raid table image for the current raid state
+
+        :return: raid table image width
+        """
+        title, nicknames, _ = self.state
+        return self.__get_width(title, nicknames)
+
+    def render(self, state: Optional[TableState] = None) -> bytes:
+        """
+        Render raid table image and encode it as PNG
+
+        Rerender only changed nickname rows of the last image. Return the last encoded image if
+        raid table state was not changed.
+
+        :param state: raid table state to render. Current raid state if not specified
+        :return: PNG encoded raid table image
+        """
+        with self.__lock:
+            return self.__render(state or self.state)
+
+    def create_table(self) -> io.BytesIO:
+        """
+        Render raid table image in memory
+
+        :return: buffer with PNG encoded raid table image
+        """
+        return io.BytesIO(self.render())
+
+    def __render(self, state: TableState) -> bytes:
+        """
+        Render raid table image and encode it as PNG without locking
+
+        :param state: raid table state to render
+        :return: PNG encoded raid table image
+        """
+        if state == self.__rendered_state and self.__png:
+            return self.__png
+
+        title, nicknames, reservation_count = state
+        width = self.__get_width(title, nicknames)
+        if self.__is_base_changed(state, width):
+            self.__base_image = self.__create_base_image(width, title, reservation_count)
+            self.__image = self.__base_image.copy()
+            changed_rows = list(range(len(nicknames)))
+        else:
+            old_nicknames = self.__rendered_state[1]
+            changed_rows = [row for row in range(max(len(old_nicknames), len(nicknames)))
+                            if old_nicknames[row:row + 1] != nicknames[row:row + 1]]
+
+        if changed_rows:
+            self.__draw_rows(nicknames, min(changed_rows), max(changed_rows))
+
+        self.__png = cv2.imencode('.png', self.__image)[1].tobytes()
+        self.__rendered_state = state
+        return self.__png
+
+    @classmethod
+    def __get_width(cls, title: str, nicknames: Tuple[str, ...]) -> int:
+        """
+        Gets width of the raid table image with the given title and nicknames
+
+        :param title: raid table title
+        :param nicknames: members nicknames
+        :return: raid table image width
+        """
+        title_width = RaidTable.FONT.getsize(title)[0]
+        if nicknames:
+            max_name = max(nicknames)
             max_name_row_width = RaidTable.NUMBER_SIZE_WIDTH + RaidTable.FONT.getsize(max_name)[0]
             # 15 - 15px - offset the indent
             return max(title_width, max_name_row_width) + 15
         # 15 - 15px - offset the indent
         return title_width + 15
 
-    def create_table(self):
-        width = self.get_width()
-        # Build frame of table
+    def __is_base_changed(self, state: TableState, width: int) -> bool:
+        """
+        Check that table image without nicknames should be created again
+
+        :param state: current raid table state
+        :param width: current raid table width
+        :return: True if title, reservation count or width were changed else False
+        """
+        if self.__rendered_state is None or self.__image is None:
+            return True
+        old_title, _, old_reservation_count = self.__rendered_state
+        title, _, reservation_count = state
+        return old_title != title or old_reservation_count != reservation_count or self.__image.shape[1] != width
+
+    def __create_base_image(self, width: int, title: str, reservation_count: int) -> np.ndarray:
+        """
+        Create table image with grid, reservation band and title, but without nicknames
+
+        :param width: table width
+        :param title: table title
+        :param reservation_count: amount of reserved rows
+        :return: table image without nicknames
+        """
+        img = self.__get_grid(width, reservation_count).copy()
+
+        # Create colour block in top title
+        start_point = (0, RaidTable.ROW_HEIGHT)
+        end_point = (width, 0)
+        rect_thickness = -1
+        cv2.rectangle(img, start_point, end_point, self.title_color, rect_thickness)
+
+        # Draw name of captain in title
+        img_pil = Image.fromarray(img)
+        ImageDraw.Draw(img_pil).text((5, 0), title, font=RaidTable.FONT, fill=(0, 0, 0, 0))
+        return np.array(img_pil)
+
+    def __draw_rows(self, nicknames: Tuple[str, ...], first_row: int, last_row: int):
+        """
+        Redraw nickname rows from the first to the last row of the current image
+
+        Rows are restored from the base image and nicknames are drawn on the piece of the image with
+        the neighbour rows, so text that goes beyond its row is drawn exactly as on the whole image.
+
+        :param nicknames: members nicknames to draw
+        :param first_row: index of the first nickname row to redraw
+        :param last_row: index of the last nickname row to redraw
+        """
+        top = RaidTable.ROW_HEIGHT * (first_row + 1)
+        bottom = min(RaidTable.ROW_HEIGHT * (last_row + 3), RaidTable.HEIGHT)
+        piece_top = max(top - RaidTable.ROW_HEIGHT, 0)
+        piece_bottom = min(bottom + RaidTable.ROW_HEIGHT, RaidTable.HEIGHT)
+
+        piece = Image.fromarray(self.__base_image[piece_top:piece_bottom])
+        draw = ImageDraw.Draw(piece)
+        for row, name in enumerate(nicknames):
+            name_top = RaidTable.ROW_HEIGHT * (row + 1)
+            if piece_top - RaidTable.ROW_HEIGHT <= name_top < piece_bottom:
+                draw.text((35, name_top - piece_top), name, font=RaidTable.FONT, fill=(0, 0, 0, 0))
+        self.__image[top:bottom] = np.asarray(piece)[top - piece_top:bottom - piece_top]
+
+    @classmethod
+    @lru_cache(maxsize=64)
+    def __get_grid(cls, width: int, reservation_count: int) -> np.ndarray:
+        """
+        Create or get cached table grid with numeration and reservation band for the given width
+
+        :param width: table width
+        :param reservation_count: amount of reserved rows
+        :return: white image with table grid. Must be copied before drawing
+        """
         # Create white image
         img = np.zeros((RaidTable.HEIGHT, width, 3), np.uint8)
         img[::, ::] = 255
 
-        # Draw reservation red space
+        # Draw reservation red space before the grid, so the numbers are anti-aliased over it
         start_point = (0, RaidTable.HEIGHT)
-        end_point = (width, RaidTable.HEIGHT - RaidTable.HEIGHT // RaidTable.COLUMNS * self.raid.reservation_count)
-        color = (0, 0, 255)
+        end_point = (width, RaidTable.HEIGHT - RaidTable.ROW_HEIGHT * reservation_count)
         rect_thickness = -1  # Thickness of -1 px will fill the rectangle shape by the specified color
-        cv2.rectangle(img, start_point, end_point, color, rect_thickness)
+        cv2.rectangle(img, start_point, end_point, RaidTable.RESERVATION_COLOR, rect_thickness)
 
         # Draw lines of table
-        for number in range(21):
+        for number in range(RaidTable.COLUMNS):
             # Set bottom left and top right coordinate of 21 rectangles
-            start_point = 0, (RaidTable.HEIGHT // RaidTable.COLUMNS) * (number + 1)
-            end_point = width - RaidTable.LINE_WIDTH // 2, (RaidTable.HEIGHT // RaidTable.COLUMNS) * number
+            start_point = 0, RaidTable.ROW_HEIGHT * (number + 1)
+            end_point = width - RaidTable.LINE_WIDTH // 2, RaidTable.ROW_HEIGHT * number
             # Set coordinate of numerations
-            point_number = 2, (RaidTable.HEIGHT // RaidTable.COLUMNS) * (number + 1) - 4
+            point_number = 2, RaidTable.ROW_HEIGHT * (number + 1) - 4
             # Draw 21 rectangles
             cv2.rectangle(img, start_point, end_point, (0, 0, 0), RaidTable.LINE_WIDTH)
             if number > 0:  # Draw numeration of 20 columns
@@ -100,56 +277,8 @@ class RaidTable:
         color = (0, 0, 0)
         rect_thickness = 1
         cv2.rectangle(img, start_point, end_point, color, rect_thickness)
-
-        # Create random color block in top title
-        start_point = (0, RaidTable.HEIGHT // RaidTable.COLUMNS)
-        end_point = (width, 0)
-        # RGB(..., ..., ...). ... - [0: 255]. For readability exclude absolute white and black colors
-        color_title = (random.randrange(30, 230), random.randrange(30, 230), random.randrange(30, 230))
-        rect_thickness = -1
-        cv2.rectangle(img, start_point, end_point, color_title, rect_thickness)
-
-        # Writing text on table
-        # Change type to work with Pillow
-        img_pil = Image.fromarray(img)
-        draw = ImageDraw.Draw(img_pil)
-        # Fill table by members list
-        name_number = 0
-        members_nicknames = [member.nickname for member in self.raid.members]
-        for name in members_nicknames:
-            # Set coordinate of text message
-            point_name = 35, (RaidTable.HEIGHT // RaidTable.COLUMNS * (name_number + 1))
-            draw.text(point_name, name, font=RaidTable.FONT, fill=(0, 0, 0, 0))
-            name_number += 1
-
-        # Draw name of captain in title
-        draw.text((5, 0), self.title, font=RaidTable.FONT, fill=(0, 0, 0, 0))
-
-        # Changing type back into NumPy array
-        img = np.array(img_pil)
-
-        self._save(img)
-        return self.table_path
-
-    def update_table(self, raid):
-        if not self.old_member_dict == raid.members or not self.old_reservation_count == raid.reservation_count:
-            self.__init__(raid)
-            self.old_member_dict = raid.members.copy()
-            self.old_reservation_count = raid.reservation_count
-            self.create_table()
-        else:
-            return
-
-    def _save(self, img):
-        # Save image on local storage
-        # Find dir 'images'. If not - create
-        self.table_path = os.path.join(BOT_DATA_PATH, 'images')
-        if not os.path.isdir(self.table_path):
-            os.mkdir(self.table_path)
-
-        file_name = self.raid.captain.nickname + '_' + str(self.raid.time.kebab_time_leaving) + ".png"
-        self.table_path = os.path.join(self.table_path, file_name)
-        cv2.imwrite(self.table_path, img)
+        img.setflags(write=False)
+        return img
 
     def create_text_table(self):
         table = f"{self.title}\n"
@@ -11,6 +11,8 @@ class RaidTime:
     """
     __time_to_wait_after_leaving = timedelta(minutes=10)
     __time_to_notify_before_leaving = timedelta(minutes=7)
+    # Seconds before leaving to display raid table. Then display every hour before the last of them
+    __secs_to_display_before_leaving = [0, 60, 360, 960, 1860, 3660]
 
     def __init__(self, time_leaving: datetime, time_reservation_open: datetime):
         """
@@ -21,7 +23,7 @@ class RaidTime:
         self.time_reservation_open = time_reservation_open
         self.creation_time = None
 
-        self.secs_to_display_list = self.__set_secs_list_before_display()
+        self.display_times = self.__get_display_times()
 
     @property
     def kebab_time_leaving(self) -> str:
@@ -66,8 +68,10 @@ class RaidTime:
 
         :return: raid time leaving in human format
         """
-        if self.secs_to_display_list:
-            return (datetime.now() + timedelta(seconds=self.secs_to_display_list[-1])).strftime('%H:%M')
+        now = datetime.now()
+        for display_time in self.display_times:
+            if display_time > now:
+                return display_time.strftime('%H:%M')
         return self.kebab_time_leaving
 
     @property
@@ -77,25 +81,16 @@ class RaidTime:
 
         :return: time when raid channel will be deleted in human format
         """
-        return (self.time_leaving + self.__time_to_wait_after_leaving).strftime('%H:%M')
+        return self.time_channel_deleting.strftime('%H:%M')
 
     @property
-    def secs_before_collection(self) -> int:
+    def time_channel_deleting(self) -> datetime:
         """
-        Returns seconds before raid start collection
+        Returns time when raid channel will be deleted
 
-        :return: seconds before collection
+        :return: time when raid channel will be deleted
         """
-        return int((self.time_reservation_open - datetime.now()).total_seconds())
-
-    @property
-    def secs_after_leaving(self) -> int:
-        """
-        Returns seconds after raid left
-
-        :return: seconds after raid left
-        """
-        return int(self.__time_to_wait_after_leaving.total_seconds())
+        return self.time_leaving + self.__time_to_wait_after_leaving
 
     @property
     def time_to_notify(self) -> datetime:
@@ -104,65 +99,25 @@ class RaidTime:
         """
         return self.time_leaving - self.__time_to_notify_before_leaving
 
-    @property
-    def secs_before_notification(self) -> float:
-        """
-        Return seconds before time raid members notification
-        """
-        return (self.time_to_notify - datetime.now()).total_seconds()
-
-    def get_secs_to_display_generator(self) -> int:
-        """
-        Returns generator that returns seconds to next display
-
-        :return: seconds to next display
-        """
-        for _ in range(len(self.secs_to_display_list)):
-            yield self.secs_to_display_list[-1]
-            self.secs_to_display_list.pop()
-
-    def __set_secs_list_before_display(self) -> List[int]:
-        """
-        Gets list of seconds before display
-
-        Gets list of seconds before 1, 5, 15, 30, 60 and 1 hours before display
-        """
-        secs_to_display_list = []
-        if self.time_reservation_open > datetime.now():
-            time_difference = self.time_leaving - self.time_reservation_open
-        else:
-            time_difference = self.time_leaving - datetime.now()
-        if time_difference.total_seconds() < 0:
-            return secs_to_display_list
-        time_difference_seconds = time_difference.total_seconds()
-
-        # If difference is greater than minute display at 1 minute before leaving and moment of leaving
-        if time_difference_seconds > 60:
-            secs_to_display_list.append(60)
-            time_difference_seconds -= 60
-        # If difference is less than minute then just wait it
-        else:
-            secs_to_display_list.append(time_difference_seconds)
-        # If difference is greater than 5 minutes display at 5 minutes before leaving
-        if time_difference_seconds > 300:
-            secs_to_display_list.append(300)
-            time_difference_seconds -= 300
-        # If difference is greater than 15 minutes display at 15 minutes before leaving
-        if time_difference_seconds > 600:
-            secs_to_display_list.append(600)
-            time_difference_seconds -= 600
-        # If difference is greater than 30 minutes display at 30 minutes before leaving
-        if time_difference_seconds > 900:
-            secs_to_display_list.append(900)
-            time_difference_seconds -= 900
-        # If difference is greater than 60 minutes display at 60 minutes before leaving
-        if time_difference_seconds > 1800:
-            secs_to_display_list.append(1800)
-            time_difference_seconds -= 1800
-        hours_left_to_display = int(time_difference_seconds // 3600)
-        if hours_left_to_display:
-            for _ in range(hours_left_to_display):
-                secs_to_display_list.append(3600)
-            time_difference_seconds -= hours_left_to_display * 3600
-        secs_to_display_list[-1] += time_difference_seconds
-        return secs_to_display_list
+    def __get_display_times(self) -> List[datetime]:
+        """
+        Gets times to display raid table
+
+        Raid table is displayed at the leaving, 1, 6, 16, 31 and 61 minutes before leaving and then every hour
+        after the collection start. The farthest display time is skipped, because the table is displayed
+        at the collection start. Display times are absolute, so raids with the same time leaving are
+        displayed at the same time.
+
+        :return: ascending display times
+        """
+        time_difference_seconds = (self.time_leaving - max(self.time_reservation_open, datetime.now())).total_seconds()
+        if time_difference_seconds < 0:
+            return []
+
+        secs_to_display = list(self.__secs_to_display_before_leaving)
+        while secs_to_display[-1] + 3600 < time_difference_seconds:
+            secs_to_display.append(secs_to_display[-1] + 3600)
+        secs_to_display = [secs for secs in secs_to_display if secs < time_difference_seconds] or [0]
+        if len(secs_to_display) > 1:
+            secs_to_display.pop()
+        return [self.time_leaving - timedelta(seconds=secs) for secs in reversed(secs_to_display)]
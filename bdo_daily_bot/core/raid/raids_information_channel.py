@@ -8,10 +8,12 @@ from discord import CategoryChannel, Colour, Embed, Guild, Message, NotFound, Te
 
 from bdo_daily_bot.bot import BdoDailyBot
 from bdo_daily_bot.core.database.manager import DatabaseManager
+from bdo_daily_bot.core.discord_cache.message_resolver import MessageResolver
 from bdo_daily_bot.core.guild_managers.raids_keeper import RaidsKeeper
 from bdo_daily_bot.core.raid.raid import Raid
 from bdo_daily_bot.core.raid.raid_channel import RaidChannel
 from bdo_daily_bot.core.raid.raid_item_factory import RaidItemFactory
+from bdo_daily_bot.core.tools.request_scheduler import RequestPriority, RequestScheduler
 from bdo_daily_bot.core.users_interactor.common import pin_message
 from bdo_daily_bot.messages import messages
 from bdo_daily_bot.settings import settings
@@ -61,19 +63,31 @@ class RaidsInformationChannel:
     async def update_active_raids_message(self):
         """
         Update active raids message in the information channel
+
+        The cosmetic edit has low priority, edits waiting in the queue are merged into the one edit.
         """
+        message = self.active_raids_message
         try:
-            await self.active_raids_message.edit(embed=self.__active_raids_status_embed())
+            await RequestScheduler.run(RequestPriority.LOW, f"message/{message.channel.id}",
+                                       lambda: message.edit(embed=self.__active_raids_status_embed()),
+                                       coalesce_key=f"edit/{message.id}")
         except NotFound:
             await self.__send_active_raids_message()
 
     async def update_yesterday_raids_message(self):
         """
         Update yesterday raids message in the information channel
+
+        The cosmetic edit has low priority, edits waiting in the queue are merged into the one edit.
         """
+        message = self.yesterday_raids_message
+
+        async def edit_message():
+            await message.edit(embed=await self.__yesterday_raids_status_embed())
+
         try:
-            embed = await self.__yesterday_raids_status_embed()
-            await self.yesterday_raids_message.edit(embed=embed)
+            await RequestScheduler.run(RequestPriority.LOW, f"message/{message.channel.id}", edit_message,
+                                       coalesce_key=f"edit/{message.id}")
         except NotFound:
             await self.__send_yesterday_raids_message()
 
@@ -93,10 +107,7 @@ class RaidsInformationChannel:
         :param message_id: discord message id to find
         :return: discord message if was found else None
         """
-        async for message in channel.history(limit=100):
-            if message.id == message_id:
-                return message
-        return None
+        return await MessageResolver.get_message(channel, message_id)
 
     async def __init_channel(self, information_channel_attributes: Dict[str, int]):
         """
@@ -165,6 +176,7 @@ class RaidsInformationChannel:
         """
         embed = self.__active_raids_status_embed()
         self.active_raids_message = await self.channel.send(embed=embed)
+        MessageResolver.remember(self.active_raids_message)
         await pin_message(self.active_raids_message)
 
     async def __send_yesterday_raids_message(self):
@@ -173,6 +185,7 @@ class RaidsInformationChannel:
         """
         embed = await self.__yesterday_raids_status_embed()
         self.yesterday_raids_message = await self.channel.send(embed=embed)
+        MessageResolver.remember(self.yesterday_raids_message)
         await pin_message(self.yesterday_raids_message)
 
     async def __save(self):
@@ -229,10 +242,7 @@ class RaidsInformationChannel:
 
         :return: list of the yesterday raids
         """
-        yesterday_raids = []
-        for raid_item in await self.__database.raid_archive.get_yesterday_raids():
-            yesterday_raids.append(await RaidItemFactory.lazy_get_raid(raid_item))
-        return yesterday_raids
+        return await RaidItemFactory.lazy_get_raids(await self.__database.raid_archive.get_yesterday_raids())
 
     async def __yesterday_raids_status_embed(self):
         """
@@ -0,0 +1,170 @@
+"""
+Contain pool for rendering raid table images out of the bot event loop
+"""
+import asyncio
+import io
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Dict, Optional
+
+from bdo_daily_bot.core.raid.raid_table import RaidTable
+from bdo_daily_bot.settings import settings
+
+
+@dataclass
+class RenderMetrics:
+    """Class for keeping raid table rendering metrics"""
+    renders: int = 0
+    coalesced: int = 0
+    queue_depth: int = 0
+    max_queue_depth: int = 0
+    last_latency: float = 0
+    max_latency: float = 0
+    total_latency: float = 0
+    total_wait_time: float = 0
+
+    @property
+    def average_latency(self) -> float:
+        """
+        Gets average render latency in seconds including waiting in the queue
+
+        :return: average render latency
+        """
+        return self.total_latency / self.renders if self.renders else 0
+
+    @property
+    def average_wait_time(self) -> float:
+        """
+        Gets average time in seconds that render requests wait in the queue
+
+        :return: average wait time in the queue
+        """
+        return self.total_wait_time / self.renders if self.renders else 0
+
+
+class TableRenderPool:
+    """
+    Render raid table images in the thread pool
+
+    OpenCV and Pillow release GIL while drawing and encoding, so rendering in threads doesn't stall the
+    bot event loop. Amount of render requests sent to the pool is bounded, others wait in the event loop.
+    Every table has at most one waiting render, further render requests of the table wait the same render,
+    so the queue is bounded by the amount of the tables.
+    """
+    metrics = RenderMetrics()
+
+    __executor: Optional[ThreadPoolExecutor] = None
+    __queue_slots: Optional[asyncio.Semaphore] = None
+    # Structure: {raid_table: render_task}
+    __waiting_renders: Dict[RaidTable, asyncio.Task] = {}
+
+    @classmethod
+    async def render(cls, table: RaidTable) -> io.BytesIO:
+        """
+        Render the given raid table in the pool
+
+        Join the waiting render of the table if it exists. Raid table state is taken in the event loop when
+        the render gets the place in the pool, so the waiting render draws the latest table.
+
+        :param table: raid table to render
+        :return: buffer with PNG encoded raid table image
+        """
+        if render_task := cls.__waiting_renders.get(table):
+            cls.metrics.coalesced += 1
+        else:
+            render_task = cls.__waiting_renders[table] = asyncio.ensure_future(cls.__render(table))
+        return io.BytesIO(await asyncio.shield(render_task))
+
+    @classmethod
+    async def __render(cls, table: RaidTable) -> bytes:
+        """
+        Wait for the place in the pool and render the given raid table
+
+        :param table: raid table to render
+        :return: PNG encoded raid table image
+        """
+        request_time = time.perf_counter()
+        cls.__update_queue_depth(1)
+        try:
+            async with cls.__get_queue_slots():
+                cls.__forget_waiting_render(table)
+                state = table.state
+                start_time = time.perf_counter()
+                png = await asyncio.get_running_loop().run_in_executor(cls.__get_executor(), table.render, state)
+        finally:
+            cls.__forget_waiting_render(table)
+            cls.__update_queue_depth(-1)
+        cls.__update_latency(start_time - request_time, time.perf_counter() - request_time, table)
+        return png
+
+    @classmethod
+    def __forget_waiting_render(cls, table: RaidTable):
+        """
+        Remove the current render task from the waiting renders, so new requests start new render
+
+        :param table: raid table of the current render task
+        """
+        if cls.__waiting_renders.get(table) is asyncio.current_task():
+            cls.__waiting_renders.pop(table)
+
+    @classmethod
+    def shutdown(cls):
+        """
+        Stop rendering pool threads
+        """
+        if cls.__executor:
+            cls.__executor.shutdown(wait=False)
+            cls.__executor = None
+
+    @classmethod
+    def __get_executor(cls) -> ThreadPoolExecutor:
+        """
+        Gets or create rendering threads pool
+
+        :return: rendering threads pool
+        """
+        if not cls.__executor:
+            cls.__executor = ThreadPoolExecutor(max_workers=settings.RENDER_POOL_SIZE,
+                                                thread_name_prefix="raid_table_render")
+        return cls.__executor
+
+    @classmethod
+    def __get_queue_slots(cls) -> asyncio.Semaphore:
+        """
+        Gets or create semaphore that bounds amount of render requests in the pool
+
+        :return: semaphore with render queue places
+        """
+        if not cls.__queue_slots:
+            cls.__queue_slots = asyncio.Semaphore(settings.RENDER_QUEUE_SIZE)
+        return cls.__queue_slots
+
+    @classmethod
+    def __update_queue_depth(cls, difference: int):
+        """
+        Update current and maximum amount of render requests
+
+        :param difference: amount of added or removed render requests
+        """
+        cls.metrics.queue_depth += difference
+        cls.metrics.max_queue_depth = max(cls.metrics.max_queue_depth, cls.metrics.queue_depth)
+
+    @classmethod
+    def __update_latency(cls, wait_time: float, latency: float, table: RaidTable):
+        """
+        Update render latency metrics and report slow renders
+
+        :param wait_time: seconds that render request waited for the place in the pool
+        :param latency: seconds from render request to rendered image
+        :param table: rendered raid table
+        """
+        cls.metrics.renders += 1
+        cls.metrics.last_latency = latency
+        cls.metrics.max_latency = max(cls.metrics.max_latency, latency)
+        cls.metrics.total_latency += latency
+        cls.metrics.total_wait_time += wait_time
+        if latency > settings.RENDER_SLOW_LATENCY:
+            logging.warning("Raid table {}: Slow render {:.3f}s, waited in queue {:.3f}s, queue depth {}".
+                            format(table.title, latency, wait_time, cls.metrics.queue_depth))
@@ -0,0 +1,39 @@
+"""
+Contain function for running the same discord operation for several channels concurrently
+"""
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Iterable, List, Optional, TypeVar
+
+from bdo_daily_bot.settings import settings
+
+Item = TypeVar("Item")
+
+
+async def fan_out(items: Iterable[Item], operation: Callable[[Item], Awaitable[Any]], *,
+                  limit: Optional[int] = None, description: str = "operation") -> List[Any]:
+    """
+    Run given operation for every item concurrently and gather results
+
+    Operations with different channels use different discord rate limit buckets and requests to the same
+    bucket are queued by the discord client, so only amount of the simultaneous requests is bounded.
+    Error of one operation doesn't stop others. It is logged and returned in the results in place of the
+    operation result.
+
+    :param items: items to run operation for, for example raid channels
+    :param operation: coroutine function to run for every item
+    :param limit: maximum amount of the simultaneous operations. settings.FAN_OUT_CONCURRENCY if not specified
+    :param description: operation description for logs
+    :return: operations results or errors in the order of the given items
+    """
+    slots = asyncio.Semaphore(limit or settings.FAN_OUT_CONCURRENCY)
+
+    async def run(item: Item) -> Any:
+        async with slots:
+            try:
+                return await operation(item)
+            except Exception as error:
+                logging.warning("Failed {} for {}.\nError: {}".format(description, item, error))
+                return error
+
+    return await asyncio.gather(*(run(item) for item in items))
@@ -0,0 +1,357 @@
+"""
+Contain scheduler that sends discord API requests of all subsystems in the priority order
+"""
+import asyncio
+import logging
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from enum import IntEnum
+from typing import Any, Awaitable, Callable, Deque, Dict, Optional, Set, Tuple
+
+from discord import HTTPException
+
+from bdo_daily_bot.settings import settings
+
+
+class RequestPriority(IntEnum):
+    """Priority classes of the discord API requests. Requests with the lower value are sent first"""
+    HIGH = 0
+    MEDIUM = 1
+    LOW = 2
+
+
+@dataclass
+class TokenBucket:
+    """Class for keeping requests tokens of the one discord API route"""
+    capacity: int
+    period: float
+    tokens: float = field(init=False)
+    updated_at: float = field(default_factory=time.monotonic)
+
+    def __post_init__(self):
+        self.tokens = self.capacity
+
+    @property
+    def is_full(self) -> bool:
+        """
+        Check that the bucket has all tokens, so it is the same as the new one
+
+        :return: True if bucket is full else False
+        """
+        self.refill()
+        return self.tokens >= self.capacity
+
+    def refill(self):
+        """
+        Add tokens regenerated since the last refill
+        """
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.capacity / self.period)
+        self.updated_at = now
+
+    def get_wait_time(self) -> float:
+        """
+        Gets seconds until the next token
+
+        :return: seconds to wait the token, 0 if token is available
+        """
+        self.refill()
+        return max(0.0, (1 - self.tokens) * self.period / self.capacity)
+
+    def take(self):
+        """
+        Take one token
+        """
+        self.tokens -= 1
+
+    def drain(self):
+        """
+        Take all tokens, for example after the rate limited response
+        """
+        self.refill()
+        self.tokens = min(self.tokens, 0)
+
+
+@dataclass
+class PriorityMetrics:
+    """Class for keeping discord API requests metrics of the one priority class"""
+    queue_depth: int = 0
+    max_queue_depth: int = 0
+    submitted: int = 0
+    completed: int = 0
+    failed: int = 0
+    dropped: int = 0
+    coalesced: int = 0
+
+
+@dataclass
+class PendingRequest:
+    """Class for keeping discord API request waiting in the queue"""
+    priority: RequestPriority
+    route: str
+    request: Callable[[], Awaitable[Any]] = field(repr=False)
+    coalesce_key: Optional[str] = None
+    future: Optional[asyncio.Future] = field(default=None, repr=False)
+
+
+class RequestScheduler:
+    """
+    Send discord API requests of all subsystems from the priority queues
+
+    Requests are taken in the priority order: user replies and joins, then raid collection edits and then
+    cosmetic updates like the information embeds and success reactions. Every route has the token bucket
+    with the limits from settings.REQUEST_ROUTE_LIMITS, the request of the exhausted route doesn't block
+    requests of the other routes. Route is the route name and the major parameter, for example
+    "message/<channel id>". No more than settings.REQUEST_CONCURRENCY requests run at the same time.
+
+    When there are settings.REQUEST_QUEUE_LIMIT queued requests, new low priority requests are dropped and
+    higher priority requests displace the oldest low priority ones. Requests with the same coalesce key
+    are merged into the one request with the latest callback.
+    """
+    metrics: Dict[RequestPriority, PriorityMetrics] = {priority: PriorityMetrics() for priority in RequestPriority}
+
+    __queues: Dict[RequestPriority, Deque[PendingRequest]] = {priority: deque() for priority in RequestPriority}
+    # Structure: {"coalesce key": pending_request}
+    __pending_by_key: Dict[str, PendingRequest] = {}
+    # Structure: {"route": token_bucket}
+    __buckets: Dict[str, TokenBucket] = {}
+    __loop_task: Optional[asyncio.Task] = None
+    __in_flight_tasks: Set[asyncio.Task] = set()
+    __wake_up: Optional[asyncio.Event] = None
+    __semaphore: Optional[asyncio.Semaphore] = None
+
+    @classmethod
+    async def run(cls, priority: RequestPriority, route: str, request: Callable[[], Awaitable[Any]],
+                  coalesce_key: Optional[str] = None) -> Any:
+        """
+        Queue discord API request and wait its result
+
+        Errors of the request are raised to the caller.
+
+        :param priority: request priority class
+        :param route: route name and major parameter, for example "message/<channel id>"
+        :param request: coroutine function that sends request
+        :param coalesce_key: key to merge requests waiting in the queue
+        :return: request result or None if request was dropped
+        """
+        return await cls.__submit(priority, route, request, coalesce_key, is_awaited=True)
+
+    @classmethod
+    def dispatch(cls, priority: RequestPriority, route: str, request: Callable[[], Awaitable[Any]],
+                 coalesce_key: Optional[str] = None):
+        """
+        Queue discord API request without waiting. Errors of the request are logged
+
+        :param priority: request priority class
+        :param route: route name and major parameter, for example "message/<channel id>"
+        :param request: coroutine function that sends request
+        :param coalesce_key: key to merge requests waiting in the queue
+        """
+        cls.__submit(priority, route, request, coalesce_key, is_awaited=False)
+
+    @classmethod
+    def queue_depths(cls) -> Dict[str, int]:
+        """
+        Gets amount of the queued requests of every priority class
+
+        :return: queue depth by priority class name
+        """
+        return {priority.name: len(queue) for priority, queue in cls.__queues.items()}
+
+    @classmethod
+    def report(cls):
+        """
+        Log queue depth and requests metrics of every priority class
+        """
+        for priority, metrics in cls.metrics.items():
+            logging.info("Discord requests {}: queue {}, max queue {}. {} submitted, {} completed, {} failed, "
+                         "{} dropped, {} coalesced".
+                         format(priority.name, len(cls.__queues[priority]), metrics.max_queue_depth,
+                                metrics.submitted, metrics.completed, metrics.failed, metrics.dropped,
+                                metrics.coalesced))
+
+    @classmethod
+    async def close(cls):
+        """
+        Wait queued and running requests at most settings.REQUEST_CLOSE_TIMEOUT seconds, drop and cancel the rest
+        """
+        try:
+            await asyncio.wait_for(cls.__wait_requests(), settings.REQUEST_CLOSE_TIMEOUT)
+        except asyncio.TimeoutError:
+            logging.warning("Discord requests: {} queued and {} running requests were not finished before closing".
+                            format(sum(cls.queue_depths().values()), len(cls.__in_flight_tasks)))
+            if cls.__loop_task:
+                cls.__loop_task.cancel()
+                cls.__loop_task = None
+            for queue in cls.__queues.values():
+                while queue:
+                    cls.__drop(queue.popleft())
+            for task in cls.__in_flight_tasks:
+                task.cancel()
+
+    @classmethod
+    async def __wait_requests(cls):
+        """
+        Wait until there are no queued and running requests
+        """
+        while cls.__loop_task or cls.__in_flight_tasks:
+            if cls.__loop_task:
+                await asyncio.shield(cls.__loop_task)
+            if cls.__in_flight_tasks:
+                await asyncio.wait(set(cls.__in_flight_tasks))
+
+    @classmethod
+    def __submit(cls, priority: RequestPriority, route: str, request: Callable[[], Awaitable[Any]],
+                 coalesce_key: Optional[str], is_awaited: bool) -> Awaitable[Any]:
+        """
+        Put request in the queue of its priority class
+
+        :param priority: request priority class
+        :param route: route name and major parameter
+        :param request: coroutine function that sends request
+        :param coalesce_key: key to merge requests waiting in the queue
+        :param is_awaited: True if the caller waits the request result
+        :return: future of the request result
+        """
+        loop = asyncio.get_running_loop()
+        metrics = cls.metrics[priority]
+        metrics.submitted += 1
+
+        if coalesce_key and (pending_request := cls.__pending_by_key.get(coalesce_key)):
+            pending_request.request = request
+            metrics.coalesced += 1
+            if is_awaited and not pending_request.future:
+                pending_request.future = loop.create_future()
+            return pending_request.future
+
+        pending_request = PendingRequest(priority, route, request, coalesce_key,
+                                         loop.create_future() if is_awaited else None)
+        if sum(cls.queue_depths().values()) >= settings.REQUEST_QUEUE_LIMIT:
+            low_priority_queue = cls.__queues[RequestPriority.LOW]
+            if priority == RequestPriority.LOW:
+                cls.__drop(pending_request)
+                return pending_request.future
+            if low_priority_queue:
+                cls.__drop(low_priority_queue.popleft())
+
+        queue = cls.__queues[priority]
+        queue.append(pending_request)
+        metrics.queue_depth = len(queue)
+        metrics.max_queue_depth = max(metrics.max_queue_depth, len(queue))
+        if coalesce_key:
+            cls.__pending_by_key[coalesce_key] = pending_request
+        if not cls.__loop_task:
+            cls.__wake_up = asyncio.Event()
+            # Running requests of the previous loop still hold places of the semaphore
+            if not cls.__in_flight_tasks:
+                cls.__semaphore = asyncio.Semaphore(settings.REQUEST_CONCURRENCY)
+            cls.__loop_task = asyncio.create_task(cls.__run())
+        else:
+            cls.__wake_up.set()
+        return pending_request.future
+
+    @classmethod
+    def __drop(cls, pending_request: PendingRequest):
+        """
+        Drop request from the queue, the caller gets None as the request result
+
+        :param pending_request: request to drop
+        """
+        cls.metrics[pending_request.priority].dropped += 1
+        cls.metrics[pending_request.priority].queue_depth = len(cls.__queues[pending_request.priority])
+        if pending_request.coalesce_key:
+            cls.__pending_by_key.pop(pending_request.coalesce_key, None)
+        if pending_request.future and not pending_request.future.done():
+            pending_request.future.set_result(None)
+        logging.debug("Discord requests: Request to {} was dropped".format(pending_request.route))
+
+    @classmethod
+    async def __run(cls):
+        """
+        Start ready requests in the priority order until the queues are empty
+        """
+        while any(cls.__queues.values()):
+            await cls.__semaphore.acquire()
+            pending_request, wait_time = cls.__pop_ready_request()
+            if not pending_request:
+                cls.__semaphore.release()
+                cls.__wake_up.clear()
+                try:
+                    await asyncio.wait_for(cls.__wake_up.wait(), wait_time)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+            task = asyncio.ensure_future(cls.__execute(pending_request, cls.__semaphore))
+            cls.__in_flight_tasks.add(task)
+            task.add_done_callback(cls.__in_flight_tasks.discard)
+        cls.__buckets = {route: bucket for route, bucket in cls.__buckets.items() if not bucket.is_full}
+        cls.__loop_task = None
+
+    @classmethod
+    def __pop_ready_request(cls) -> Tuple[Optional[PendingRequest], float]:
+        """
+        Take the first request with the available route token in the priority order
+
+        Requests of the same route are taken in the queue order.
+
+        :return: ready request or None and seconds until the next token of the queued routes
+        """
+        wait_time = float("inf")
+        for priority, queue in cls.__queues.items():
+            blocked_routes = set()
+            for pending_request in queue:
+                if pending_request.route in blocked_routes:
+                    continue
+                bucket = cls.__get_bucket(pending_request.route)
+                if (token_wait_time := bucket.get_wait_time()) <= 0:
+                    bucket.take()
+                    queue.remove(pending_request)
+                    cls.metrics[priority].queue_depth = len(queue)
+                    if pending_request.coalesce_key:
+                        cls.__pending_by_key.pop(pending_request.coalesce_key, None)
+                    return pending_request, 0
+                blocked_routes.add(pending_request.route)
+                wait_time = min(wait_time, token_wait_time)
+        return None, wait_time
+
+    @classmethod
+    def __get_bucket(cls, route: str) -> TokenBucket:
+        """
+        Gets token bucket of the route or create it with the limits of the route name
+
+        :param route: route name and major parameter
+        :return: token bucket of the route
+        """
+        if not (bucket := cls.__buckets.get(route)):
+            route_name = route.split("/")[0]
+            capacity, period = settings.REQUEST_ROUTE_LIMITS.get(route_name, settings.REQUEST_DEFAULT_LIMIT)
+            bucket = cls.__buckets[route] = TokenBucket(capacity, period)
+        return bucket
+
+    @classmethod
+    async def __execute(cls, pending_request: PendingRequest, semaphore: asyncio.Semaphore):
+        """
+        Send request and pass its result to the caller
+
+        :param pending_request: request to send
+        :param semaphore: semaphore acquired for the request
+        """
+        metrics = cls.metrics[pending_request.priority]
+        try:
+            result = await pending_request.request()
+        except Exception as error:
+            metrics.failed += 1
+            if isinstance(error, HTTPException) and error.status == 429:
+                cls.__get_bucket(pending_request.route).drain()
+            if pending_request.future and not pending_request.future.done():
+                pending_request.future.set_exception(error)
+            else:
+                logging.warning("Discord requests: Request to {} failed.\nError: {}".
+                                format(pending_request.route, error))
+        else:
+            metrics.completed += 1
+            if pending_request.future and not pending_request.future.done():
+                pending_request.future.set_result(result)
+        finally:
+            semaphore.release()
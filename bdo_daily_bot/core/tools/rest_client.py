@@ -0,0 +1,192 @@
+"""
+Contain shared HTTP client for the direct discord REST API requests
+"""
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+
+import aiohttp
+from discord import Forbidden, HTTPException, NotFound
+
+from bdo_daily_bot.settings import settings
+
+# Route parameters that have own discord rate limit buckets
+MAJOR_PARAMETERS = ("guild_id", "channel_id", "webhook_id")
+
+
+@dataclass
+class RateLimitBucket:
+    """Class for keeping state of the one discord rate limit bucket"""
+    lock: asyncio.Lock
+    remaining: Optional[int] = None
+    reset_time: float = 0
+
+
+class RestClient:
+    """
+    Send requests to the discord REST API with one shared session
+
+    Session keeps the pool of at most settings.REST_CONNECTIONS_LIMIT connections, so requests don't pay
+    connection setup and TLS handshake every time. Requests of the same route and major parameter go one by one
+    and wait the bucket reset when X-RateLimit headers say that the bucket is exhausted. Rate limited, server
+    errors and connection errors are retried settings.REST_RETRIES times with exponential backoff.
+    Session is closed with the bot.
+    """
+    __session: Optional[aiohttp.ClientSession] = None
+    # Structure: {"method route major_parameter": bucket}
+    __buckets: Dict[str, RateLimitBucket] = {}
+    __global_reset_time: float = 0
+
+    @classmethod
+    async def request(cls, method: str, route: str, *, json: Optional[Dict[str, Any]] = None,
+                      reason: Optional[str] = None, **parameters) -> Any:
+        """
+        Send request to the discord REST API and return decoded response
+
+        :param method: HTTP method
+        :param route: API route with parameters placeholders, for example "/guilds/{guild_id}/members/{user_id}"
+        :param json: request body
+        :param reason: reason to show in the guild audit log
+        :param parameters: route parameters
+        :return: decoded JSON response or None if response has no content
+        :raise HTTPException: if discord rejected request or retries are exhausted
+        """
+        url = settings.DISCORD_API_URL + route.format(**parameters)
+        headers = {"X-Audit-Log-Reason": reason} if reason else {}
+        bucket = cls.__get_bucket(method, route, parameters)
+        async with bucket.lock:
+            for attempt in range(settings.REST_RETRIES + 1):
+                await cls.__wait_reset(bucket)
+                try:
+                    async with cls.__get_session().request(method, url, json=json, headers=headers) as response:
+                        data = await cls.__read(response)
+                        cls.__update_bucket(bucket, response)
+                        if response.status < 300:
+                            return data
+                        if response.status == 429:
+                            cls.__set_retry_after(bucket, data, response)
+                            logging.warning("REST {} {}: Rate limited, retry after {:.3f}s".
+                                            format(method, route, bucket.reset_time - time.monotonic()))
+                            continue
+                        if response.status < 500 or attempt == settings.REST_RETRIES:
+                            raise cls.__get_error(response, data)
+                except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as error:
+                    if attempt == settings.REST_RETRIES:
+                        raise
+                    logging.warning("REST {} {}: Request failed.\nError: {}".format(method, route, error))
+                await asyncio.sleep(settings.REST_RETRY_BACKOFF * 2 ** attempt)
+            raise HTTPException(response, data)
+
+    @classmethod
+    async def close(cls):
+        """
+        Close shared session and its connections
+        """
+        if cls.__session and not cls.__session.closed:
+            await cls.__session.close()
+        cls.__session = None
+        cls.__buckets.clear()
+
+    @classmethod
+    def __get_session(cls) -> aiohttp.ClientSession:
+        """
+        Gets shared session or create it with the bot authorization
+
+        :return: shared session
+        """
+        if not cls.__session or cls.__session.closed:
+            cls.__session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=settings.REST_CONNECTIONS_LIMIT),
+                timeout=aiohttp.ClientTimeout(total=settings.REST_TIMEOUT),
+                headers={"Authorization": f"Bot {settings.TOKEN}"})
+        return cls.__session
+
+    @classmethod
+    def __get_bucket(cls, method: str, route: str, parameters: Dict[str, Any]) -> RateLimitBucket:
+        """
+        Gets rate limit bucket of the route and its major parameter
+
+        :param method: HTTP method
+        :param route: API route with parameters placeholders
+        :param parameters: route parameters
+        :return: rate limit bucket
+        """
+        major_parameter = next((parameters[name] for name in MAJOR_PARAMETERS if name in parameters), None)
+        key = f"{method} {route} {major_parameter}"
+        if key not in cls.__buckets:
+            cls.__buckets[key] = RateLimitBucket(asyncio.Lock())
+        return cls.__buckets[key]
+
+    @classmethod
+    async def __wait_reset(cls, bucket: RateLimitBucket):
+        """
+        Wait the global and bucket rate limits reset if they are exhausted
+
+        :param bucket: rate limit bucket of the request
+        """
+        now = time.monotonic()
+        wait_time = max(cls.__global_reset_time - now, 0)
+        if bucket.remaining == 0:
+            wait_time = max(wait_time, bucket.reset_time - now)
+        if wait_time > 0:
+            await asyncio.sleep(wait_time)
+
+    @classmethod
+    def __update_bucket(cls, bucket: RateLimitBucket, response: aiohttp.ClientResponse):
+        """
+        Update bucket state from the response X-RateLimit headers
+
+        :param bucket: rate limit bucket of the request
+        :param response: discord response
+        """
+        if (remaining := response.headers.get("X-RateLimit-Remaining")) is not None:
+            bucket.remaining = int(remaining)
+        if (reset_after := response.headers.get("X-RateLimit-Reset-After")) is not None:
+            bucket.reset_time = time.monotonic() + float(reset_after)
+
+    @classmethod
+    def __set_retry_after(cls, bucket: RateLimitBucket, data: Any, response: aiohttp.ClientResponse):
+        """
+        Exhaust bucket or global rate limit until the retry time of the rate limited response
+
+        :param bucket: rate limit bucket of the request
+        :param data: decoded response
+        :param response: discord response
+        """
+        data = data if isinstance(data, dict) else {}
+        retry_after = float(data.get("retry_after") or response.headers.get("Retry-After") or 1)
+        reset_time = time.monotonic() + retry_after
+        if data.get("global") or response.headers.get("X-RateLimit-Global"):
+            cls.__global_reset_time = reset_time
+        bucket.remaining, bucket.reset_time = 0, reset_time
+
+    @staticmethod
+    async def __read(response: aiohttp.ClientResponse) -> Any:
+        """
+        Decode response content
+
+        :param response: discord response
+        :return: decoded JSON, text or None if response has no content
+        """
+        if response.status == 204:
+            return None
+        if response.content_type == "application/json":
+            return await response.json()
+        return await response.text()
+
+    @staticmethod
+    def __get_error(response: aiohttp.ClientResponse, data: Any) -> HTTPException:
+        """
+        Gets discord exception for the failed response
+
+        :param response: discord response
+        :param data: decoded response
+        :return: discord exception
+        """
+        if response.status == 403:
+            return Forbidden(response, data)
+        if response.status == 404:
+            return NotFound(response, data)
+        return HTTPException(response, data)
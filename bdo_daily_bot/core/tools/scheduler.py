@@ -0,0 +1,164 @@
+"""
+Contain scheduler that runs jobs at the absolute deadlines with the one event loop task
+"""
+import asyncio
+import heapq
+import itertools
+import logging
+from collections import defaultdict
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Any, Awaitable, Callable, DefaultDict, Dict, List, Optional, Set
+
+from bdo_daily_bot.settings import settings
+
+
+@dataclass(order=True)
+class ScheduledJob:
+    """Class for keeping job that should run at the deadline"""
+    deadline: datetime
+    sequence: int
+    key: str = field(compare=False)
+    name: str = field(compare=False)
+    callback: Callable[[], Awaitable[Any]] = field(compare=False, repr=False)
+    is_cancelled: bool = field(default=False, compare=False)
+
+    def __hash__(self) -> int:
+        return hash(self.sequence)
+
+
+class Scheduler:
+    """
+    Run jobs at their deadlines from the one heap of jobs
+
+    One task sleeps until the nearest deadline instead of the sleeping task for every job. Deadlines are
+    absolute and the sleep is checked against the wall clock at least every settings.SCHEDULER_MAX_SLEEP seconds,
+    so long waits don't drift. All jobs due in the same settings.SCHEDULER_TICK are fired together.
+    Jobs of the same key, for example the same raid, run one by one in the deadlines order, jobs of
+    different keys run concurrently. Jobs can be cancelled by key.
+    """
+    fired_batches = 0
+    fired_jobs = 0
+
+    __jobs: List[ScheduledJob] = []
+    # Structure: {"key": {scheduled_job, }}
+    __jobs_by_key: DefaultDict[str, Set[ScheduledJob]] = defaultdict(set)
+    __key_locks: Dict[str, asyncio.Lock] = {}
+    __sequence = itertools.count()
+    __loop_task: Optional[asyncio.Task] = None
+    __wake_up: Optional[asyncio.Event] = None
+    __sleep_deadline: Optional[datetime] = None
+
+    @classmethod
+    def schedule(cls, key: str, name: str, deadline: datetime, callback: Callable[[], Awaitable[Any]]) \
+            -> ScheduledJob:
+        """
+        Schedule job to run at the given deadline
+
+        Job with the deadline in the past runs with the next batch.
+
+        :param key: key of the jobs group, for example raid key
+        :param name: job name for logs
+        :param deadline: time to run job
+        :param callback: coroutine function to run
+        :return: scheduled job
+        """
+        job = ScheduledJob(deadline, next(cls.__sequence), key, name, callback)
+        heapq.heappush(cls.__jobs, job)
+        cls.__jobs_by_key[key].add(job)
+        if not cls.__loop_task:
+            cls.__wake_up = asyncio.Event()
+            cls.__loop_task = asyncio.create_task(cls.__run())
+        elif cls.__sleep_deadline and deadline < cls.__sleep_deadline:
+            cls.__wake_up.set()
+        return job
+
+    @classmethod
+    def cancel(cls, key: str):
+        """
+        Cancel all not started jobs of the given key
+
+        Running job is not interrupted. Jobs of the fired batch that wait the running job are skipped.
+
+        :param key: key of the jobs group
+        """
+        cancelled_jobs = cls.__jobs_by_key.pop(key, set())
+        if not cancelled_jobs:
+            return
+        for job in cancelled_jobs:
+            job.is_cancelled = True
+        cls.__jobs = [job for job in cls.__jobs if not job.is_cancelled]
+        heapq.heapify(cls.__jobs)
+        if cls.__wake_up:
+            cls.__wake_up.set()
+
+    @classmethod
+    def get_pending_jobs(cls, key: Optional[str] = None) -> List[ScheduledJob]:
+        """
+        Gets not started jobs in the deadlines order
+
+        :param key: key of the jobs group. Jobs of all keys if not specified
+        :return: pending jobs
+        """
+        jobs = cls.__jobs_by_key.get(key, set()) if key else itertools.chain(*cls.__jobs_by_key.values())
+        return sorted(jobs)
+
+    @classmethod
+    async def __run(cls):
+        """
+        Sleep until the nearest deadline and fire all jobs due in the current tick until there are no jobs
+        """
+        while cls.__jobs:
+            secs_to_deadline = (cls.__jobs[0].deadline - datetime.now()).total_seconds()
+            if secs_to_deadline > 0:
+                cls.__wake_up.clear()
+                cls.__sleep_deadline = cls.__jobs[0].deadline
+                try:
+                    await asyncio.wait_for(cls.__wake_up.wait(), min(secs_to_deadline, settings.SCHEDULER_MAX_SLEEP))
+                except asyncio.TimeoutError:
+                    pass
+                cls.__sleep_deadline = None
+                continue
+
+            tick_end = datetime.now() + timedelta(seconds=settings.SCHEDULER_TICK)
+            batch = []
+            while cls.__jobs and cls.__jobs[0].deadline <= tick_end:
+                batch.append(heapq.heappop(cls.__jobs))
+            asyncio.ensure_future(cls.__fire(batch))
+        cls.__loop_task = None
+
+    @classmethod
+    async def __fire(cls, batch: List[ScheduledJob]):
+        """
+        Run jobs of the different keys concurrently and jobs of the same key one by one
+
+        :param batch: jobs due in the current tick in the deadlines order
+        """
+        cls.fired_batches += 1
+        jobs_by_key: Dict[str, List[ScheduledJob]] = defaultdict(list)
+        for job in batch:
+            jobs_by_key[job.key].append(job)
+        await asyncio.gather(*(cls.__fire_key_jobs(key, jobs) for key, jobs in jobs_by_key.items()))
+
+    @classmethod
+    async def __fire_key_jobs(cls, key: str, jobs: List[ScheduledJob]):
+        """
+        Run jobs of the same key one by one
+
+        :param key: key of the jobs group
+        :param jobs: jobs of the key in the deadlines order
+        """
+        lock = cls.__key_locks.setdefault(key, asyncio.Lock())
+        async with lock:
+            for job in jobs:
+                if job.is_cancelled:
+                    continue
+                cls.__jobs_by_key.get(key, set()).discard(job)
+                cls.fired_jobs += 1
+                try:
+                    await job.callback()
+                except Exception as error:
+                    logging.error("Scheduler: Job {} of {} failed.\nError: {}".format(job.name, key, error))
+        if not cls.__jobs_by_key.get(key) and not lock.locked():
+            cls.__jobs_by_key.pop(key, None)
+            cls.__key_locks.pop(key, None)
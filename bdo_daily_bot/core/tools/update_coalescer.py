@@ -0,0 +1,97 @@
+"""
+Contain class for merging frequent update requests into the one update
+"""
+import asyncio
+import logging
+from typing import Awaitable, Callable, Optional, Set
+
+from bdo_daily_bot.settings import settings
+
+
+class UpdateCoalescer:
+    """
+    Merge update requests received during the window into the one update
+
+    The first request starts the window, all requests received during the window are satisfied by the
+    one update at the end of the window. Updates never run simultaneously. Pending updates can be
+    flushed immediately, for example, before the raid end or the bot shutdown. Flush also waits the running
+    update, so all requested changes are done after the flush.
+    """
+    __pending_coalescers: Set["UpdateCoalescer"] = set()
+
+    def __init__(self, update: Callable[[], Awaitable], name: str, window: Optional[float] = None):
+        """
+        :param update: coroutine function that updates all requested changes
+        :param name: coalescer name for logs
+        :param window: seconds to collect update requests. settings.RAID_UPDATE_WINDOW if not specified
+        """
+        self.name = name
+        self.window = settings.RAID_UPDATE_WINDOW if window is None else window
+        self.requests = 0
+        self.updates = 0
+
+        self.__update = update
+        self.__timer_task: Optional[asyncio.Task] = None
+        self.__update_lock = asyncio.Lock()
+        self.__running_updates = 0
+
+    @property
+    def is_pending(self) -> bool:
+        """
+        Check that update was requested and not done yet
+
+        :return: True if update is pending or running else False
+        """
+        return self.__timer_task is not None or self.__running_updates > 0
+
+    def request(self):
+        """
+        Request update at the end of the current window. Start new window if there is no pending update
+        """
+        self.requests += 1
+        if not self.__timer_task:
+            self.__timer_task = asyncio.create_task(self.__update_after_window())
+            self.__pending_coalescers.add(self)
+
+    async def flush(self):
+        """
+        Run pending update immediately and wait the running update
+        """
+        if self.__timer_task:
+            self.__timer_task.cancel()
+            await self.__run_update()
+        elif self.__running_updates:
+            async with self.__update_lock:
+                pass
+
+    @classmethod
+    async def flush_all(cls):
+        """
+        Run all pending updates immediately
+        """
+        for coalescer in list(cls.__pending_coalescers):
+            await coalescer.flush()
+
+    async def __update_after_window(self):
+        """
+        Wait for the end of the window and run update
+        """
+        await asyncio.sleep(self.window)
+        await self.__run_update()
+
+    async def __run_update(self):
+        """
+        Run update with all requested changes. New requests during update start new window
+        """
+        self.__timer_task = None
+        self.__running_updates += 1
+        try:
+            async with self.__update_lock:
+                await self.__update()
+                self.updates += 1
+        except Exception as error:
+            logging.error("{}: Failed to update.\nError: {}".format(self.name, error))
+        finally:
+            self.__running_updates -= 1
+            if not self.is_pending:
+                self.__pending_coalescers.discard(self)
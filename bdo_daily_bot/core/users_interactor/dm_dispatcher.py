@@ -0,0 +1,145 @@
+"""
+Contain dispatcher that sends direct messages to users from the one queue
+"""
+import asyncio
+import logging
+import time
+from typing import List, Optional, Tuple
+
+from discord import Forbidden, HTTPException, Message, User
+
+from bdo_daily_bot.core.tools.request_scheduler import RequestPriority, RequestScheduler
+from bdo_daily_bot.settings import settings
+
+
+class DirectMessageDispatcher:
+    """
+    Send direct messages to users from the one queue with the bounded amount of workers
+
+    settings.DM_CONCURRENCY workers send messages, no more than settings.DM_RATE messages per second are sent,
+    so the bulk of notifications doesn't exhaust discord rate limits. Rate limited and failed by discord server
+    messages are retried settings.DM_RETRIES times with exponential backoff. Messages to the users with closed
+    direct messages are dropped. Messages can be awaited or dispatched without waiting.
+    """
+    sent = 0
+    dropped = 0
+    failed = 0
+
+    # Structure: (discord user, message content, future of the sent message or None)
+    QueueItem = Tuple[User, str, Optional[asyncio.Future]]
+
+    __queue: Optional["asyncio.Queue[QueueItem]"] = None
+    __workers: List[asyncio.Task] = []
+    __next_send_time: float = 0
+
+    @classmethod
+    async def send(cls, user: User, message: str) -> Optional[Message]:
+        """
+        Send direct message to user and wait until it is sent
+
+        :param user: discord user
+        :param message: message content
+        :return: sent discord message or None if message wasn't sent
+        """
+        future = asyncio.get_running_loop().create_future()
+        cls.__get_queue().put_nowait((user, message, future))
+        return await future
+
+    @classmethod
+    def dispatch(cls, user: User, message: str):
+        """
+        Put direct message to user in the queue without waiting
+
+        :param user: discord user
+        :param message: message content
+        """
+        cls.__get_queue().put_nowait((user, message, None))
+
+    @classmethod
+    async def close(cls):
+        """
+        Wait queued messages at most settings.DM_CLOSE_TIMEOUT seconds and stop workers
+        """
+        if not cls.__queue:
+            return
+        try:
+            await asyncio.wait_for(cls.__queue.join(), settings.DM_CLOSE_TIMEOUT)
+        except asyncio.TimeoutError:
+            logging.warning("Private: {} direct messages were not sent before closing".format(cls.__queue.qsize()))
+        for worker in cls.__workers:
+            worker.cancel()
+        cls.__queue, cls.__workers = None, []
+
+    @classmethod
+    def __get_queue(cls) -> "asyncio.Queue[QueueItem]":
+        """
+        Gets messages queue or create it with the workers
+
+        :return: direct messages queue
+        """
+        if not cls.__queue:
+            cls.__queue = asyncio.Queue()
+            cls.__workers = [asyncio.create_task(cls.__work(cls.__queue)) for _ in range(settings.DM_CONCURRENCY)]
+        return cls.__queue
+
+    @classmethod
+    async def __work(cls, queue: "asyncio.Queue[QueueItem]"):
+        """
+        Send messages from the queue one by one
+
+        :param queue: direct messages queue
+        """
+        while True:
+            user, message, future = await queue.get()
+            try:
+                discord_message = await cls.__send(user, message)
+            except Exception as error:
+                logging.error("Private/{}: Failed to send message to user.\nError: {}".format(user.name, error))
+                discord_message = None
+            if future and not future.done():
+                future.set_result(discord_message)
+            queue.task_done()
+
+    @classmethod
+    async def __send(cls, user: User, message: str) -> Optional[Message]:
+        """
+        Send message to user with retries
+
+        :param user: discord user
+        :param message: message content
+        :return: sent discord message or None if message wasn't sent
+        """
+        for attempt in range(settings.DM_RETRIES + 1):
+            await cls.__wait_send_time()
+            try:
+                discord_message = await RequestScheduler.run(RequestPriority.HIGH, f"dm/{user.id}",
+                                                             lambda: user.send(message))
+                cls.sent += 1
+                logging.info("Private/{}: Message to user was send. \n"
+                             "Message content: {}".format(user.name, message))
+                return discord_message
+            except Forbidden:
+                cls.dropped += 1
+                logging.info("Private/{}: Failed to send message to user. Forbidden.\n"
+                             "Message content: {}\n".format(user.name, message))
+                return None
+            except HTTPException as error:
+                if (error.status != 429 and error.status < 500) or attempt == settings.DM_RETRIES:
+                    cls.failed += 1
+                    logging.warning("Private/{}: Failed to send message to user. HTTPException.\n"
+                                    "Message content: {}\nError: {}".format(user.name, message, error))
+                    return None
+                logging.warning("Private/{}: Failed to send message to user, retrying.\nError: {}".
+                                format(user.name, error))
+            await asyncio.sleep(settings.DM_RETRY_BACKOFF * 2 ** attempt)
+
+    @classmethod
+    async def __wait_send_time(cls):
+        """
+        Wait until the next message can be sent without exceeding settings.DM_RATE messages per second
+        """
+        now = time.monotonic()
+        send_time = max(now, cls.__next_send_time)
+        cls.__next_send_time = send_time + 1 / settings.DM_RATE
+        if send_time > now:
+            await asyncio.sleep(send_time - now)
@@ -9,6 +9,7 @@ from discord import Forbidden, HTTPException, Message, TextChannel, User
 
 from bdo_daily_bot.core.raid.raid import Raid
 from bdo_daily_bot.core.raid.raid_item import RaidItem
+from bdo_daily_bot.core.users_interactor.dm_dispatcher import DirectMessageDispatcher
 from bdo_daily_bot.messages import messages
 
 
@@ -22,20 +23,23 @@ class UsersSender:
         """
         General method for sending messages to user
 
+        Message is sent by the direct messages dispatcher, method waits until message is sent.
+
         :param user: discord user for message sending
         :param message: message to be sending
+        :return: sent message or None if message wasn't sent
         """
-        try:
-            discord_message = await user.send(message)
-            logging.info("Private/{}: Message to user was send. \n"
-                         "Message content: {}".format(user.name, message))
-            return discord_message
-        except Forbidden:
-            logging.info("Private/{}: Failed to send message to user. Forbidden.\n"
-                         "Message content: {}\n".format(user.name, message))
-        except HTTPException as error:
-            logging.warning("Private/{}: Failed to send message to user. HTTPException.\n"
-                            "Message content: {}\nError: {}".format(user.name, message, error))
+        return await DirectMessageDispatcher.send(user, message)
+
+    @classmethod
+    def dispatch_to_user(cls, user: User, message: str):
+        """
+        General method for sending messages to user without waiting
+
+        :param user: discord user for message sending
+        :param message: message to be sending
+        """
+        DirectMessageDispatcher.dispatch(user, message)
 
     @classmethod
     async def send_user_not_registered(cls, user: User):
@@ -44,7 +48,7 @@ class UsersSender:
 
         :param user: discord user for message sending
         """
-        await cls.send_to_user(user, messages.no_registration)
+        cls.dispatch_to_user(user, messages.no_registration)
 
     @classmethod
     async def send_captain_not_registered(cls, user: User):
@@ -53,7 +57,7 @@ class UsersSender:
 
         :param user: discord user for message sending
         """
-        await cls.send_to_user(user, messages.captain_not_registered)
+        cls.dispatch_to_user(user, messages.captain_not_registered)
 
     @classmethod
     async def send_user_already_in_raid(cls, user: User, raid):
@@ -63,7 +67,7 @@ class UsersSender:
         :param user: discord user for message sending
         :param raid: raid that user trying to join
         """
-        await cls.send_to_user(user, messages.already_in_raid)
+        cls.dispatch_to_user(user, messages.already_in_raid)
 
     @classmethod
     async def send_user_already_in_same_raid(cls, user: User):
@@ -72,7 +76,7 @@ class UsersSender:
 
         :param user: discord user for message sending
         """
-        await cls.send_to_user(user, messages.already_in_same_raid)
+        cls.dispatch_to_user(user, messages.already_in_same_raid)
 
     @classmethod
     async def send_raid_is_full(cls, user: User, raid: Raid):
@@ -82,7 +86,7 @@ class UsersSender:
         :param user: discord user for message sending
         :param raid: raid that user trying to join
         """
-        await cls.send_to_user(user, messages.raid_not_joined)
+        cls.dispatch_to_user(user, messages.raid_not_joined)
 
     @classmethod
     async def send_user_joined_raid(cls, user: User, raid: Raid):
@@ -94,7 +98,7 @@ class UsersSender:
         """
         message = messages.raid_joined.format(captain_name=raid.captain.nickname, server=raid.bdo_server,
                                               time_leaving=raid.time.normal_time_leaving)
-        await cls.send_to_user(user, message)
+        cls.dispatch_to_user(user, message)
 
     @classmethod
     async def send_user_not_in_raid(cls, user: User, raid: Raid):
@@ -104,7 +108,7 @@ class UsersSender:
         :param user: discord user for message sending
         :param raid: raid that user trying to leave
         """
-        await cls.send_to_user(user, messages.user_not_found_in_raid)
+        cls.dispatch_to_user(user, messages.user_not_found_in_raid)
 
     @classmethod
     async def send_user_left_raid(cls, user: User, raid: Raid):
@@ -114,7 +118,7 @@ class UsersSender:
         :param user: discord user for message sending
         :param raid: raid that user left
         """
-        await cls.send_to_user(user, messages.raid_leave.format(captain_name=raid.captain.nickname))
+        cls.dispatch_to_user(user, messages.raid_leave.format(captain_name=raid.captain.nickname))
 
     @classmethod
     async def send_raid_already_exist(cls, user: User, raid_item: RaidItem):
@@ -124,7 +128,7 @@ class UsersSender:
         :param user: discord user for message sending
         :param raid_item: raid item that user try to create
         """
-        await cls.send_to_user(user, messages.raid_already_exist)
+        cls.dispatch_to_user(user, messages.raid_already_exist)
 
     @classmethod
     async def send_raids_not_found_by_captain(cls, user: User, captain_name: str):
@@ -134,7 +138,7 @@ class UsersSender:
         :param user: discord user for message sending
         :param captain_name: captain name that was used to find raid
         """
-        await cls.send_to_user(user, messages.raid_not_found_by_captain.format(captain_name=captain_name))
+        cls.dispatch_to_user(user, messages.raid_not_found_by_captain.format(captain_name=captain_name))
 
     @classmethod
     async def send_raid_was_removed(cls, user: User, captain_name: str, time_leaving: str):
@@ -146,7 +150,7 @@ class UsersSender:
         :param time_leaving: time leaving of raid that was removed
         """
         message = messages.raid_was_removed.format(captain_name=captain_name, time_leaving=time_leaving)
-        await cls.send_to_user(user, message)
+        cls.dispatch_to_user(user, message)
 
     @classmethod
     async def send_raid_to_remove_not_exist(cls, user: User):
@@ -156,7 +160,7 @@ class UsersSender:
         :param user: discord user for message sending
         """
         message = messages.raid_already_exist
-        await cls.send_to_user(user, message)
+        cls.dispatch_to_user(user, message)
 
     @classmethod
     async def send_first_notification_message(cls, user: User) -> Optional[Message]:
@@ -207,7 +211,7 @@ class UsersSender:
         :param guild_name: discord guild name where the user enable raids
         """
         message = messages.user_enable_raids_in_guild.format(guild=guild_name)
-        await cls.send_to_user(user, message)
+        cls.dispatch_to_user(user, message)
 
     @classmethod
     async def send_user_disable_raids_in_guild(cls, user: User, guild_name: str):
@@ -218,7 +222,7 @@ class UsersSender:
         :param guild_name: discord guild name where the user enable raids
         """
         message = messages.user_disable_raids_in_guild.format(guild=guild_name)
-        await cls.send_to_user(user, message)
+        cls.dispatch_to_user(user, message)
 
     @classmethod
     async def send_user_set_notification_role(cls, user: User, guild_name: str, role_name: str,
@@ -234,7 +238,7 @@ class UsersSender:
         """
         message = messages.user_set_notification_role.format(guild=guild_name, role=role_name,
                                                              time_start_at=time_start_at, time_end_at=time_end_at)
-        await cls.send_to_user(user, message)
+        cls.dispatch_to_user(user, message)
 
     @classmethod
     async def send_user_remove_notification_role(cls, user: User, guild_name: str, role_name: str):
@@ -246,7 +250,7 @@ class UsersSender:
         :param role_name: discord role name for mentions
         """
         message = messages.user_remove_notification_role.format(guild=guild_name, role=role_name)
-        await cls.send_to_user(user, message)
+        cls.dispatch_to_user(user, message)
 
     @classmethod
     async def send_user_try_show_not_exist_raid(cls, user: User, captain_name: str):
@@ -257,7 +261,7 @@ class UsersSender:
         :param captain_name: captain name of the raid to show
         """
         message = messages.user_try_show_not_exist_raid.format(captain=captain_name)
-        await cls.send_to_user(user, message)
+        cls.dispatch_to_user(user, message)
 
     @classmethod
     async def send_to_user_captain_not_exist(cls, user: User, captain_name: str):
@@ -268,7 +272,7 @@ class UsersSender:
         :param captain_name: captain name of the raid
         """
         message = messages.user_try_action_with_not_exist_captain.format(captain=captain_name)
-        await cls.send_to_user(user, message)
+        cls.dispatch_to_user(user, message)
 
     @classmethod
     async def send_user_try_show_raid_with_wrong_time(cls, user: User, captain_name: str,
@@ -283,7 +287,7 @@ class UsersSender:
         """
         message = messages.user_try_show_raid_with_wrong_time.format(
             captain=captain_name, correct_time=correct_time, wrong_time=wrong_time)
-        await cls.send_to_user(user, message)
+        cls.dispatch_to_user(user, message)
 
     @classmethod
     async def send_user_try_change_raid_places_by_wrong_time(cls, user: User, captain_name: str,
@@ -298,7 +302,7 @@ class UsersSender:
         """
         message = messages.user_try_change_places_in_raid_by_wrong_time.format(
             captain=captain_name, correct_time=correct_time, wrong_time=wrong_time)
-        await cls.send_to_user(user, message)
+        cls.dispatch_to_user(user, message)
 
     @classmethod
     async def send_user_use_negative_raid_places(cls, user: User):
@@ -308,7 +312,7 @@ class UsersSender:
         :param user: discord user for message sending
         """
         message = messages.use_negative_raid_places
-        await cls.send_to_user(user, message)
+        cls.dispatch_to_user(user, message)
 
     @classmethod
     async def send_user_raid_places_not_in_range(cls, user: User):
@@ -318,7 +322,7 @@ class UsersSender:
         :param user: discord user for message sending
         """
         message = messages.user_raid_places_not_in_range
-        await cls.send_to_user(user, message)
+        cls.dispatch_to_user(user, message)
 
     @classmethod
     async def send_user_raid_places_is_zero(cls, user: User):
@@ -328,7 +332,7 @@ class UsersSender:
         :param user: discord user for message sending
         """
         message = messages.user_raid_places_is_zero
-        await cls.send_to_user(user, message)
+        cls.dispatch_to_user(user, message)
 
     @classmethod
     async def send_user_wrong_raid_places(cls, user: User):
@@ -338,7 +342,7 @@ class UsersSender:
         :param user: discord user for message sending
         """
         message = messages.user_wrong_raid_places
-        await cls.send_to_user(user, message)
+        cls.dispatch_to_user(user, message)
 
     @classmethod
     async def send_user_captain_raids_not_exist(cls, user: User, captain_name: str):
@@ -349,7 +353,7 @@ class UsersSender:
         :param captain_name: captain nickname without raids
         """
         message = messages.captain_does_not_has_raids.format(captain_name=captain_name)
-        await cls.send_to_user(user, message)
+        cls.dispatch_to_user(user, message)
 
     @classmethod
     async def send_user_raids_not_exist(cls, user: User):
@@ -359,7 +363,7 @@ class UsersSender:
         :param user: discord user for message sending
         """
         message = messages.user_does_not_has_raids
-        await cls.send_to_user(user, message)
+        cls.dispatch_to_user(user, message)
 
     @classmethod
     async def send_user_get_raid_from_raids_by_wrong_time(cls, user: User, wrong_time: str):
@@ -370,7 +374,7 @@ class UsersSender:
         :param wrong_time: wrong time of the raid to show
         """
         message = messages.user_try_get_raid_from_raids_by_wrong_time.format(time=wrong_time)
-        await cls.send_to_user(user, message)
+        cls.dispatch_to_user(user, message)
 
     @classmethod
     async def send_user_get_captain_raid_from_raids_by_wrong_time(cls, user: User, captain_name: str, wrong_time: str):
@@ -383,7 +387,7 @@ class UsersSender:
         """
         message = messages.user_try_get_captain_raid_from_raids_by_wrong_time.format(
             captain=captain_name, time=wrong_time)
-        await cls.send_to_user(user, message)
+        cls.dispatch_to_user(user, message)
 
     @classmethod
     async def send_user_message_for_spam(cls, user: User):
@@ -392,7 +396,7 @@ class UsersSender:
 
         :param user: discord user for message sending
         """
-        await cls.send_to_user(user, messages.message_to_user_for_spam)
+        cls.dispatch_to_user(user, messages.message_to_user_for_spam)
 
 
 class ChannelsSender:
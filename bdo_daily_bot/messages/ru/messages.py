@@ -184,7 +184,8 @@ already_registered = """
 
 # ============================== commands.admin ===============================
 
-remove_msgs_fail_14 = 'Я не могу очищать сообщения дальше, им больше 14 дней. Очищено {msg_count}/{amount}.'
+remove_msgs_partially = "Очищено {deleted_amount}/{amount} сообщений. Сообщения старше 14 дней я удаляю по одному, " \
+                        "поэтому за раз удаляю не больше {limit} из них."
 
 wrong_channel = f"""
 Я не могу удалять сообщения здесь. Воспользуйтесь командой `{PREFIX}удалять_тут`, чтобы иметь возможность
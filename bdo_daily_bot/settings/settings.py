@@ -28,6 +28,25 @@ LANGUAGE = 'ru'
 # Database settings
 # Used Mongo Database
 
+# Database backend
+# Available: 'mongo', 'memory'. In-memory database keeps data only while the bot is running.
+# For local runs without MongoDB, load tests and hermetic database tests use 'memory'.
+# Can be chosen without settings changes by the BDO_DAILY_BOT_DATABASE_BACKEND environment variable
+DATABASE_BACKEND = os.environ.get('BDO_DAILY_BOT_DATABASE_BACKEND', 'mongo')
+# MongoDB client options. Client keeps from minPoolSize to maxPoolSize connections, minPoolSize connections
+# are opened at the bot start before raids loading. Compressors 'snappy' and 'zstd' need additional packages
+DATABASE_CLIENT_OPTIONS = {
+    'maxPoolSize': 50,
+    'minPoolSize': 5,
+    'serverSelectionTimeoutMS': 10000,
+    'compressors': 'zlib',
+    'retryWrites': True,
+    'w': 'majority',
+    'readPreference': 'primary',
+}
+# Connection checkout wait in seconds after which the checkout will be reported in logs
+DATABASE_SLOW_CHECKOUT = 0.5
+
 # Cluster name
 #
 CLUSTER_NAME = 'discord'
@@ -79,11 +98,102 @@ SETTINGS_COLLECTION = 'settings'
 
 RAID_COLLECTION = 'raid'
 RAID_ARCHIVE_COLLECTION = 'raid_archive'
+# Seconds after the raid time leaving when MongoDB deletes the raid document by itself with TTL index.
+# None to keep expired raids until the bot start. Raid channels are deleted only if the document still exists
+# at the bot start. Mongo compares time leaving as UTC time. Remove the raid time_leaving index after changing
+RAID_DOCUMENT_TTL = None
+
+# Seconds while the guild settings document is kept in the bot cache
+SETTINGS_CACHE_TTL = 300
+# Listen settings collection change stream to keep settings cache coherent between several bot processes.
+# Change streams are available only on MongoDB replica sets
+SETTINGS_CHANGE_STREAM = False
+# Maximum amount of the users documents kept in the bot cache. Least recently used documents are removed first
+USER_CACHE_SIZE = 5000
+# Seconds while the user document is kept in the bot cache
+USER_CACHE_TTL = 600
+# Seconds to accumulate users raids entries and captains statistics changes before the one bulk write
+COUNTER_FLUSH_INTERVAL = 10
+# Maximum amount of the known and of the deleted messages kept per channel by the message resolver.
+# Least recently used messages are removed first
+MESSAGE_RESOLVER_CHANNEL_SIZE = 500
 
 # ====================================================================================================
 
 MAIN_GUILD_ID = 726859545082855483
 
+# ====================================================================================================
+# Discord requests settings
+
+# Maximum amount of simultaneous discord requests of one operation for several channels,
+# for example, update of the raid collection messages in all raid channels
+FAN_OUT_CONCURRENCY = 5
+# Maximum amount of raids restored and guild managers initialized at the same time at the bot start
+STARTUP_CONCURRENCY = 10
+# Discord REST API for the requests that are not supported by the discord client
+DISCORD_API_URL = 'https://discord.com/api/v9'
+# Maximum amount of the open connections of the shared REST API session
+REST_CONNECTIONS_LIMIT = 20
+# Seconds to wait the REST API response
+REST_TIMEOUT = 10
+# Amount of retries of the rate limited, failed by server or connection REST API requests
+REST_RETRIES = 3
+# Seconds before the first retry of the failed REST API request. Every next retry waits twice longer
+REST_RETRY_BACKOFF = 0.5
+# Amount of workers that send direct messages to users at the same time
+DM_CONCURRENCY = 5
+# Maximum amount of direct messages sent per second
+DM_RATE = 5
+# Amount of retries of the rate limited or failed by server direct messages
+DM_RETRIES = 3
+# Seconds before the first retry of the failed direct message. Every next retry waits twice longer
+DM_RETRY_BACKOFF = 1.0
+# Seconds to wait queued direct messages on the bot closing
+DM_CLOSE_TIMEOUT = 5
+# Maximum amount of the discord API requests of the request scheduler running at the same time
+REQUEST_CONCURRENCY = 10
+# Amount of the queued discord API requests after which the low priority requests are dropped
+REQUEST_QUEUE_LIMIT = 200
+# Limits of the discord API routes. Structure: {"route name": (requests amount, per seconds)}
+REQUEST_ROUTE_LIMITS = {
+    "reaction": (1, 0.25),
+    "message": (5, 5),
+    "delete": (5, 1),
+    "bulk_delete": (1, 1),
+    "dm": (5, 5),
+}
+# Limits of the discord API routes not listed in REQUEST_ROUTE_LIMITS
+REQUEST_DEFAULT_LIMIT = (5, 5)
+# Seconds to wait queued discord API requests on the bot closing
+REQUEST_CLOSE_TIMEOUT = 5
+# Maximum amount of the messages older than 14 days deleted one by one by the remove messages command
+REMOVE_MSGS_SINGLE_DELETES_LIMIT = 20
+# Maximum amount of the recent messages stored per user to detect spam
+SPAM_USER_HISTORY_SIZE = 20
+# Maximum amount of the users with the stored recent messages to detect spam
+SPAM_USERS_LIMIT = 50000
+# Seconds between the removals of the expired messages of all users
+SPAM_SWEEP_INTERVAL = 60
+# Seconds to collect raid members changes before the one update of raid messages and the raid document
+RAID_UPDATE_WINDOW = 1.5
+# Seconds of the raid flow scheduler tick. Raids steps due within the same tick are fired together
+SCHEDULER_TICK = 1.0
+# Maximum seconds of the scheduler sleep, so wall clock changes are noticed during the long waits
+SCHEDULER_MAX_SLEEP = 60
+
+# ====================================================================================================
+# Raid table rendering settings
+
+# Amount of threads that render raid table images out of the bot event loop
+RENDER_POOL_SIZE = 2
+# Maximum amount of raid table images that can be rendered or wait for rendering in the pool.
+# Other render requests wait for the free place without blocking the bot event loop
+RENDER_QUEUE_SIZE = 16
+# Render latency in seconds after which the render will be reported in logs
+RENDER_SLOW_LATENCY = 1.0
+
+# ====================================================================================================
+
 ROOT_DIR_PATH = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
 # Save path for all created files
 BOT_DATA_PATH = os.path.join(ROOT_DIR_PATH, 'bot_data')
@@ -107,3 +217,6 @@ else:
 
 if not TOKEN or not BD_STRING or not PREFIX:
     raise ImportError('Wrong settings set')
+
+if DATABASE_BACKEND not in ('mongo', 'memory'):
+    raise ImportError('Wrong database backend {}'.format(DATABASE_BACKEND))
@@ -0,0 +1,101 @@
+"""
+Benchmark of the raids restore with channel lookup by the channel registry and by the full channels scan
+
+Run: python -m benchmarks.channel_registry_benchmark
+"""
+import asyncio
+import random
+import time
+from datetime import datetime, timedelta
+from typing import Dict, Iterator, List
+
+from bdo_daily_bot.bot import BdoDailyBot
+from bdo_daily_bot.core.discord_cache.channel_registry import ChannelRegistry
+from bdo_daily_bot.core.raid.raid import Raid
+from bdo_daily_bot.core.raid.raid_channel import RaidChannel
+from bdo_daily_bot.core.raid.raid_member import RaidMember
+from test_framework.models.test_channel import TestChannel
+
+GUILDS_AMOUNT = 50
+CHANNELS_PER_GUILD = 500
+RAIDS_AMOUNT = 100
+
+
+class BenchmarkGuild:
+    """Guild plug with channels plugs"""
+
+    def __init__(self, guild_id: int):
+        self.id = guild_id
+        self.channels: List[TestChannel] = []
+        for channel_number in range(CHANNELS_PER_GUILD):
+            channel = TestChannel(guild_id * CHANNELS_PER_GUILD + channel_number, [1, 2, 3])
+            channel.guild = self
+            self.channels.append(channel)
+
+
+class BenchmarkBot:
+    """Bot plug with client cache of the guilds channels"""
+
+    def __init__(self, guilds: List[BenchmarkGuild]):
+        self.guilds = guilds
+
+    def get_all_channels(self) -> Iterator[TestChannel]:
+        for guild in self.guilds:
+            yield from guild.channels
+
+    async def fetch_channel(self, channel_id: int):
+        raise AssertionError(f"Channel {channel_id} should be found in the cache")
+
+
+def scan_channel_by_id(channel_id: int):
+    """Previous channel lookup implementation with the scan of all bot channels"""
+    for channel in BdoDailyBot.bot.get_all_channels():
+        if channel.id == channel_id:
+            return channel
+    return None
+
+
+def produce_channels_info(guilds: List[BenchmarkGuild]) -> List[List[Dict[str, int]]]:
+    """Produce channels information of the raids posted in the random guilds"""
+    raids_channels_info = []
+    for _ in range(RAIDS_AMOUNT):
+        raid_guilds = random.sample(guilds, 3)
+        raids_channels_info.append([{
+            "channel_id": random.choice(guild.channels).id,
+            "reservation_message_id": 1,
+            "collection_message_id": 2,
+            "table_message_id": 3,
+        } for guild in raid_guilds])
+    return raids_channels_info
+
+
+async def run_benchmark():
+    """Run restore with the both channel lookups and print results"""
+    guilds = [BenchmarkGuild(guild_id) for guild_id in range(1, GUILDS_AMOUNT + 1)]
+    BdoDailyBot.bot = BenchmarkBot(guilds)
+    raids_channels_info = produce_channels_info(guilds)
+    raid = Raid(captain=RaidMember(nickname="Benchmark"), bdo_server="K-1",
+                time_leaving=datetime.now() + timedelta(hours=1), time_reservation_open=datetime.now())
+
+    start_time = time.perf_counter()
+    for channels_info in raids_channels_info:
+        for channel_info in channels_info:
+            scan_channel_by_id(channel_info["channel_id"])
+    scan_duration = time.perf_counter() - start_time
+
+    start_time = time.perf_counter()
+    ChannelRegistry.load()
+    load_duration = time.perf_counter() - start_time
+    start_time = time.perf_counter()
+    for channels_info in raids_channels_info:
+        await RaidChannel.get_channels_from_channels_info(channels_info, raid)
+    restore_duration = time.perf_counter() - start_time
+
+    print(f"{GUILDS_AMOUNT} guilds x {CHANNELS_PER_GUILD} channels x {RAIDS_AMOUNT} raids")
+    print(f"Channels lookup by scan: {scan_duration * 1000:.2f} ms")
+    print(f"Channel registry load: {load_duration * 1000:.2f} ms")
+    print(f"Raids restore with the channel registry: {restore_duration * 1000:.2f} ms")
+
+
+if __name__ == "__main__":
+    asyncio.run(run_benchmark())
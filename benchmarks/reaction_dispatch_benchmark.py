@@ -0,0 +1,76 @@
+"""
+Benchmark of the reaction handlers dispatch cost per reaction event
+
+Run: python -m benchmarks.reaction_dispatch_benchmark
+"""
+import asyncio
+import random
+import time
+from typing import Dict, List
+
+from bdo_daily_bot.core.database.settings_cache import SettingsCache
+from bdo_daily_bot.core.database.settings_collection import SettingsCollection
+from bdo_daily_bot.core.models.reaction_strategy import DynamicReactionsFactory, ReactionStrategy
+from bdo_daily_bot.core.users_interactor.message_reaction_interactor import MessagesReactions
+from test_framework.models.test_collection import TestCollection
+
+GUILDS_AMOUNT = 100
+ROLE_REACTIONS_PER_GUILD = 20
+EVENTS_AMOUNT = 100_000
+ROLE_EMOJIS = [chr(code) for code in range(0x1F400, 0x1F400 + ROLE_REACTIONS_PER_GUILD)]
+UNKNOWN_EMOJIS = [chr(code) for code in range(0x1F600, 0x1F620)]
+
+
+async def previous_dispatch(guild_id: int, message_id: int, reaction: str):
+    """Previous dispatch implementation that unites static and dynamic maps on every event"""
+    static_map = {
+        MessagesReactions.COLLECTION_EMOJI: [object()],
+        MessagesReactions.NOTIFICATION_CONTROLLER_EMOJI: [object()],
+    }
+    reactions_map: Dict[str, List[object]] = {}
+    for reaction_to_role in await DynamicReactionsFactory.get_reactions_to_role_action(guild_id):
+        reactions_map.setdefault(reaction_to_role, []).append(object())
+    united_map: Dict[str, List[object]] = {}
+    for reaction_map in (static_map, reactions_map):
+        for map_reaction, handlers in reaction_map.items():
+            if exist_handlers := united_map.get(map_reaction):
+                exist_handlers.extend(handlers)
+            else:
+                united_map[map_reaction] = handlers
+    return united_map.get(reaction)
+
+
+def produce_events() -> List[tuple]:
+    """Produce reaction events where the most of reactions are not handled by the bot"""
+    emojis = ROLE_EMOJIS + UNKNOWN_EMOJIS * 4 + [MessagesReactions.COLLECTION_EMOJI]
+    return [(random.randint(1, GUILDS_AMOUNT), random.randint(1, GUILDS_AMOUNT), random.choice(emojis))
+            for _ in range(EVENTS_AMOUNT)]
+
+
+async def measure(dispatch, events: List[tuple]) -> float:
+    """Measure dispatch duration per event in microseconds"""
+    start_time = time.perf_counter()
+    for guild_id, message_id, reaction in events:
+        await dispatch(guild_id, message_id, reaction)
+    return (time.perf_counter() - start_time) / len(events) * 1_000_000
+
+
+async def run_benchmark():
+    """Run dispatch with the both implementations and print results"""
+    SettingsCollection()._collection = TestCollection([{
+        "guild_id": guild_id,
+        "role_from_reaction": {str(guild_id): {emoji: 1 for emoji in ROLE_EMOJIS}},
+    } for guild_id in range(1, GUILDS_AMOUNT + 1)])
+    SettingsCache.clear()
+    events = produce_events()
+
+    previous_cost = await measure(previous_dispatch, events)
+    compiled_cost = await measure(ReactionStrategy.get_add_reaction_handlers, events)
+
+    print(f"{GUILDS_AMOUNT} guilds x {ROLE_REACTIONS_PER_GUILD} role reactions x {EVENTS_AMOUNT} events")
+    print(f"Dispatch with maps union per event: {previous_cost:.2f} us/event")
+    print(f"Dispatch with compiled tables: {compiled_cost:.2f} us/event")
+
+
+if __name__ == "__main__":
+    asyncio.run(run_benchmark())
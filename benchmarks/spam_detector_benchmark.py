@@ -0,0 +1,109 @@
+"""
+Benchmark of the spam detector message container with the sleeping task per message and with the users histories
+
+One minute of the messages at 100k messages per minute is fed at once, so all messages are inside the message
+lifecycle as in the steady state of the busy bot.
+
+Run: python -m benchmarks.spam_detector_benchmark
+"""
+import asyncio
+import gc
+import random
+import time
+import tracemalloc
+from collections import defaultdict
+from types import SimpleNamespace
+from typing import Callable, List
+
+from bdo_daily_bot.core.guild_security.guild_security_manager import GuildSecurityManager, MessageContainer
+
+MESSAGES_PER_MINUTE = 100_000
+USERS_AMOUNT = 20_000
+CHANNELS_AMOUNT = 50
+# Every SPAM_FREQUENCY message is the identical message of the one of the spammers
+SPAMMERS_AMOUNT = 100
+SPAM_FREQUENCY = 50
+CONTENTS = [f"Message {number}" for number in range(1000)]
+
+
+class PreviousMessageContainer:
+    """Previous message container implementation that sleeps one task per message until the message expiration"""
+    __message_container = defaultdict(lambda: defaultdict(lambda: set()))
+
+    @classmethod
+    async def add_message(cls, message: SimpleNamespace):
+        message_hash = MessageContainer.get_message_hash(message)
+        cls.__message_container[message.author.id][message_hash].add((message.channel.id, message.id))
+        asyncio.ensure_future(cls.__enable_message_lifecycle(message))
+
+    @classmethod
+    async def __enable_message_lifecycle(cls, message: SimpleNamespace):
+        await asyncio.sleep(MessageContainer.MESSAGE_LIFECYCLE_IN_SECONDS)
+        message_hash = MessageContainer.get_message_hash(message)
+        cls.__message_container[message.author.id][message_hash].discard((message.channel.id, message.id))
+
+    @classmethod
+    def get_messages_amount(cls, message: SimpleNamespace) -> int:
+        return len(cls.__message_container.get(message.author.id, {}).get(
+            MessageContainer.get_message_hash(message), set()))
+
+
+def produce_messages() -> List[SimpleNamespace]:
+    """Produce discord messages plugs of the random users with the random contents and of the spammers"""
+    random.seed(0)
+    messages = []
+    for message_id in range(MESSAGES_PER_MINUTE):
+        if message_id % SPAM_FREQUENCY:
+            user_id, content = random.randrange(USERS_AMOUNT), random.choice(CONTENTS)
+        else:
+            user_id, content = USERS_AMOUNT + random.randrange(SPAMMERS_AMOUNT), "Spam"
+        messages.append(SimpleNamespace(id=message_id, content=content, attachments=[],
+                                        author=SimpleNamespace(id=user_id),
+                                        channel=SimpleNamespace(id=random.randrange(CHANNELS_AMOUNT))))
+    return messages
+
+
+async def feed(add_message: Callable, get_messages_amount: Callable, messages: List[SimpleNamespace]):
+    """
+    Feed messages to the container as the spam checker does and print used memory, CPU time and tasks
+
+    :param add_message: coroutine function that adds message to the container
+    :param get_messages_amount: function that counts identical user messages
+    :param messages: discord messages plugs
+    """
+    gc.collect()
+    tracemalloc.start()
+    start_time = time.process_time()
+    spam_messages = 0
+    for message in messages:
+        await add_message(message)
+        if get_messages_amount(message) >= GuildSecurityManager.SPAM_MESSAGES_AMOUNT_TO_PREVENT:
+            spam_messages += 1
+    await asyncio.sleep(0)
+    cpu_time = time.process_time() - start_time
+    memory, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"    Spam messages: {spam_messages}")
+    print(f"    CPU time with memory tracing: {cpu_time * 1000:.2f} ms, "
+          f"{cpu_time / len(messages) * 1e6:.2f} us per message")
+    print(f"    Memory: {memory / 2 ** 20:.2f} MiB")
+    print(f"    Live tasks: {len(asyncio.all_tasks()) - 1}")
+
+
+async def run_benchmark():
+    """Feed one minute of messages to the both implementations and print results"""
+    messages = produce_messages()
+    print(f"{MESSAGES_PER_MINUTE} messages per minute from {USERS_AMOUNT} users in {CHANNELS_AMOUNT} channels")
+
+    print("Task per message container:")
+    await feed(PreviousMessageContainer.add_message, PreviousMessageContainer.get_messages_amount, messages)
+    for task in asyncio.all_tasks() - {asyncio.current_task()}:
+        task.cancel()
+    await asyncio.sleep(0)
+
+    print("Users histories container:")
+    await feed(MessageContainer.add_message, MessageContainer.get_messages_amount, messages)
+
+
+if __name__ == "__main__":
+    asyncio.run(run_benchmark())
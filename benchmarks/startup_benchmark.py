@@ -0,0 +1,146 @@
+"""
+Benchmark of the bot startup with sequential loading and with the staged concurrent pipeline
+
+Discord objects are plugs that answer with the discord latency, the database is the in-memory database.
+
+Run: python -m benchmarks.startup_benchmark
+"""
+import asyncio
+import time
+from datetime import datetime, timedelta
+from typing import Iterator, List
+
+from bdo_daily_bot.bot import BdoDailyBot
+from bdo_daily_bot.core.database.manager import DatabaseManager
+from bdo_daily_bot.core.discord_cache.channel_registry import ChannelRegistry
+from bdo_daily_bot.core.discord_cache.message_resolver import MessageResolver
+from bdo_daily_bot.core.guild_managers.managers_controller import ManagersController
+from bdo_daily_bot.core.guild_managers.raids_manager import RaidsGuildManager
+from bdo_daily_bot.core.raid.raid_channel import RaidChannel
+from bdo_daily_bot.core.raid.raid_item_factory import RaidItemFactory
+from bdo_daily_bot.core.raid.raid_member import RaidMemberFactory
+from bdo_daily_bot.settings import settings
+from test_framework.models.test_channel import TestChannel
+
+GUILDS_AMOUNT = 30
+RAIDS_AMOUNT = 60
+CHANNELS_PER_RAID = 3
+# Seconds of the one discord request
+DISCORD_LATENCY = 0.02
+# Discord requests of the guild manager initialization: category, information channel, history scan, embed edit
+MANAGER_INIT_REQUESTS = 4
+
+
+class BenchmarkGuild:
+    """Guild plug with raids channels plugs"""
+
+    def __init__(self, guild_id: int):
+        self.id = guild_id
+        self.name = f"Guild {guild_id}"
+        self.channels: List[TestChannel] = []
+
+    def __str__(self) -> str:
+        return self.name
+
+
+class BenchmarkBot:
+    """Bot plug with client cache of the guilds and channels"""
+
+    def __init__(self, guilds: List[BenchmarkGuild]):
+        self.guilds = {guild.id: guild for guild in guilds}
+
+    def get_guild(self, guild_id: int) -> BenchmarkGuild:
+        return self.guilds.get(guild_id)
+
+    def get_all_channels(self) -> Iterator[TestChannel]:
+        for guild in self.guilds.values():
+            yield from guild.channels
+
+    def get_user(self, _):
+        return None
+
+    async def fetch_channel(self, channel_id: int):
+        raise AssertionError(f"Channel {channel_id} should be found in the cache")
+
+
+async def init_manager_plug(manager: RaidsGuildManager):
+    """Guild manager initialization plug that waits for the discord requests"""
+    await asyncio.sleep(DISCORD_LATENCY * MANAGER_INIT_REQUESTS)
+    manager.raids_information_channel = None
+
+
+async def start_raid_flow_plug(_):
+    """Raid flow plug that does nothing"""
+
+
+async def fill_database(guilds: List[BenchmarkGuild]):
+    """Fill the in-memory database with guilds settings and raids with channels in several guilds"""
+    database = DatabaseManager()
+    await database.settings.collection.insert_many([
+        {"guild_id": guild.id, "guild": guild.name, "is_raids_enabled": True} for guild in guilds])
+    time_leaving = datetime.now() + timedelta(hours=1)
+    raids_documents = []
+    for raid_number in range(RAIDS_AMOUNT):
+        channels_info = []
+        for channel_number in range(CHANNELS_PER_RAID):
+            guild = guilds[(raid_number + channel_number) % len(guilds)]
+            channel = TestChannel(raid_number * CHANNELS_PER_RAID + channel_number + 1, [1, 2, 3], DISCORD_LATENCY)
+            channel.guild = guild
+            guild.channels.append(channel)
+            channels_info.append({"channel_id": channel.id, "reservation_message_id": 1,
+                                  "collection_message_id": 2, "table_message_id": 3})
+        raids_documents.append({
+            "captain_name": f"Captain{raid_number}", "game_server": "K-1",
+            "time_leaving": time_leaving + timedelta(minutes=raid_number), "time_reservation_open": datetime.now(),
+            "members": [{"nickname": f"Member{raid_number}"}], "channels_info": channels_info,
+        })
+    await database.raid.collection.insert_many(raids_documents)
+
+
+async def previous_load():
+    """Previous startup implementation with sequential managers initialization and raids restore"""
+    for guild_id in await DatabaseManager().settings.get_guilds_ids_with_enabled_raids():
+        await ManagersController.get_or_create(BdoDailyBot.bot.get_guild(guild_id))
+    for raid_item in await DatabaseManager().raid.get_all_raids():
+        raid = await RaidItemFactory.lazy_get_raid(raid_item)
+        raid.members = await RaidMemberFactory.produce_by_list_of_attributes(raid_item.members)
+        raid.channels = await RaidChannel.get_channels_from_channels_info(raid_item.channels_info, raid)
+
+
+def reset(guilds: List[BenchmarkGuild]):
+    """Remove loaded managers and cached messages"""
+    ManagersController.guilds_managers.clear()
+    for guild in guilds:
+        for channel in guild.channels:
+            MessageResolver.forget_channel(channel.id)
+
+
+async def run_benchmark():
+    """Run startup with the both implementations and print results"""
+    settings.DATABASE_BACKEND = "memory"
+    RaidsGuildManager.init = init_manager_plug
+    ManagersController._ManagersController__start_raid_flow = start_raid_flow_plug
+    guilds = [BenchmarkGuild(guild_id) for guild_id in range(1, GUILDS_AMOUNT + 1)]
+    BdoDailyBot.bot = BenchmarkBot(guilds)
+    await fill_database(guilds)
+    ChannelRegistry.load()
+
+    start_time = time.perf_counter()
+    await previous_load()
+    previous_duration = time.perf_counter() - start_time
+    reset(guilds)
+
+    start_time = time.perf_counter()
+    await ManagersController.load()
+    pipeline_duration = time.perf_counter() - start_time
+
+    print(f"{GUILDS_AMOUNT} guilds, {RAIDS_AMOUNT} raids x {CHANNELS_PER_RAID} channels, "
+          f"discord latency {DISCORD_LATENCY * 1000:.0f} ms")
+    print(f"Sequential startup: {previous_duration * 1000:.2f} ms")
+    print(f"Staged startup: {pipeline_duration * 1000:.2f} ms")
+    for stage_name, duration in ManagersController.startup_durations.items():
+        print(f"    {stage_name}: {duration * 1000:.2f} ms")
+
+
+if __name__ == "__main__":
+    asyncio.run(run_benchmark())
@@ -92,6 +92,7 @@ async def check_update_captain(captain_collection: CaptainCollection, test_data:
     await setup_database(captain_collection, data_setup)
 
     await captain_collection.update_captain(discord_id, Raid(**raid_setup))
+    await captain_collection.statistics_buffer.flush()
 
     search_keys = {'discord_id': discord_id}
     search_results = await find_document(captain_collection, search_keys)
@@ -0,0 +1,70 @@
+"""Contain checks of the database collections indexes."""
+from motor.motor_asyncio import AsyncIOMotorDatabase
+
+from bdo_daily_bot.core.database.index_bootstrapper import IndexBootstrapper
+from test_framework.scripts.common.data_factory import parse_test_sample
+from test_framework.scripts.database_scripts.explain_query import get_query_indexes
+
+
+async def check_ensure_indexes(database: AsyncIOMotorDatabase, test_data: dict):
+    """
+    Check that all declared indexes are created and repeated creation doesn't fail.
+
+    :param database: Mongo database.
+    :type database: AsyncIOMotorDatabase
+    :param test_data: Database test data.
+    :type test_data: dict
+    """
+    _, data, expected_data = parse_test_sample(test_data)
+
+    for _ in range(data['repeats']):
+        await IndexBootstrapper.ensure_indexes(database)
+
+    assert_message = "Declared indexes are missing after the indexes creation, should be created."
+    assert await IndexBootstrapper.get_missing_indexes(database) == {}, assert_message
+    for collection_name, index_names in expected_data.items():
+        existing_indexes = set((await database[collection_name].index_information()).keys())
+        assert_message = f"Collection {collection_name} has indexes {existing_indexes}, should have {index_names}."
+        assert set(index_names) <= existing_indexes, assert_message
+
+
+async def check_missing_indexes(database: AsyncIOMotorDatabase, test_data: dict):
+    """
+    Check that indexes of not indexed collections are reported as missing.
+
+    :param database: Mongo database.
+    :type database: AsyncIOMotorDatabase
+    :param test_data: Database test data.
+    :type test_data: dict
+    """
+    data_setup, _, expected_data = parse_test_sample(test_data)
+
+    for collection_name, document in data_setup.items():
+        await database[collection_name].insert_one(document)
+
+    missing_indexes = await IndexBootstrapper.get_missing_indexes(database)
+
+    for collection_name, index_names in expected_data.items():
+        assert_message = f"Unexpected missing indexes of collection {collection_name}, should be {index_names}."
+        assert missing_indexes.get(collection_name) == set(index_names), assert_message
+
+
+async def check_query_uses_index(database: AsyncIOMotorDatabase, test_data: dict):
+    """
+    Check that the collection query scans the declared index instead of the whole collection.
+
+    :param database: Mongo database.
+    :type database: AsyncIOMotorDatabase
+    :param test_data: Database test data.
+    :type test_data: dict
+    """
+    data_setup, data, expected_data = parse_test_sample(test_data)
+    collection = database[data['collection']]
+
+    await IndexBootstrapper.ensure_indexes(database)
+    await collection.insert_many(data_setup)
+
+    query_indexes = await get_query_indexes(collection, data['query'])
+
+    assert_message = f"Query {data['query']} scans indexes {query_indexes}, should scan {expected_data}."
+    assert expected_data in query_indexes, assert_message
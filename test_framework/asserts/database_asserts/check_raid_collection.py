@@ -0,0 +1,125 @@
+"""Contain checks of the database raid collection."""
+from bdo_daily_bot.core.database.raid_collection import RaidCollection
+from bdo_daily_bot.core.raid.raid_item import RaidItem
+from test_framework.scripts.common.data_factory import parse_test_sample
+from test_framework.scripts.database_scripts.find_in_database import is_data_exist
+from test_framework.scripts.database_scripts.setup_database import setup_database
+
+
+async def check_update_raid(raid_collection: RaidCollection, test_data: dict):
+    """
+    Check that the raid update creates or updates the single raid document.
+
+    :param raid_collection: MongoDB collection.
+    :type raid_collection: RaidCollection
+    :param test_data: Database test data.
+    :type test_data: dict
+    """
+    data_setup, data, expected_data = parse_test_sample(test_data)
+
+    await setup_database(raid_collection, data_setup)
+
+    await raid_collection.update(RaidItem(**data))
+
+    raid_key = raid_collection.get_raid_key(data['captain_name'], data['time_leaving'])
+    assert_message = "Raid update should keep the single raid document."
+    assert await raid_collection.collection.count_documents(raid_key) == 1, assert_message
+    assert_message = f"Raid document was not updated, should be {expected_data}."
+    assert await is_data_exist(raid_collection, expected_data), assert_message
+
+
+async def check_delete_raid(raid_collection: RaidCollection, test_data: dict):
+    """
+    Check that the raid is deleted by the raid key.
+
+    :param raid_collection: MongoDB collection.
+    :type raid_collection: RaidCollection
+    :param test_data: Database test data.
+    :type test_data: dict
+    """
+    data_setup, data, _ = parse_test_sample(test_data)
+
+    await setup_database(raid_collection, data_setup)
+
+    await raid_collection.delete(RaidItem(**data))
+
+    assert_message = "Raid document was found after deletion, should be deleted."
+    assert not await is_data_exist(raid_collection, raid_collection.get_raid_key(data['captain_name'],
+                                                                                 data['time_leaving'])), assert_message
+
+
+async def check_add_raid_member(raid_collection: RaidCollection, test_data: dict):
+    """
+    Check that the raid member is added to the raid document once.
+
+    :param raid_collection: MongoDB collection.
+    :type raid_collection: RaidCollection
+    :param test_data: Database test data.
+    :type test_data: dict
+    """
+    data_setup, data, expected_data = parse_test_sample(test_data)
+
+    await setup_database(raid_collection, data_setup)
+
+    await raid_collection.add_member(**data)
+    await raid_collection.add_member(**data)
+
+    assert_message = f"Unexpected raid members after adding the member twice, should be {expected_data}."
+    assert await is_data_exist(raid_collection, expected_data), assert_message
+
+
+async def check_remove_raid_member(raid_collection: RaidCollection, test_data: dict):
+    """
+    Check that the raid member is removed from the raid document.
+
+    :param raid_collection: MongoDB collection.
+    :type raid_collection: RaidCollection
+    :param test_data: Database test data.
+    :type test_data: dict
+    """
+    data_setup, data, expected_data = parse_test_sample(test_data)
+
+    await setup_database(raid_collection, data_setup)
+
+    await raid_collection.remove_member(**data)
+
+    assert_message = f"Unexpected raid members after removing the member, should be {expected_data}."
+    assert await is_data_exist(raid_collection, expected_data), assert_message
+
+
+async def check_get_expired_raids(raid_collection: RaidCollection, test_data: dict):
+    """
+    Check that only raids that left before the expiration time are found with the key and channels information.
+
+    :param raid_collection: MongoDB collection.
+    :type raid_collection: RaidCollection
+    :param test_data: Database test data.
+    :type test_data: dict
+    """
+    data_setup, data, expected_data = parse_test_sample(test_data)
+
+    await setup_database(raid_collection, data_setup)
+
+    expired_raids_documents = await raid_collection.get_expired_raids_documents(**data)
+
+    assert_message = f"Unexpected expired raids documents, should be {expected_data}."
+    assert expired_raids_documents == expected_data, assert_message
+
+
+async def check_delete_expired_raids(raid_collection: RaidCollection, test_data: dict):
+    """
+    Check that only raids that left before the expiration time are deleted.
+
+    :param raid_collection: MongoDB collection.
+    :type raid_collection: RaidCollection
+    :param test_data: Database test data.
+    :type test_data: dict
+    """
+    data_setup, data, expected_data = parse_test_sample(test_data)
+
+    await setup_database(raid_collection, data_setup)
+
+    await raid_collection.delete_expired_raids(**data)
+
+    assert_message = f"Unexpected raid document existence after expired raids deletion, should be {expected_data}."
+    assert await is_data_exist(raid_collection, data_setup) == expected_data, assert_message
@@ -85,6 +85,31 @@ async def check_set_first_notification(user_collection: UserCollection, test_dat
     assert search_results == expected_data, assert_message
 
 
+async def check_set_first_notifications(user_collection: UserCollection, test_data: dict):
+    """
+    Check the correctness of setting the fact of receiving the first notification by the several users.
+
+    :param user_collection: MongoDB collection.
+    :type user_collection: UserCollection
+    :param test_data: Database test data.
+    :type test_data: dict
+    """
+    data_setup, data, expected_data = parse_test_sample(test_data)
+
+    for user_document in data_setup or []:
+        await setup_database(user_collection, user_document)
+
+    await user_collection.set_first_notifications(**data)
+
+    for expected_document in expected_data or []:
+        search_keys = {'discord_id': expected_document['discord_id']}
+        search_results = await find_document(user_collection, search_keys)
+        search_results.pop('_id') if search_results and search_results.get('_id') else None
+
+        assert_message = "The updated document is not as expected, should be same."
+        assert search_results == expected_document, assert_message
+
+
 async def check_set_notify_off(user_collection: UserCollection, test_data: dict):
     """
     Check that the notification deactivation setting is correct.
@@ -145,6 +170,7 @@ async def check_user_joined_raid(user_collection: UserCollection, test_data: dic
     await setup_database(user_collection, data_setup)
 
     await user_collection.user_joined_raid(**data)
+    await user_collection.entries_buffer.flush()
 
     search_keys = {'discord_id': data['discord_id']}
     search_results = await find_document(user_collection, search_keys)
@@ -168,6 +194,7 @@ async def check_user_leave_raid(user_collection: UserCollection, test_data: dict
     await setup_database(user_collection, data_setup)
 
     await user_collection.user_leave_raid(**data)
+    await user_collection.entries_buffer.flush()
 
     search_keys = {'discord_id': data['discord_id']}
     search_results = await find_document(user_collection, search_keys)
@@ -1,8 +1,11 @@
 """Contain fixtures for database collections"""
 import pytest
+from motor.motor_asyncio import AsyncIOMotorDatabase
 
 from bdo_daily_bot.core.database.captain_collection import CaptainCollection
+from bdo_daily_bot.core.database.database import Database
 from bdo_daily_bot.core.database.manager import DatabaseManager
+from bdo_daily_bot.core.database.raid_collection import RaidCollection
 from bdo_daily_bot.core.database.settings_collection import SettingsCollection
 from bdo_daily_bot.core.database.user_collection import UserCollection
 
@@ -38,3 +41,25 @@ def user_collection() -> UserCollection:
     :rtype: UserCollection
     """
     return DatabaseManager().user
+
+
+@pytest.fixture(scope="session")
+def raid_collection() -> RaidCollection:
+    """
+    Database raid collection object.
+
+    :return: Database raid collection.
+    :rtype: RaidCollection
+    """
+    return DatabaseManager().raid
+
+
+@pytest.fixture(scope="session")
+def database() -> AsyncIOMotorDatabase:
+    """
+    Mongo database object.
+
+    :return: Mongo database.
+    :rtype: AsyncIOMotorDatabase
+    """
+    return Database().database
@@ -0,0 +1,36 @@
+"""Contain change stream plug class for tests reasons"""
+import asyncio
+from typing import Any, Dict, Optional
+
+
+class TestChangeStream:
+    """Change stream plug that yields pushed change events until closed"""
+
+    def __init__(self):
+        self.__changes: asyncio.Queue = asyncio.Queue()
+
+    def push(self, change: Optional[Dict[str, Any]]):
+        """
+        Push change event to the stream
+
+        :param change: change event. None closes the stream
+        """
+        self.__changes.put_nowait(change)
+
+    def close(self):
+        """Close the stream"""
+        self.push(None)
+
+    async def wait_processed(self):
+        """Wait until all pushed change events are read"""
+        while not self.__changes.empty():
+            await asyncio.sleep(0)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self) -> Dict[str, Any]:
+        change = await self.__changes.get()
+        if change is None:
+            raise StopAsyncIteration
+        return change
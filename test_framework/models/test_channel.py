@@ -0,0 +1,53 @@
+"""Contain test channel and message plug classes for tests reasons"""
+import asyncio
+from typing import Dict, List, Optional
+
+from discord import NotFound
+
+
+class TestResponse:
+    """Response plug for discord http exceptions"""
+    status = 404
+    reason = "Not Found"
+
+
+class TestMessage:
+    """Message plug"""
+
+    def __init__(self, channel: "TestChannel", message_id: int):
+        """
+        :param channel: channel plug with this message
+        :param message_id: discord message id
+        """
+        self.channel = channel
+        self.id = message_id
+
+
+class TestChannel:
+    """Text channel plug that counts requests and can answer with delay"""
+
+    def __init__(self, channel_id: int, message_ids: Optional[List[int]] = None, delay: float = 0):
+        """
+        :param channel_id: discord channel id
+        :param message_ids: ids of the messages existing in the channel
+        :param delay: seconds to wait before answer on each request
+        """
+        self.id = channel_id
+        self.guild = None
+        self.delay = delay
+        self.messages: Dict[int, TestMessage] = {
+            message_id: TestMessage(self, message_id) for message_id in message_ids or []}
+        self.fetch_requests = 0
+
+    async def fetch_message(self, message_id: int) -> TestMessage:
+        """
+        Return message plug by id or raise NotFound as discord does
+
+        :param message_id: discord message id
+        :return: message plug
+        """
+        self.fetch_requests += 1
+        await asyncio.sleep(self.delay)
+        if message := self.messages.get(message_id):
+            return message
+        raise NotFound(TestResponse(), "Unknown Message")
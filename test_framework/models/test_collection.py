@@ -0,0 +1,66 @@
+"""Contain database collection plug class for tests reasons"""
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+
+class TestCollection:
+    """Collection plug that keeps documents in memory and counts find requests"""
+
+    def __init__(self, documents: Optional[List[Dict[str, Any]]] = None):
+        """
+        :param documents: documents of the collection
+        """
+        self.documents = documents or []
+        self.find_requests = 0
+        self.bulk_writes: List[List[Any]] = []
+
+    @staticmethod
+    def __matches(document: Dict[str, Any], query: Dict[str, Any]) -> bool:
+        """Check that document matches all query fields by value or by $in list of values"""
+        for key, value in query.items():
+            if isinstance(value, dict) and "$in" in value:
+                if document.get(key) not in value["$in"]:
+                    return False
+            elif document.get(key) != value:
+                return False
+        return True
+
+    def __find(self, query: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Find stored document that matches all query fields"""
+        for document in self.documents:
+            if self.__matches(document, query):
+                return document
+        return None
+
+    async def find(self, query: Dict[str, Any], *_) -> AsyncIterator[Dict[str, Any]]:
+        """Iterate over copies of the documents that match query and count request"""
+        self.find_requests += 1
+        for document in [document for document in self.documents if self.__matches(document, query)]:
+            yield dict(document)
+
+    async def find_one(self, query: Dict[str, Any], *_) -> Optional[Dict[str, Any]]:
+        """Find copy of the document that matches query and count request"""
+        self.find_requests += 1
+        document = self.__find(query)
+        return dict(document) if document else None
+
+    async def insert_one(self, document: Dict[str, Any]):
+        """Store copy of the given document"""
+        self.documents.append(dict(document))
+
+    async def find_one_and_update(self, query: Dict[str, Any], update: Dict[str, Any],
+                                  **_) -> Optional[Dict[str, Any]]:
+        """Apply $set, $inc, $push and $pull of the update to the document that matches query and return its copy"""
+        if document := self.__find(query):
+            document.update(update.get("$set", {}))
+            for key, value in update.get("$inc", {}).items():
+                document[key] = document.get(key, 0) + value
+            for key, value in update.get("$push", {}).items():
+                document[key] = document.get(key, []) + [value]
+            for key, condition in update.get("$pull", {}).items():
+                document[key] = [item for item in document.get(key, []) if not self.__matches(item, condition)]
+            return dict(document)
+        return None
+
+    async def bulk_write(self, operations: List[Any], **_):
+        """Remember operations of the bulk write"""
+        self.bulk_writes.append(list(operations))
@@ -0,0 +1,37 @@
+"""Contain functions to inspect the database query plans."""
+from typing import Any, Dict, Iterator, Set
+
+from motor.motor_asyncio import AsyncIOMotorCollection
+
+
+def __iterate_stages(plan: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+    """
+    Iterate over all stages of the query plan.
+
+    :param plan: Query plan or one of its stages.
+    :type plan: Dict[str, Any]
+    :return: Query plan stages.
+    :rtype: Iterator[Dict[str, Any]]
+    """
+    yield plan
+    if input_stage := plan.get('inputStage'):
+        yield from __iterate_stages(input_stage)
+    for input_stage in plan.get('inputStages', []):
+        yield from __iterate_stages(input_stage)
+
+
+async def get_query_indexes(collection: AsyncIOMotorCollection, query: dict) -> Set[str]:
+    """
+    Gets names of the indexes that the winning query plan scans.
+
+    :param collection: MongoDB collection.
+    :type collection: AsyncIOMotorCollection
+    :param query: Find query filter.
+    :type query: dict
+    :return: Names of the scanned indexes. Empty if the query scans the whole collection.
+    :rtype: Set[str]
+    """
+    explanation = await collection.find(query).explain()
+    winning_plan = explanation['queryPlanner']['winningPlan']
+    winning_plan = winning_plan.get('queryPlan', winning_plan)
+    return {stage['indexName'] for stage in __iterate_stages(winning_plan) if stage.get('stage') == 'IXSCAN'}
@@ -0,0 +1,99 @@
+"""Test that the counters changes are merged into the one bulk write."""
+import pytest
+from pymongo.errors import AutoReconnect
+
+from bdo_daily_bot.core.database.counter_buffer import CounterBuffer
+from bdo_daily_bot.core.database.memory_database import MemoryCollection
+
+
+def count_bulk_writes(collection: MemoryCollection) -> list:
+    """
+    Remember operations of every bulk write of the collection
+
+    :param collection: memory collection to watch
+    :return: operations of the collection bulk writes
+    """
+    bulk_writes = []
+    bulk_write = collection.bulk_write
+
+    async def counted_bulk_write(operations, **kwargs):
+        bulk_writes.append(operations)
+        return await bulk_write(operations, **kwargs)
+
+    collection.bulk_write = counted_bulk_write
+    return bulk_writes
+
+
+async def get_counters(collection: MemoryCollection, *fields: str) -> dict:
+    """
+    Gets counters of all collection documents
+
+    :param collection: memory collection with users documents
+    :param fields: names of counters
+    :return: counters by discord id
+    """
+    return {document["discord_id"]: tuple(document.get(field) for field in fields)
+            async for document in collection.find({})}
+
+
+@pytest.mark.asyncio
+async def test_changes_merged_into_one_write():
+    """Test that the burst of changes is written with one bulk write and opposite changes net out."""
+    collection = MemoryCollection("Test users")
+    await collection.insert_many([{"discord_id": discord_id, "entries": discord_id % 3} for discord_id in range(10)])
+    bulk_writes = count_bulk_writes(collection)
+    counter_buffer = CounterBuffer(lambda: collection, "Test entries", non_negative=True)
+    for discord_id in range(10):
+        for _ in range(5):
+            counter_buffer.increment(discord_id, {"entries": 1})
+            counter_buffer.increment(discord_id, {"entries": -1})
+        counter_buffer.increment(discord_id, {"entries": 1 if discord_id % 2 else -1})
+
+    await counter_buffer.flush()
+
+    assert counter_buffer.changes == 110 and len(bulk_writes) == 1 and counter_buffer.writes == 1
+    expected_entries = {discord_id: (max(0, discord_id % 3 + (1 if discord_id % 2 else -1)),)
+                        for discord_id in range(10)}
+    assert await get_counters(collection, "entries") == expected_entries, "Entries should not be negative"
+
+
+@pytest.mark.asyncio
+async def test_netted_changes_not_written():
+    """Test that the changes that net out don't request the database."""
+    collection = MemoryCollection("Test users")
+    await collection.insert_one({"discord_id": 1, "entries": 3})
+    bulk_writes = count_bulk_writes(collection)
+    counter_buffer = CounterBuffer(lambda: collection, "Test entries")
+    counter_buffer.increment(1, {"entries": 1})
+    counter_buffer.increment(1, {"entries": -1})
+
+    await counter_buffer.flush()
+
+    assert not bulk_writes and counter_buffer.writes == 0
+    assert await get_counters(collection, "entries") == {1: (3,)}
+
+
+@pytest.mark.asyncio
+async def test_failed_changes_returned():
+    """Test that the changes that were not written because of the database error are written with the next flush."""
+    collection = MemoryCollection("Test captains")
+    await collection.insert_one({"discord_id": 1, "raids_created": 5, "last_created": 0})
+    failed_writes = []
+
+    async def fail_bulk_write(operations, **_):
+        failed_writes.append(operations)
+        raise AutoReconnect("Test connection error")
+
+    failed_collection = MemoryCollection("Test captains")
+    failed_collection.bulk_write = fail_bulk_write
+    collections = [failed_collection, collection]
+    counter_buffer = CounterBuffer(lambda: collections[0], "Test statistics")
+    counter_buffer.increment(1, {"raids_created": 1}, {"last_created": 1})
+
+    await counter_buffer.flush()
+    collections.pop(0)
+    counter_buffer.increment(1, {"raids_created": 1}, {"last_created": 2})
+    await counter_buffer.flush()
+
+    assert len(failed_writes) == 1 and counter_buffer.writes == 1
+    assert await get_counters(collection, "raids_created", "last_created") == {1: (7, 2)}
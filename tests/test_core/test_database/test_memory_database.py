@@ -0,0 +1,130 @@
+"""Test that the in-memory database behaves like MongoDB for the queries and updates used by the bot collections."""
+import pytest
+from pymongo import IndexModel, InsertOne, ReturnDocument, UpdateOne
+from pymongo.errors import BulkWriteError, DuplicateKeyError
+
+from bdo_daily_bot.core.database.memory_database import MemoryDatabase
+
+
+@pytest.mark.asyncio
+async def test_query_and_update():
+    """Test that the documents are found by the nested fields and updated with the operators and pipelines."""
+    collection = MemoryDatabase("test_discord")["raid"]
+    await collection.insert_many([
+        {"captain_name": "Mandeson", "members": [{"nickname": "Гуляка"}], "entries": 1},
+        {"captain_name": "Гуляка", "members": [], "entries": 0},
+    ])
+
+    assert await collection.count_documents({"members.nickname": "Гуляка"}) == 1
+    assert await collection.count_documents({"entries": {"$gt": 0}, "captain_name": {"$in": ["Mandeson"]}}) == 1
+
+    await collection.update_one({"captain_name": "Mandeson"}, {"$pull": {"members": {"nickname": "Гуляка"}}})
+    await collection.bulk_write([
+        UpdateOne({"captain_name": "Гуляка"}, [{"$set": {"entries": {"$max": [0, {"$add": ["$entries", -1]}]}}}]),
+        UpdateOne({"captain_name": "Mandeson"}, {"$inc": {"entries": 2}}),
+    ])
+
+    documents = {document["captain_name"]: document async for document in collection.find({}, {"_id": 0})}
+    assert documents == {
+        "Mandeson": {"captain_name": "Mandeson", "members": [], "entries": 3},
+        "Гуляка": {"captain_name": "Гуляка", "members": [], "entries": 0},
+    }
+
+
+@pytest.mark.asyncio
+async def test_upsert_and_unique_index():
+    """Test that the upsert creates document from the query fields and the unique index rejects duplicates."""
+    collection = MemoryDatabase("test_discord")["user"]
+    await collection.create_indexes([IndexModel("discord_id", unique=True)])
+
+    user = await collection.find_one_and_update(
+        {"discord_id": 1}, {"$set": {"nickname": "Гуляка"}}, upsert=True, return_document=ReturnDocument.AFTER)
+
+    assert user["discord_id"] == 1 and user["nickname"] == "Гуляка"
+    with pytest.raises(DuplicateKeyError):
+        await collection.insert_one({"discord_id": 1})
+
+
+@pytest.mark.asyncio
+async def test_query_operators_and_arrays():
+    """Test that the $ne, $exists and array conditions match documents like MongoDB."""
+    collection = MemoryDatabase("test_discord")["raid"]
+    await collection.insert_many([
+        {"name": "first", "members": [{"nickname": "Гуляка"}, {"nickname": "Mandeson"}], "tags": ["a", "b"]},
+        {"name": "second", "members": [{"nickname": "Mandeson"}], "tags": ["b"], "is_finished": True},
+        {"name": "third", "members": []},
+    ])
+
+    async def find_names(query):
+        return sorted([document["name"] async for document in collection.find(query)])
+
+    assert await find_names({"members.nickname": {"$ne": "Гуляка"}}) == ["second", "third"], \
+        "$ne should match documents without any array element equal to the value"
+    assert await find_names({"is_finished": {"$ne": True}}) == ["first", "third"]
+    assert await find_names({"tags": {"$exists": False}}) == ["third"]
+    assert await find_names({"is_finished": {"$exists": True}}) == ["second"]
+    assert await find_names({"tags": "b"}) == ["first", "second"], "Array should match by its element"
+    assert await find_names({"tags": ["a", "b"]}) == ["first"], "Array should match by the whole array"
+    assert await find_names({"members.0.nickname": "Mandeson"}) == ["second"]
+    assert await find_names({"members": []}) == ["third"]
+
+
+@pytest.mark.asyncio
+async def test_upsert():
+    """Test that the upsert inserts document from the query equality fields, $set and $setOnInsert."""
+    collection = MemoryDatabase("test_discord")["captain"]
+
+    result = await collection.update_one(
+        {"discord_id": 1, "raids_created": {"$gte": 0}},
+        {"$set": {"captain_name": "Mandeson"}, "$setOnInsert": {"raids_created": 0}, "$inc": {"drove_people": 2}},
+        upsert=True)
+    assert result.upserted_id and not result.matched_count
+
+    result = await collection.update_one(
+        {"discord_id": 1}, {"$setOnInsert": {"captain_name": "Гуляка"}, "$inc": {"drove_people": 3}}, upsert=True)
+    assert (result.upserted_id, result.matched_count, result.modified_count) == (None, 1, 1)
+
+    assert await collection.find_one({"discord_id": 1}, {"_id": 0}) == \
+           {"discord_id": 1, "captain_name": "Mandeson", "raids_created": 0, "drove_people": 5}
+
+
+@pytest.mark.asyncio
+async def test_find_one_and_update_return_document():
+    """Test that the find one and update returns the document before or after the update with projection."""
+    collection = MemoryDatabase("test_discord")["settings"]
+    await collection.insert_one({"guild_id": 1, "notification_roles": [{"role_id": 1}, {"role_id": 2}]})
+
+    before = await collection.find_one_and_update(
+        {"guild_id": 1}, {"$pull": {"notification_roles": {"role_id": 1}}}, {"_id": 0})
+    after = await collection.find_one_and_update(
+        {"guild_id": 1}, {"$push": {"notification_roles": {"role_id": 3}}}, {"_id": 0},
+        return_document=ReturnDocument.AFTER)
+
+    assert before == {"guild_id": 1, "notification_roles": [{"role_id": 1}, {"role_id": 2}]}
+    assert after == {"guild_id": 1, "notification_roles": [{"role_id": 2}, {"role_id": 3}]}
+    assert await collection.find_one_and_update({"guild_id": 2}, {"$set": {"guild": "Guild"}}) is None
+
+
+@pytest.mark.asyncio
+async def test_unique_index_in_bulk_write():
+    """Test that the unique index rejects duplicates in the bulk write, unordered write applies other operations."""
+    collection = MemoryDatabase("test_discord")["user"]
+    await collection.create_indexes([IndexModel("discord_id", unique=True)])
+    await collection.insert_many([{"discord_id": 1, "entries": 0}, {"discord_id": 2, "entries": 0}])
+    operations = [
+        UpdateOne({"discord_id": 1}, {"$set": {"discord_id": 2}}),
+        UpdateOne({"discord_id": 2}, {"$inc": {"entries": 1}}),
+        InsertOne({"discord_id": 1}),
+    ]
+
+    with pytest.raises(BulkWriteError) as error:
+        await collection.bulk_write(operations)
+    assert error.value.details["nModified"] == 0, "Ordered write should stop on the first error"
+
+    with pytest.raises(BulkWriteError) as error:
+        await collection.bulk_write(operations, ordered=False)
+    assert [write_error["index"] for write_error in error.value.details["writeErrors"]] == [0, 2]
+    assert error.value.details["nModified"] == 1
+
+    documents = [document async for document in collection.find({}, {"_id": 0})]
+    assert documents == [{"discord_id": 1, "entries": 0}, {"discord_id": 2, "entries": 1}]
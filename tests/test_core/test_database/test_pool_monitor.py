@@ -0,0 +1,45 @@
+"""Test that the database connection pool metrics are collected and the client options are valid."""
+import pytest
+from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import monitoring
+
+from bdo_daily_bot.core.database.pool_monitor import PoolMetrics, PoolMonitor
+from bdo_daily_bot.settings import settings
+
+ADDRESS = ("localhost", 27017)
+
+
+@pytest.fixture()
+def pool_monitor(monkeypatch) -> PoolMonitor:
+    """
+    Pool monitor with empty metrics
+
+    :return: pool monitor
+    """
+    monkeypatch.setattr(PoolMonitor, "metrics", PoolMetrics())
+    return PoolMonitor()
+
+
+def test_checkout_metrics(pool_monitor: PoolMonitor):
+    """Test that the checkouts wait time and connections in use are counted."""
+    for connection_id in range(3):
+        pool_monitor.connection_created(monitoring.ConnectionCreatedEvent(ADDRESS, connection_id))
+        pool_monitor.connection_check_out_started(monitoring.ConnectionCheckOutStartedEvent(ADDRESS))
+        pool_monitor.connection_checked_out(monitoring.ConnectionCheckedOutEvent(ADDRESS, connection_id))
+    pool_monitor.connection_checked_in(monitoring.ConnectionCheckedInEvent(ADDRESS, 0))
+    pool_monitor.connection_closed(monitoring.ConnectionClosedEvent(ADDRESS, 0, "idle"))
+
+    assert PoolMonitor.metrics.connections == 2
+    assert PoolMonitor.metrics.in_use == 2 and PoolMonitor.metrics.max_in_use == 3
+    assert PoolMonitor.metrics.checkouts == 3
+    assert 0 <= PoolMonitor.metrics.average_wait_time <= PoolMonitor.metrics.max_wait_time
+
+
+def test_client_options(pool_monitor: PoolMonitor):
+    """Test that the client is created with the pool options from the settings."""
+    client = AsyncIOMotorClient("mongodb://localhost:27017", event_listeners=[pool_monitor],
+                                **settings.DATABASE_CLIENT_OPTIONS)
+
+    assert client.options.pool_options.max_pool_size == settings.DATABASE_CLIENT_OPTIONS["maxPoolSize"]
+    assert client.options.pool_options.min_pool_size == settings.DATABASE_CLIENT_OPTIONS["minPoolSize"]
+    client.close()
@@ -0,0 +1,133 @@
+"""Test that the guilds settings are read through the cache and invalidated on changes."""
+from datetime import time
+
+import pytest
+
+from bdo_daily_bot.core.database.settings_cache import SettingsCache
+from bdo_daily_bot.core.database.settings_change_listener import SettingsChangeListener
+from bdo_daily_bot.core.database.settings_collection import SettingsCollection
+from test_framework.models.test_change_stream import TestChangeStream
+from test_framework.models.test_collection import TestCollection
+
+GUILD_ID = 726859545082855483
+
+
+@pytest.fixture()
+def settings_collection() -> SettingsCollection:
+    """
+    Settings collection with the collection plug instead of the database collection
+
+    :return: settings collection
+    """
+    SettingsCache.clear()
+    settings_collection = SettingsCollection()
+    original_collection = settings_collection._collection
+    settings_collection._collection = TestCollection([{
+        "guild_id": GUILD_ID,
+        "guild": "Test guild",
+        "role_from_reaction": {"1": {"🐉": 2}},
+    }])
+    yield settings_collection
+    settings_collection._collection = original_collection
+    SettingsCache.clear()
+
+
+@pytest.mark.asyncio
+async def test_reactions_read_from_cache(settings_collection: SettingsCollection):
+    """Test that the repeated reactions settings requests don't request the database."""
+    for _ in range(10):
+        assert await settings_collection.get_reactions_for_action_with_roles(GUILD_ID) == ["🐉"]
+        assert await settings_collection.get_reactions_for_action_with_roles(GUILD_ID + 1) == []
+
+    assert settings_collection.collection.find_requests == 2, "Settings should be requested once per guild"
+
+
+@pytest.mark.asyncio
+async def test_setter_invalidates_cache(settings_collection: SettingsCollection):
+    """Test that the settings setter invalidates cached guild settings."""
+    await settings_collection.get_reactions_for_action_with_roles(GUILD_ID)
+    await settings_collection.set_reaction_by_role(GUILD_ID, "Test guild", 1, "🐲", 3)
+
+    assert sorted(await settings_collection.get_reactions_for_action_with_roles(GUILD_ID)) == ["🐉", "🐲"]
+
+
+@pytest.mark.asyncio
+async def test_change_listener_invalidates_cache(settings_collection: SettingsCollection):
+    """Test that the change event from another bot process invalidates cached guild settings."""
+    change_stream = TestChangeStream()
+    SettingsChangeListener.start(change_stream)
+    try:
+        await settings_collection.get_reactions_for_action_with_roles(GUILD_ID)
+        settings_collection.collection.documents[0]["role_from_reaction"] = {}
+        assert await settings_collection.get_reactions_for_action_with_roles(GUILD_ID) == ["🐉"]
+
+        change_stream.push({"operationType": "update", "fullDocument": {"guild_id": GUILD_ID}})
+        await change_stream.wait_processed()
+
+        assert await settings_collection.get_reactions_for_action_with_roles(GUILD_ID) == []
+    finally:
+        change_stream.close()
+        SettingsChangeListener.stop()
+
+
+@pytest.mark.asyncio
+async def test_invalidated_during_loading_not_cached(settings_collection: SettingsCollection, monkeypatch):
+    """Test that the settings loaded before the concurrent change are not cached."""
+    collection = settings_collection.collection
+    find_one = collection.find_one
+
+    async def find_one_before_change(query):
+        settings_document = await find_one(query)
+        collection.documents[0]["role_from_reaction"] = {}
+        SettingsCache.invalidate(GUILD_ID)
+        return settings_document
+
+    monkeypatch.setattr(collection, "find_one", find_one_before_change)
+    assert await settings_collection.get_reactions_for_action_with_roles(GUILD_ID) == ["🐉"]
+    monkeypatch.setattr(collection, "find_one", find_one)
+
+    assert await settings_collection.get_reactions_for_action_with_roles(GUILD_ID) == [], \
+        "Settings loaded before the change should not be cached"
+
+
+@pytest.mark.asyncio
+async def test_setters_keep_changes_of_other_writers(settings_collection: SettingsCollection):
+    """Test that the setters update changed fields only and find settings by guild id, not by cached document."""
+    await settings_collection.set_notification_role("Test guild", GUILD_ID, role_name="Old", role_id=1,
+                                                    start_time=time(10), end_time=time(12))
+    await settings_collection.find_settings_post(GUILD_ID)
+    settings_document = settings_collection.collection.documents[0]
+    settings_document["guild"] = "Renamed guild"
+    settings_document["notification_roles"].append({"role_id": 2, "role_name": "Other"})
+
+    await settings_collection.set_category_channel_id(GUILD_ID, "Test guild", 10)
+    await settings_collection.set_information_channel_id(GUILD_ID, "Test guild", 11)
+    await settings_collection.set_raids_enabled("Test guild", GUILD_ID)
+    await settings_collection.set_notification_role("Test guild", GUILD_ID, role_name="New", role_id=3,
+                                                    start_time=time(10), end_time=time(12))
+    await settings_collection.remove_notification_role(GUILD_ID, "Test guild", 1)
+
+    assert settings_document["guild"] == "Renamed guild", "Change of the other writer should not be overwritten"
+    assert (settings_document["category_channel_id"], settings_document["information_channel_id"]) == (10, 11)
+    assert settings_document["is_raids_enabled"]
+    assert [role["role_id"] for role in settings_document["notification_roles"]] == [2, 3]
+
+
+@pytest.mark.asyncio
+async def test_invalidated_during_search_not_cached(settings_collection: SettingsCollection, monkeypatch):
+    """Test that the settings of the guilds with enabled raids loaded before the change are not cached."""
+    collection = settings_collection.collection
+    collection.documents[0]["is_raids_enabled"] = True
+    find = collection.find
+
+    async def find_before_change(query):
+        async for settings_document in find(query):
+            collection.documents[0]["role_from_reaction"] = {}
+            SettingsCache.invalidate(GUILD_ID)
+            yield settings_document
+
+    monkeypatch.setattr(collection, "find", find_before_change)
+    assert await settings_collection.get_guilds_ids_with_enabled_raids() == [GUILD_ID]
+
+    assert await settings_collection.get_reactions_for_action_with_roles(GUILD_ID) == [], \
+        "Settings loaded before the change should not be cached"
@@ -0,0 +1,98 @@
+"""Test that the users documents are read through the bounded cache and written through it by setters."""
+import pytest
+
+from bdo_daily_bot.core.database.memory_database import MemoryCollection
+from bdo_daily_bot.core.database.user_cache import UserCache
+from bdo_daily_bot.core.database.user_collection import UserCollection
+from bdo_daily_bot.settings import settings
+from test_framework.models.test_collection import TestCollection
+
+USER_ID = 324528465682366468
+
+
+@pytest.fixture()
+def user_collection() -> UserCollection:
+    """
+    User collection with the collection plug instead of the database collection
+
+    :return: user collection
+    """
+    UserCache.clear()
+    user_collection = UserCollection()
+    original_collection = user_collection._collection
+    user_collection._collection = TestCollection([{"discord_id": USER_ID, "nickname": "Гуляка", "entries": 0}])
+    yield user_collection
+    user_collection._collection = original_collection
+    UserCache.clear()
+
+
+@pytest.mark.asyncio
+async def test_user_read_from_cache(user_collection: UserCollection):
+    """Test that the repeated user requests by id and nickname don't request the database."""
+    for _ in range(10):
+        assert await user_collection.get_user_nickname(USER_ID) == "Гуляка"
+        assert (await user_collection.find_user_by_nickname("Гуляка"))["discord_id"] == USER_ID
+        assert not await user_collection.is_user_exist(USER_ID + 1)
+
+    assert user_collection.collection.find_requests == 2, "Users should be requested once per discord id"
+
+
+@pytest.mark.asyncio
+async def test_setters_write_through(user_collection: UserCollection):
+    """Test that the setters update cached user document without new database requests."""
+    assert not await user_collection.not_notify_status(USER_ID)
+    await user_collection.set_notify_off(USER_ID)
+    await user_collection.set_first_notification(USER_ID)
+    await user_collection.user_joined_raid(USER_ID)
+
+    assert await user_collection.not_notify_status(USER_ID)
+    assert await user_collection.first_notification_status(USER_ID)
+    assert (await user_collection.get_user_by_id(USER_ID))["entries"] == 1
+    assert user_collection.collection.find_requests == 1, "Changed user should be read from the cache"
+
+    await user_collection.entries_buffer.flush()
+    assert len(user_collection.collection.bulk_writes) == 1, "Raids entries should be written with the bulk write"
+
+
+@pytest.mark.asyncio
+async def test_re_register_after_join():
+    """Test that the re-registration during the entries flush window keeps the database, cache and entries same."""
+    UserCache.clear()
+    user_collection = UserCollection()
+    original_collection = user_collection._collection
+    user_collection._collection = MemoryCollection("user")
+    await user_collection.collection.insert_one({"discord_id": USER_ID, "discord_user": "Гуляка#1234",
+                                                 "nickname": "Old", "entries": 2})
+    try:
+        await user_collection.get_user_by_id(USER_ID)
+        await user_collection.user_joined_raid(USER_ID)
+        await user_collection.re_register_user(USER_ID, "Гуляка#1234", "New")
+        await user_collection.entries_buffer.flush()
+
+        user_document = await user_collection.collection.find_one({"discord_id": USER_ID}, {"_id": 0})
+        assert user_document == {"discord_id": USER_ID, "discord_user": "Гуляка#1234", "nickname": "New",
+                                 "entries": 3}, "Document should have the new nickname and the entries change once"
+        cached_document = await user_collection.get_user_by_id(USER_ID)
+        assert {field: cached_document.get(field) for field in user_document} == user_document
+        assert UserCache.get_by_nickname("Old") == (False, None), "Old nickname shouldn't be cached"
+    finally:
+        user_collection._collection = original_collection
+        UserCache.clear()
+
+
+def test_cache_is_bounded(monkeypatch):
+    """Test that the least recently used users are evicted over the cache size and expired users are missed."""
+    monkeypatch.setattr(settings, "USER_CACHE_SIZE", 2)
+    UserCache.clear()
+    for user_id in range(3):
+        UserCache.put(user_id, {"discord_id": user_id, "nickname": str(user_id)})
+
+    assert UserCache.size() == 2
+    assert UserCache.get_by_nickname("0") == (False, None)
+    assert UserCache.get_by_id(2)[0]
+
+    monkeypatch.setattr(settings, "USER_CACHE_TTL", 0)
+    UserCache.put(3, None)
+
+    assert UserCache.get_by_id(3) == (False, None)
+    UserCache.clear()
@@ -0,0 +1,69 @@
+"""Test that messages are resolved by id with positive and negative caching."""
+import pytest
+
+from bdo_daily_bot.core.discord_cache.message_resolver import MessageResolver
+from bdo_daily_bot.settings import settings
+from test_framework.models.test_channel import TestChannel
+
+
+@pytest.mark.asyncio
+async def test_known_message_resolved_once():
+    """Test that the known message is fetched by id only once."""
+    channel = TestChannel(1001, [1, 2, 3])
+
+    first_message = await MessageResolver.get_message(channel, 2)
+    second_message = await MessageResolver.get_message(channel, 2)
+
+    assert first_message is second_message, "Resolved messages should be the same object"
+    assert channel.fetch_requests == 1, "Known message should be requested only once"
+
+
+@pytest.mark.asyncio
+async def test_deleted_message_cached_as_missing():
+    """Test that the not found message is not requested again."""
+    channel = TestChannel(1002, [1])
+
+    assert await MessageResolver.get_message(channel, 5) is None, "Not existed message should not be resolved"
+    assert await MessageResolver.get_message(channel, 5) is None, "Not existed message should not be resolved"
+    assert channel.fetch_requests == 1, "Missing message should be requested only once"
+
+
+@pytest.mark.asyncio
+async def test_remembered_message_not_requested():
+    """Test that the remembered message is resolved without requests and can be marked as deleted."""
+    channel = TestChannel(1003, [7])
+    MessageResolver.remember(channel.messages[7])
+
+    assert await MessageResolver.get_message(channel, 7) is channel.messages[7], "Remembered message not resolved"
+    MessageResolver.forget_message(channel.id, 7)
+    assert await MessageResolver.get_message(channel, 7) is None, "Deleted message should not be resolved"
+    assert channel.fetch_requests == 0, "Remembered and deleted messages should not be requested"
+
+
+@pytest.mark.asyncio
+async def test_empty_message_id_not_requested():
+    """Test that the empty message id from the database is not requested."""
+    channel = TestChannel(1004)
+
+    assert await MessageResolver.get_message(channel, None) is None, "Empty message id should not be resolved"
+    assert channel.fetch_requests == 0, "Empty message id should not be requested"
+
+
+@pytest.mark.asyncio
+async def test_channel_index_bounded(monkeypatch):
+    """Test that the least recently used known and deleted messages are removed over the channel size."""
+    monkeypatch.setattr(settings, "MESSAGE_RESOLVER_CHANNEL_SIZE", 2)
+    channel = TestChannel(1005, [1, 2, 3])
+    for message_id in (1, 2):
+        MessageResolver.remember(channel.messages[message_id])
+    await MessageResolver.get_message(channel, 1)
+    MessageResolver.remember(channel.messages[3])
+    for message_id in (4, 5, 6):
+        await MessageResolver.get_message(channel, message_id)
+
+    assert await MessageResolver.get_message(channel, 1) is channel.messages[1], "Used message should be kept"
+    assert channel.fetch_requests == 3
+    assert await MessageResolver.get_message(channel, 2) is channel.messages[2]
+    assert await MessageResolver.get_message(channel, 4) is None
+    assert channel.fetch_requests == 5, "Least recently used known and deleted messages should be removed"
+    MessageResolver.forget_channel(channel.id)
@@ -0,0 +1,63 @@
+"""Test that the raids keeper indexes are updated on raid and member changes."""
+from datetime import datetime, timedelta
+
+from bdo_daily_bot.core.guild_managers.raids_keeper import RaidsKeeper
+from bdo_daily_bot.core.raid.raid import Raid
+from bdo_daily_bot.core.raid.raid_member import RaidMember
+
+
+def produce_raid(captain_name: str, time_leaving: datetime) -> Raid:
+    """
+    Produce raid without database and discord attributes
+
+    :param captain_name: nickname of the raid captain
+    :param time_leaving: raid time leaving
+    :return: raid to keep
+    """
+    return Raid(captain=RaidMember(nickname=captain_name), bdo_server="K-1",
+                time_leaving=time_leaving, time_reservation_open=datetime.now())
+
+
+def test_raid_indexes():
+    """Test that the raid is found by captain, time leaving and raid item only while it is kept."""
+    time_leaving = datetime.now().replace(microsecond=0) + timedelta(hours=2)
+    raid = produce_raid("Mandeson", time_leaving)
+    other_raid = produce_raid("Mandeson", time_leaving + timedelta(hours=1))
+    RaidsKeeper.add_raid(raid)
+    RaidsKeeper.add_raid(other_raid)
+
+    assert RaidsKeeper.get_by_captain_name_and_time_leaving("Mandeson", time_leaving) is raid
+    assert RaidsKeeper.get_raids_by_captain_name("Mandeson") == [raid, other_raid]
+    assert RaidsKeeper.get_raids_by_time_leaving(time_leaving) == [raid]
+    assert RaidsKeeper.has_raid_with_raid_item(raid.raid_item)
+
+    RaidsKeeper.remove_raid(raid)
+    RaidsKeeper.remove_raid(other_raid)
+
+    assert not RaidsKeeper.get_by_captain_name_and_time_leaving("Mandeson", time_leaving)
+    assert not RaidsKeeper.get_raids_by_captain_name("Mandeson")
+    assert not RaidsKeeper.get_raids_by_time_leaving(time_leaving)
+    assert not RaidsKeeper.has_raid_with_raid_item(raid.raid_item)
+
+
+def test_member_and_collection_message_indexes():
+    """Test that the members and collection messages are indexed while the raid is kept."""
+    time_leaving = datetime.now().replace(microsecond=0) + timedelta(hours=3)
+    raid = produce_raid("Mandeson", time_leaving)
+    member, restored_member = RaidMember(nickname="Гуляка"), RaidMember(nickname="Guliaka")
+    raid.members.append(restored_member)
+    RaidsKeeper.add_raid(raid)
+    RaidsKeeper.add_member(raid, member)
+    RaidsKeeper.add_collection_message(raid, 42)
+
+    assert RaidsKeeper.has_member_on_same_time(member, time_leaving)
+    assert RaidsKeeper.has_member_on_same_time(restored_member, time_leaving)
+    assert not RaidsKeeper.has_member_on_same_time(member, time_leaving + timedelta(hours=1))
+    assert RaidsKeeper.get_by_collection_message_id(42) is raid
+
+    RaidsKeeper.remove_member(raid, member)
+    assert not RaidsKeeper.has_member_on_same_time(member, time_leaving)
+
+    RaidsKeeper.remove_raid(raid)
+    assert not RaidsKeeper.has_member_on_same_time(restored_member, time_leaving)
+    assert not RaidsKeeper.get_by_collection_message_id(42)
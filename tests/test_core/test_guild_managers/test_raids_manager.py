@@ -0,0 +1,24 @@
+"""Test that the raids guild manager finds only raids of its guild."""
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+from bdo_daily_bot.core.guild_managers.raids_keeper import RaidsKeeper
+from bdo_daily_bot.core.guild_managers.raids_manager import RaidsGuildManager
+from bdo_daily_bot.core.raid.raid import Raid
+from bdo_daily_bot.core.raid.raid_member import RaidMember
+
+
+def test_collection_message_raid_of_manager_guild():
+    """Test that the raid is found by the collection message id only by the manager of the raid guild."""
+    raid = Raid(captain=RaidMember(nickname="Mandeson"), bdo_server="K-1",
+                time_leaving=datetime.now() + timedelta(hours=4), time_reservation_open=datetime.now())
+    manager = RaidsGuildManager(SimpleNamespace(name="Guild"))
+    other_manager = RaidsGuildManager(SimpleNamespace(name="Other guild"))
+    manager.add_raid(raid)
+    RaidsKeeper.add_collection_message(raid, 43)
+    try:
+        assert manager.get_raid_by_collection_message_id(43) is raid
+        assert other_manager.get_raid_by_collection_message_id(43) is None, \
+            "Manager should not return raid of the other guild"
+    finally:
+        RaidsKeeper.remove_raid(raid)
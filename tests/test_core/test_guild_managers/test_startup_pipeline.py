@@ -0,0 +1,89 @@
+"""Test that the bot startup initializes guilds managers concurrently and starts loaded raids."""
+import asyncio
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+import pytest
+
+from bdo_daily_bot.bot import BdoDailyBot
+from bdo_daily_bot.core.database.manager import DatabaseManager
+from bdo_daily_bot.core.database.memory_database import MemoryCollection
+from bdo_daily_bot.core.database.settings_cache import SettingsCache
+from bdo_daily_bot.core.database.user_cache import UserCache
+from bdo_daily_bot.core.discord_cache.message_resolver import MessageResolver
+from bdo_daily_bot.core.guild_managers.managers_controller import ManagersController
+from bdo_daily_bot.core.guild_managers.raids_keeper import RaidsKeeper
+from bdo_daily_bot.core.guild_managers.raids_manager import RaidsGuildManager
+from bdo_daily_bot.core.raid.raid_channel import RaidChannel
+from test_framework.models.test_channel import TestChannel
+
+GUILDS_IDS = [1, 2, 3]
+
+
+@pytest.fixture()
+def startup(monkeypatch) -> SimpleNamespace:
+    """
+    Database collections plugs with guilds settings and raid, the bot plug with guilds and raid channel
+
+    :return: counters of the simultaneous managers initializations and started raids flows
+    """
+    counters = SimpleNamespace(initializing=0, max_initializing=0, started_raids=[])
+
+    async def init_manager(manager: RaidsGuildManager):
+        counters.initializing += 1
+        counters.max_initializing = max(counters.max_initializing, counters.initializing)
+        await asyncio.sleep(0.01)
+        counters.initializing -= 1
+
+    async def start_raid_flow(raid):
+        counters.started_raids.append(raid)
+
+    guilds = {guild_id: SimpleNamespace(id=guild_id, name=f"Guild {guild_id}") for guild_id in GUILDS_IDS}
+    channel = TestChannel(10, [1, 2, 3])
+    channel.guild = guilds[3]
+
+    async def get_channel_by_id(_, channel_id: int):
+        return channel if channel_id == channel.id else None
+
+    monkeypatch.setattr(RaidsGuildManager, "init", init_manager)
+    monkeypatch.setattr(ManagersController, "_ManagersController__start_raid_flow", start_raid_flow)
+    monkeypatch.setattr(RaidChannel, "get_channel_by_id", classmethod(get_channel_by_id))
+    monkeypatch.setattr(BdoDailyBot, "bot", SimpleNamespace(get_guild=guilds.get, get_user=lambda _: None),
+                        raising=False)
+    monkeypatch.setattr(ManagersController, "guilds_managers", {})
+
+    database = DatabaseManager()
+    for collection_name in ("settings", "raid", "user"):
+        monkeypatch.setattr(getattr(database, collection_name), "_collection", MemoryCollection(collection_name))
+    yield counters
+    for raid in counters.started_raids:
+        RaidsKeeper.remove_raid(raid)
+    MessageResolver.forget_channel(channel.id)
+    SettingsCache.clear()
+    UserCache.clear()
+
+
+@pytest.mark.asyncio
+async def test_startup_pipeline(startup: SimpleNamespace):
+    """Test that the managers of the enabled and raids guilds are initialized concurrently and raids are started."""
+    database = DatabaseManager()
+    await database.settings.collection.insert_many([
+        {"guild_id": guild_id, "is_raids_enabled": guild_id != 3} for guild_id in GUILDS_IDS])
+    await database.raid.collection.insert_one({
+        "captain_name": "Mandeson", "game_server": "K-1", "time_leaving": datetime.now() + timedelta(hours=1),
+        "time_reservation_open": datetime.now(), "members": [{"nickname": "Гуляка"}],
+        "channels_info": [{"channel_id": 10, "reservation_message_id": 1, "collection_message_id": 2,
+                           "table_message_id": 3}],
+    })
+
+    await ManagersController.load()
+    await asyncio.sleep(0)
+
+    assert sorted(ManagersController.guilds_managers) == GUILDS_IDS
+    assert startup.max_initializing > 1, "Guilds managers should be initialized concurrently"
+    assert len(startup.started_raids) == 1
+    raid = startup.started_raids[0]
+    assert raid.channels[0].collection_message.message.id == 2
+    assert ManagersController.guilds_managers[3].active_raids == [raid]
+    assert list(ManagersController.startup_durations) == [
+        "clear expired raids", "fetch guilds and raids", "restore raids", "initialize guilds managers", "start raids"]
@@ -0,0 +1,105 @@
+"""Test that the messages are purged by ids with the bulk deletes and old messages are deleted one by one."""
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+from typing import List
+
+import pytest
+from discord import NotFound, utils
+
+from bdo_daily_bot.core.discord_cache.channel_registry import ChannelRegistry
+from bdo_daily_bot.core.guild_managment.messages_purger import MessagesPurger
+from bdo_daily_bot.settings import settings
+
+
+class PurgeChannel:
+    """Text channel plug that remembers bulk deletes and single deletes"""
+
+    def __init__(self, channel_id: int, existing_ids: List[int]):
+        self.id = channel_id
+        self.guild = "Guild"
+        self.existing_ids = set(existing_ids)
+        self.bulk_deletes: List[List[int]] = []
+        self.single_deletes: List[int] = []
+
+    def __str__(self) -> str:
+        return f"Channel {self.id}"
+
+    def get_partial_message(self, message_id: int) -> SimpleNamespace:
+        async def delete():
+            if message_id not in self.existing_ids:
+                raise NotFound(SimpleNamespace(status=404, reason="Not Found"), "Unknown Message")
+            self.existing_ids.remove(message_id)
+            self.single_deletes.append(message_id)
+
+        return SimpleNamespace(id=message_id, delete=delete)
+
+    async def delete_messages(self, messages: List[SimpleNamespace]):
+        message_ids = [message.id for message in messages]
+        assert 1 < len(message_ids) <= MessagesPurger.BULK_DELETE_LIMIT
+        self.existing_ids.difference_update(message_ids)
+        self.bulk_deletes.append(message_ids)
+
+
+def produce_message_ids(amount: int, age: timedelta) -> List[int]:
+    """
+    Produce discord message ids of the messages with the given age
+
+    :param amount: amount of the messages
+    :param age: age of the messages
+    :return: discord message ids
+    """
+    first_id = utils.time_snowflake(datetime.utcnow() - age)
+    return list(range(first_id, first_id + amount))
+
+
+@pytest.fixture(autouse=True)
+def route_limits(monkeypatch):
+    """Remove routes rate limits of the delete requests."""
+    monkeypatch.setattr(settings, "REQUEST_ROUTE_LIMITS", {})
+    monkeypatch.setattr(settings, "REQUEST_DEFAULT_LIMIT", (1000, 1))
+
+
+@pytest.mark.asyncio
+async def test_channel_purged_in_chunks():
+    """Test that the recent messages are bulk deleted in chunks and old messages are deleted one by one."""
+    recent_ids = produce_message_ids(250, timedelta(days=1))
+    old_ids = produce_message_ids(3, timedelta(days=20))
+    channel = PurgeChannel(1, recent_ids + old_ids[:2])
+
+    assert await MessagesPurger.purge_channel(channel, recent_ids + old_ids) == 252
+
+    assert [len(chunk) for chunk in channel.bulk_deletes] == [100, 100, 50]
+    assert channel.single_deletes == old_ids[:2], "Already deleted old message should be skipped"
+
+
+@pytest.mark.asyncio
+async def test_channels_purged(monkeypatch):
+    """Test that the messages are grouped by channels and each channel is purged with the one bulk delete."""
+    channels = {channel_id: PurgeChannel(channel_id, produce_message_ids(3, timedelta(minutes=channel_id)))
+                for channel_id in (1, 2)}
+
+    async def get_channel(channel_id: int):
+        return channels.get(channel_id)
+
+    monkeypatch.setattr(ChannelRegistry, "get_or_fetch", get_channel)
+    messages_ids = [(channel_id, message_id) for channel_id, channel in channels.items()
+                    for message_id in channel.existing_ids]
+
+    assert await MessagesPurger.purge(messages_ids + [(3, 1)]) == 6, "Messages of missing channel are skipped"
+
+    for channel in channels.values():
+        assert not channel.existing_ids
+        assert len(channel.bulk_deletes) == 1 and not channel.single_deletes
+
+
+@pytest.mark.asyncio
+async def test_single_deletes_limited():
+    """Test that only the given amount of the old messages is deleted one by one."""
+    recent_ids = produce_message_ids(5, timedelta(days=1))
+    old_ids = produce_message_ids(10, timedelta(days=20))
+    channel = PurgeChannel(1, recent_ids + old_ids)
+
+    assert await MessagesPurger.purge_channel(channel, recent_ids + old_ids, single_deletes_limit=3) == 8
+
+    assert channel.bulk_deletes == [recent_ids]
+    assert channel.single_deletes == old_ids[:3]
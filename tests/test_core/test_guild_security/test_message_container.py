@@ -0,0 +1,73 @@
+"""Test that the recent messages are stored in the bounded users histories and expired without tasks."""
+from types import SimpleNamespace
+from typing import List
+
+import pytest
+
+from bdo_daily_bot.core.guild_security import guild_security_manager
+from bdo_daily_bot.core.guild_security.guild_security_manager import MessageContainer
+from bdo_daily_bot.settings import settings
+
+
+def produce_message(message_id: int, user_id: int, content: str, channel_id: int = 1) -> SimpleNamespace:
+    """
+    Produce discord message plug
+
+    :param message_id: discord message id
+    :param user_id: discord id of the message author
+    :param content: message content
+    :param channel_id: discord channel id
+    :return: discord message plug
+    """
+    return SimpleNamespace(id=message_id, content=content, attachments=[],
+                           author=SimpleNamespace(id=user_id), channel=SimpleNamespace(id=channel_id))
+
+
+@pytest.fixture()
+def clock(monkeypatch) -> List[float]:
+    """
+    Clock of the message container that is moved by the test
+
+    :return: list with the current time
+    """
+    current_time = [0.0]
+    monkeypatch.setattr(guild_security_manager, "time", SimpleNamespace(monotonic=lambda: current_time[0]))
+    MessageContainer.sweep()
+    yield current_time
+    MessageContainer.sweep()
+
+
+@pytest.mark.asyncio
+async def test_messages_expired(clock: List[float]):
+    """Test that the identical messages are counted until they are expired."""
+    for message_id, channel_id in enumerate((1, 2, 2)):
+        await MessageContainer.add_message(produce_message(message_id, 1, "spam", channel_id))
+        clock[0] += 20
+    await MessageContainer.add_message(produce_message(3, 1, "not spam"))
+    spam_message = produce_message(4, 1, "spam")
+
+    assert MessageContainer.get_messages_amount(spam_message) == 2, "The first message should be expired"
+    assert MessageContainer.get_user_messages_id(spam_message) == {(2, 1), (2, 2)}
+    MessageContainer.clear_user_history(1)
+    assert MessageContainer.get_messages_amount(spam_message) == 0
+
+
+@pytest.mark.asyncio
+async def test_memory_bounded(clock: List[float], monkeypatch):
+    """Test that the user history and the amount of users are bounded and the sweep removes expired users."""
+    monkeypatch.setattr(settings, "SPAM_USER_HISTORY_SIZE", 3)
+    monkeypatch.setattr(settings, "SPAM_USERS_LIMIT", 2)
+    for message_id in range(5):
+        await MessageContainer.add_message(produce_message(message_id, 1, "spam"))
+    await MessageContainer.add_message(produce_message(5, 2, "spam"))
+    await MessageContainer.add_message(produce_message(6, 1, "spam"))
+    await MessageContainer.add_message(produce_message(7, 3, "spam"))
+
+    assert MessageContainer.get_messages_amount(produce_message(8, 1, "spam")) == 3
+    assert MessageContainer.get_messages_amount(produce_message(8, 2, "spam")) == 0, "Inactive user is evicted"
+    container = MessageContainer._MessageContainer__message_container
+    assert list(container) == [1, 3]
+
+    clock[0] += MessageContainer.MESSAGE_LIFECYCLE_IN_SECONDS
+    MessageContainer.sweep()
+    assert not container
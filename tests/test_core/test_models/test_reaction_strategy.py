@@ -0,0 +1,70 @@
+"""Test that the reaction handlers are dispatched by the compiled guild tables."""
+import pytest
+
+from bdo_daily_bot.core.commands.raid.joining import join_raid_by_reaction
+from bdo_daily_bot.core.commands.raid.settings import not_notify_me
+from bdo_daily_bot.core.commands.roles import add_role_from_reaction
+from bdo_daily_bot.core.database.settings_cache import SettingsCache
+from bdo_daily_bot.core.database.settings_collection import SettingsCollection
+from bdo_daily_bot.core.models.reaction_strategy import ReactionStrategy
+from bdo_daily_bot.core.users_interactor.message_reaction_interactor import MessagesReactions
+from test_framework.models.test_collection import TestCollection
+
+GUILD_ID = 726859545082855483
+
+
+@pytest.fixture()
+def settings_collection() -> SettingsCollection:
+    """
+    Settings collection with the collection plug with role reactions on the collection emoji
+
+    :return: settings collection
+    """
+    SettingsCache.clear()
+    settings_collection = SettingsCollection()
+    original_collection = settings_collection._collection
+    settings_collection._collection = TestCollection([{
+        "guild_id": GUILD_ID,
+        "guild": "Test guild",
+        "role_from_reaction": {"1": {MessagesReactions.COLLECTION_EMOJI: 2}, "2": {"🐉": 3}},
+    }])
+    yield settings_collection
+    settings_collection._collection = original_collection
+    SettingsCache.clear()
+
+
+@pytest.mark.asyncio
+async def test_static_handlers_not_changed(settings_collection: SettingsCollection):
+    """Test that the dynamic handlers are not accumulated in the static handlers between events."""
+    for _ in range(3):
+        dispatch_table = await ReactionStrategy.get_dispatch_table(GUILD_ID)
+        assert dispatch_table.add_handlers[MessagesReactions.COLLECTION_EMOJI] == \
+               (join_raid_by_reaction, add_role_from_reaction)
+
+    dispatch_table = await ReactionStrategy.get_dispatch_table(None)
+    assert dispatch_table.add_handlers[MessagesReactions.COLLECTION_EMOJI] == (join_raid_by_reaction,)
+    assert settings_collection.collection.find_requests == 1, "Guild table should be compiled once"
+
+
+@pytest.mark.asyncio
+async def test_handlers_filtered_by_message(settings_collection: SettingsCollection):
+    """Test that the handlers are returned only for the messages they are responsible for."""
+    assert await ReactionStrategy.get_add_reaction_handlers(GUILD_ID, 1, MessagesReactions.COLLECTION_EMOJI) == \
+           [add_role_from_reaction]
+    assert not await ReactionStrategy.get_add_reaction_handlers(GUILD_ID, 2, MessagesReactions.COLLECTION_EMOJI)
+    assert not await ReactionStrategy.get_add_reaction_handlers(GUILD_ID, 1, "🐉")
+    assert not await ReactionStrategy.get_add_reaction_handlers(GUILD_ID, 1, "🐲")
+    assert await ReactionStrategy.get_add_reaction_handlers(None, 1, MessagesReactions.NOTIFICATION_CONTROLLER_EMOJI) \
+           == [not_notify_me]
+    assert not await ReactionStrategy.get_add_reaction_handlers(
+        GUILD_ID, 1, MessagesReactions.NOTIFICATION_CONTROLLER_EMOJI)
+
+
+@pytest.mark.asyncio
+async def test_table_compiled_on_settings_change(settings_collection: SettingsCollection):
+    """Test that the guild table is compiled again after the role reactions change."""
+    assert not await ReactionStrategy.get_add_reaction_handlers(GUILD_ID, 2, "🐲")
+
+    await settings_collection.set_reaction_by_role(GUILD_ID, "Test guild", 2, "🐲", 4)
+
+    assert await ReactionStrategy.get_add_reaction_handlers(GUILD_ID, 2, "🐲") == [add_role_from_reaction]
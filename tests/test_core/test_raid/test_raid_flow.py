@@ -0,0 +1,44 @@
+"""Test that the raid flow steps run for all raid channels concurrently."""
+import time
+from datetime import datetime, timedelta
+
+import pytest
+
+from bdo_daily_bot.core.raid.raid import Raid
+from bdo_daily_bot.core.raid.raid_flow import RaidFlow
+from bdo_daily_bot.core.raid.raid_member import RaidMember
+from test_framework.models.test_channel import TestChannel
+
+CHANNEL_DELAY = 0.2
+
+
+class SlowRaidChannel:
+    """Raid channel plug that updates collection message with the channel delay"""
+
+    def __init__(self, channel: TestChannel):
+        """
+        :param channel: channel plug that answers with delay
+        """
+        self.channel = channel
+        self.is_updated = False
+
+    async def update_collection_message(self):
+        """Request collection message from the channel plug"""
+        await self.channel.fetch_message(1)
+        self.is_updated = True
+
+
+@pytest.mark.asyncio
+async def test_collection_messages_updated_concurrently():
+    """Test that the update takes about one channel delay and a failed channel doesn't stop others."""
+    raid = Raid(captain=RaidMember(nickname="Mandeson"), bdo_server="K-1",
+                time_leaving=datetime.now() + timedelta(hours=2), time_reservation_open=datetime.now())
+    raid.channels = [SlowRaidChannel(TestChannel(channel_id, [1], delay=CHANNEL_DELAY)) for channel_id in range(4)]
+    raid.channels.append(SlowRaidChannel(TestChannel(4, delay=CHANNEL_DELAY)))
+
+    start_time = time.perf_counter()
+    await RaidFlow(raid).update_collection_messages()
+    duration = time.perf_counter() - start_time
+
+    assert duration < CHANNEL_DELAY * 2, "Channels should be updated concurrently"
+    assert [channel.is_updated for channel in raid.channels] == [True] * 4 + [False]
@@ -0,0 +1,52 @@
+"""Test that the raid members are produced with one database request for all members."""
+from types import SimpleNamespace
+
+import pytest
+
+from bdo_daily_bot.bot import BdoDailyBot
+from bdo_daily_bot.core.database.manager import DatabaseManager
+from bdo_daily_bot.core.database.user_cache import UserCache
+from bdo_daily_bot.core.raid.raid_member import RaidMemberFactory
+from test_framework.models.test_collection import TestCollection
+
+USERS = {324528465682366468: "Гуляка", 324528465682366469: "Mandeson"}
+
+
+@pytest.fixture()
+def user_collection(monkeypatch) -> TestCollection:
+    """
+    User collection plug with registered users and the bot plug with these users in the cache
+
+    :return: user collection plug
+    """
+    bot = SimpleNamespace(get_user=lambda user_id: SimpleNamespace(id=user_id) if user_id in USERS else None)
+    monkeypatch.setattr(BdoDailyBot, "bot", bot, raising=False)
+    UserCache.clear()
+    user_collection = DatabaseManager().user
+    original_collection = user_collection._collection
+    user_collection._collection = TestCollection([{"discord_id": user_id, "nickname": nickname}
+                                                  for user_id, nickname in USERS.items()])
+    yield user_collection.collection
+    user_collection._collection = original_collection
+    UserCache.clear()
+
+
+@pytest.mark.asyncio
+async def test_produce_by_nicknames(user_collection: TestCollection):
+    """Test that the members are produced by nicknames with one request, unregistered members have no user."""
+    members = await RaidMemberFactory.produce_by_nicknames(["Гуляка", "Mandeson", "Гуляка", "Unknown"])
+
+    assert user_collection.find_requests == 1, "All members should be requested with one database request"
+    assert sorted(members) == ["Mandeson", "Unknown", "Гуляка"]
+    assert members["Гуляка"].user.id == 324528465682366468 and members["Mandeson"]
+    assert members["Unknown"].nickname == "Unknown" and not members["Unknown"].is_exist
+
+
+@pytest.mark.asyncio
+async def test_produce_by_discord_users_ids(user_collection: TestCollection):
+    """Test that the members are produced by discord users ids with one request, unregistered members are empty."""
+    members = await RaidMemberFactory.produce_by_discord_users_ids([324528465682366468, 324528465682366469, 1])
+
+    assert user_collection.find_requests == 1, "All members should be requested with one database request"
+    assert members[324528465682366469].nickname == "Mandeson" and members[324528465682366469].user.id
+    assert not members[1].is_registered and not members[1].is_exist
@@ -0,0 +1,69 @@
+"""Test that the raid table renderer reuses the last image and redraws only changed rows."""
+from datetime import datetime, timedelta
+
+import cv2
+import numpy as np
+
+from bdo_daily_bot.core.raid.raid import Raid
+from bdo_daily_bot.core.raid.raid_member import RaidMember
+from bdo_daily_bot.core.raid.raid_table import RaidTable
+
+
+def produce_raid() -> Raid:
+    """
+    Produce raid without database and discord attributes
+
+    :return: raid for rendering
+    """
+    return Raid(captain=RaidMember(nickname="Mandeson"), bdo_server="K-1",
+                time_leaving=datetime.now() + timedelta(hours=2), time_reservation_open=datetime.now())
+
+
+def decode(png: bytes) -> np.ndarray:
+    """
+    Decode PNG image to compare pixels
+
+    :param png: PNG encoded image
+    :return: decoded image
+    """
+    return cv2.imdecode(np.frombuffer(png, np.uint8), cv2.IMREAD_COLOR)
+
+
+def test_unchanged_table_not_rendered():
+    """Test that the table with the same members and reservation count returns the same encoded image."""
+    raid = produce_raid()
+    raid.members.append(RaidMember(nickname="Гуляка"))
+
+    assert raid.table.render() is raid.table.render(), "Unchanged table should not be rendered again"
+
+
+def test_changed_rows_rendered_as_full_table():
+    """Test that the table with redrawn rows equals the table rendered from scratch."""
+    raid = produce_raid()
+    for nickname in ["Гуляка", "Jpqgy", "Ёжик", "Mandeson"]:
+        raid.members.append(RaidMember(nickname=nickname))
+        raid.table.render()
+    raid.members.pop(1)
+    raid.reservation_count = 3
+    raid.table.render()
+    raid.members.append(RaidMember(nickname="Qwerty"))
+
+    full_table = RaidTable(raid)
+    full_table.title_color = raid.table.title_color
+
+    assert np.array_equal(decode(raid.table.render()), decode(full_table.render())), \
+        "Table with redrawn rows should be equal to the table rendered from scratch"
+
+
+def test_reservation_numbers_drawn_over_band():
+    """Test that the anti-aliased numbers of the reserved rows are blended with the band, not with white."""
+    raid = produce_raid()
+    raid.reservation_count = 5
+    image = decode(raid.table.render())
+
+    reservation_top = RaidTable.HEIGHT - RaidTable.ROW_HEIGHT * raid.reservation_count
+    numbers_column = image[reservation_top + 1:, 1:30].reshape(-1, 3).astype(int)
+    grey_pixels = numbers_column[(numbers_column[:, 0] == numbers_column[:, 1]) &
+                                 (numbers_column[:, 1] == numbers_column[:, 2]) &
+                                 (numbers_column[:, 0] > max(RaidTable.NUMBER_COLOR))]
+    assert not len(grey_pixels), "Reservation band shouldn't have grey pixels of the numbers edges"
@@ -0,0 +1,131 @@
+"""Test that the raid table images are rendered in the thread pool with the bounded amount of renders."""
+import asyncio
+import threading
+
+import pytest
+
+from bdo_daily_bot.core.raid.table_render_pool import RenderMetrics, TableRenderPool
+from bdo_daily_bot.settings import settings
+
+
+class BlockingTable:
+    """Raid table plug which render waits for the permission and remembers its thread"""
+
+    def __init__(self, name: str, release: threading.Event):
+        self.title = name
+        self.state = (name, (), 0)
+        self.render_threads = []
+        self.__release = release
+
+    def render(self, state) -> bytes:
+        """Wait for the permission and return the state title as the image"""
+        self.render_threads.append(threading.current_thread())
+        self.__release.wait(timeout=5)
+        return state[0].encode()
+
+
+@pytest.fixture(autouse=True)
+def render_pool(monkeypatch):
+    """Give every test the new render pool with the new metrics and stop its threads after the test."""
+    monkeypatch.setattr(settings, "RENDER_POOL_SIZE", 4)
+    monkeypatch.setattr(settings, "RENDER_QUEUE_SIZE", 2)
+    monkeypatch.setattr(TableRenderPool, "metrics", RenderMetrics())
+    monkeypatch.setattr(TableRenderPool, "_TableRenderPool__queue_slots", None)
+    monkeypatch.setattr(TableRenderPool, "_TableRenderPool__waiting_renders", {})
+    yield
+    TableRenderPool.shutdown()
+
+
+async def wait_renders(tables, amount: int):
+    """
+    Wait until the given amount of tables started rendering
+
+    :param tables: raid tables plugs
+    :param amount: amount of the started renders
+    """
+    for _ in range(100):
+        if sum(len(table.render_threads) for table in tables) >= amount:
+            return
+        await asyncio.sleep(0.01)
+
+
+@pytest.mark.asyncio
+async def test_render_out_of_event_loop():
+    """Test that the render runs in the pool thread and the event loop runs while the table is rendered."""
+    release = threading.Event()
+    table = BlockingTable("Table", release)
+    render = asyncio.ensure_future(TableRenderPool.render(table))
+
+    await wait_renders([table], 1)
+    assert not render.done(), "Render should wait for the permission"
+    assert await asyncio.wait_for(asyncio.sleep(0, "loop"), 1) == "loop", "Event loop should not be blocked"
+
+    release.set()
+    assert (await render).getvalue() == b"Table"
+    assert table.render_threads[0] is not threading.main_thread()
+    assert table.render_threads[0].name.startswith("raid_table_render")
+    assert TableRenderPool.metrics.renders == 1
+    assert TableRenderPool.metrics.queue_depth == 0
+
+
+@pytest.mark.asyncio
+async def test_renders_bounded_by_queue_size():
+    """Test that no more than settings.RENDER_QUEUE_SIZE renders are sent to the pool and others wait."""
+    release = threading.Event()
+    tables = [BlockingTable(f"Table {number}", release) for number in range(5)]
+    renders = asyncio.gather(*(TableRenderPool.render(table) for table in tables))
+
+    await wait_renders(tables, 2)
+    await asyncio.sleep(0.05)
+    assert sum(len(table.render_threads) for table in tables) == 2, "Only 2 renders should be in the pool"
+    assert TableRenderPool.metrics.queue_depth == 5
+
+    release.set()
+    images = await renders
+    assert [image.getvalue() for image in images] == [table.title.encode() for table in tables]
+    metrics = TableRenderPool.metrics
+    assert (metrics.renders, metrics.queue_depth, metrics.max_queue_depth) == (5, 0, 5)
+    assert metrics.max_latency >= metrics.last_latency > 0
+    assert metrics.average_wait_time > 0, "Renders out of the queue should wait for the place"
+
+
+@pytest.mark.asyncio
+async def test_table_renders_coalesced(monkeypatch):
+    """Test that the waiting renders of the same table are merged into the one render of the latest state."""
+    monkeypatch.setattr(settings, "RENDER_QUEUE_SIZE", 1)
+    release = threading.Event()
+    running_table, waiting_table = BlockingTable("Running", release), BlockingTable("Waiting", release)
+    running_render = asyncio.ensure_future(TableRenderPool.render(running_table))
+    await wait_renders([running_table], 1)
+
+    waiting_renders = []
+    for number in range(3):
+        waiting_table.state = (f"Waiting {number}", (), 0)
+        waiting_renders.append(asyncio.ensure_future(TableRenderPool.render(waiting_table)))
+        await asyncio.sleep(0)
+    assert TableRenderPool.metrics.queue_depth == 2, "Table should have the one waiting render"
+
+    release.set()
+    await running_render
+    images = await asyncio.gather(*waiting_renders)
+    assert [image.getvalue() for image in images] == [b"Waiting 2"] * 3, "Render should draw the latest state"
+    assert len(waiting_table.render_threads) == 1
+    assert (TableRenderPool.metrics.renders, TableRenderPool.metrics.coalesced) == (2, 2)
+
+
+@pytest.mark.asyncio
+async def test_shutdown():
+    """Test that the shutdown stops pool threads and the next render starts the new pool."""
+    release = threading.Event()
+    release.set()
+    table = BlockingTable("Table", release)
+
+    await TableRenderPool.render(table)
+    TableRenderPool.shutdown()
+    await TableRenderPool.render(table)
+
+    first_thread, second_thread = table.render_threads
+    first_thread.join(timeout=1)
+    assert not first_thread.is_alive(), "Pool thread should be stopped after shutdown"
+    assert second_thread.is_alive(), "Render after shutdown should start the new pool"
+    assert TableRenderPool.metrics.renders == 2
@@ -0,0 +1,105 @@
+"""Test that the discord API requests are sent in the priority order, limited by routes and shed under load."""
+import asyncio
+from typing import List
+
+import pytest
+
+from bdo_daily_bot.core.tools.request_scheduler import RequestPriority, RequestScheduler
+from bdo_daily_bot.settings import settings
+
+
+def produce_request(sent_requests: List[str], name: str):
+    """
+    Produce discord API request that remembers its sending
+
+    :param sent_requests: list to remember request name
+    :param name: request name
+    :return: coroutine function of the request
+    """
+    async def request() -> str:
+        sent_requests.append(name)
+        return name
+    return request
+
+
+@pytest.fixture(autouse=True)
+def route_limits(monkeypatch):
+    """Limit the test route to the one request per 0.1 second."""
+    monkeypatch.setattr(settings, "REQUEST_ROUTE_LIMITS", {"reaction": (1, 0.1)})
+
+
+@pytest.mark.asyncio
+async def test_priority_order():
+    """Test that the high priority requests of the exhausted route are sent before the low priority ones."""
+    sent_requests = []
+    assert await RequestScheduler.run(RequestPriority.LOW, "reaction/1", produce_request(sent_requests, "first"))
+    RequestScheduler.dispatch(RequestPriority.LOW, "reaction/1", produce_request(sent_requests, "success"))
+    RequestScheduler.dispatch(RequestPriority.MEDIUM, "reaction/1", produce_request(sent_requests, "collection"))
+    reply = asyncio.ensure_future(
+        RequestScheduler.run(RequestPriority.HIGH, "reaction/1", produce_request(sent_requests, "reply")))
+    other_route = asyncio.ensure_future(
+        RequestScheduler.run(RequestPriority.LOW, "reaction/2", produce_request(sent_requests, "other")))
+
+    assert await other_route == "other"
+    assert sent_requests == ["first", "other"], "Other route shouldn't wait the exhausted route"
+    assert await reply == "reply"
+    await RequestScheduler.close()
+
+    assert sent_requests == ["first", "other", "reply", "collection", "success"]
+
+
+@pytest.mark.asyncio
+async def test_load_shedding(monkeypatch):
+    """Test that the low priority requests are coalesced and dropped when the queue is full."""
+    monkeypatch.setattr(settings, "REQUEST_QUEUE_LIMIT", 3)
+    sent_requests, low_metrics = [], RequestScheduler.metrics[RequestPriority.LOW]
+    dropped, coalesced = low_metrics.dropped, low_metrics.coalesced
+
+    assert await RequestScheduler.run(RequestPriority.LOW, "reaction/1", produce_request(sent_requests, "first"))
+    edits = asyncio.gather(*(
+        RequestScheduler.run(RequestPriority.LOW, "reaction/1", produce_request(sent_requests, name),
+                             coalesce_key="edit/1") for name in ("old edit", "new edit")))
+    await asyncio.sleep(0)
+    RequestScheduler.dispatch(RequestPriority.LOW, "reaction/1", produce_request(sent_requests, "success"))
+    RequestScheduler.dispatch(RequestPriority.LOW, "reaction/1", produce_request(sent_requests, "embed"))
+    RequestScheduler.dispatch(RequestPriority.LOW, "reaction/1", produce_request(sent_requests, "dropped"))
+    reply = asyncio.ensure_future(
+        RequestScheduler.run(RequestPriority.HIGH, "reaction/1", produce_request(sent_requests, "reply")))
+    await asyncio.sleep(0)
+
+    assert RequestScheduler.queue_depths() == {"HIGH": 1, "MEDIUM": 0, "LOW": 2}
+    assert await edits == [None, None], "Full queue should displace the oldest low priority request"
+    assert await reply == "reply"
+    await RequestScheduler.close()
+
+    assert sent_requests == ["first", "reply", "success", "embed"]
+    assert low_metrics.coalesced - coalesced == 1
+    assert low_metrics.dropped - dropped == 2
+
+
+@pytest.mark.asyncio
+async def test_concurrency_between_bursts(monkeypatch):
+    """Test that the concurrency limit holds when the queue empties while requests are running and close waits them."""
+    monkeypatch.setattr(settings, "REQUEST_CONCURRENCY", 2)
+    running_requests, max_running_requests, sent_requests = 0, 0, []
+
+    def produce_slow_request(name: str):
+        async def request():
+            nonlocal running_requests, max_running_requests
+            running_requests += 1
+            max_running_requests = max(max_running_requests, running_requests)
+            await asyncio.sleep(0.05)
+            running_requests -= 1
+            sent_requests.append(name)
+        return request
+
+    for burst in range(3):
+        for number in range(2):
+            RequestScheduler.dispatch(RequestPriority.MEDIUM, f"slow/{burst}{number}",
+                                      produce_slow_request(f"{burst}{number}"))
+        await asyncio.sleep(0.01)
+    await RequestScheduler.close()
+
+    assert len(sent_requests) == 6, "Close should wait the running requests"
+    assert max_running_requests == 2, "No more than REQUEST_CONCURRENCY requests should run at the same time"
+    assert RequestScheduler._RequestScheduler__semaphore._value == 2, "Every request should release its place"
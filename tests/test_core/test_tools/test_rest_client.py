@@ -0,0 +1,100 @@
+"""Test that the REST API requests share one session, respect rate limits and are retried."""
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, List
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+from discord import Forbidden
+
+from bdo_daily_bot.core.tools.rest_client import RestClient
+from bdo_daily_bot.settings import settings
+
+ROUTE = "/guilds/{guild_id}/members/{user_id}"
+
+
+@pytest.fixture()
+def responses(monkeypatch) -> List[web.Response]:
+    """
+    Responses of the local discord API server in the order of the requests
+
+    Retries backoff is shortened, API url is restored after the test.
+
+    :return: list to fill with responses
+    """
+    monkeypatch.setattr(settings, "REST_RETRY_BACKOFF", 0.01)
+    monkeypatch.setattr(settings, "DISCORD_API_URL", settings.DISCORD_API_URL)
+    return []
+
+
+@asynccontextmanager
+async def start_discord_server(responses: List[web.Response]) -> AsyncIterator[TestServer]:
+    """
+    Start local discord API server that answers with the given responses and remembers requests
+
+    :param responses: responses in the order of the requests
+    :return: started local server
+    """
+    async def handle(request: web.Request) -> web.Response:
+        request.app["requests"].append((request.path, time.monotonic()))
+        return responses.pop(0) if responses else web.json_response({})
+
+    application = web.Application()
+    application["requests"] = []
+    application.router.add_route("*", "/{path:.*}", handle)
+    server = TestServer(application)
+    await server.start_server()
+    settings.DISCORD_API_URL = str(server.make_url("")).rstrip("/")
+    try:
+        yield server
+    finally:
+        await RestClient.close()
+        await server.close()
+
+
+@pytest.mark.asyncio
+async def test_requests_share_session(responses: List[web.Response]):
+    """Test that the requests are sent through the one shared session."""
+    async with start_discord_server(responses) as discord_server:
+        for user_id in range(3):
+            assert await RestClient.request("PATCH", ROUTE, json={}, guild_id=1, user_id=user_id) == {}
+        session = RestClient._RestClient__session
+
+    assert session.closed, "Session should be closed with the client"
+    assert [path for path, _ in discord_server.app["requests"]] == [
+        "/guilds/1/members/0", "/guilds/1/members/1", "/guilds/1/members/2"]
+
+
+@pytest.mark.asyncio
+async def test_exhausted_bucket_waits_reset(responses: List[web.Response]):
+    """Test that the request waits the bucket reset after the response with no remaining requests."""
+    responses.append(web.json_response({}, headers={"X-RateLimit-Remaining": "0",
+                                                    "X-RateLimit-Reset-After": "0.2"}))
+
+    async with start_discord_server(responses) as discord_server:
+        await RestClient.request("PATCH", ROUTE, guild_id=1, user_id=1)
+        await RestClient.request("PATCH", ROUTE, guild_id=2, user_id=1)
+        await RestClient.request("PATCH", ROUTE, guild_id=1, user_id=2)
+
+    times = [request_time for _, request_time in discord_server.app["requests"]]
+    assert times[1] - times[0] < 0.2, "Other guild bucket shouldn't wait"
+    assert times[2] - times[0] >= 0.2, "Exhausted bucket should wait the reset"
+
+
+@pytest.mark.asyncio
+async def test_retries(responses: List[web.Response]):
+    """Test that the rate limited and server errors are retried and client errors are raised."""
+    responses.extend([
+        web.json_response({"retry_after": 0.05, "global": False}, status=429),
+        web.Response(status=502),
+        web.json_response({"id": 1}),
+        web.json_response({"message": "Missing Permissions", "code": 50013}, status=403),
+    ])
+
+    async with start_discord_server(responses) as discord_server:
+        assert await RestClient.request("GET", ROUTE, guild_id=1, user_id=1) == {"id": 1}
+        with pytest.raises(Forbidden):
+            await RestClient.request("GET", ROUTE, guild_id=1, user_id=1)
+
+    assert len(discord_server.app["requests"]) == 4
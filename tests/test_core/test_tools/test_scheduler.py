@@ -0,0 +1,71 @@
+"""Test that the scheduled jobs run at their deadlines in batches and can be cancelled by key."""
+import asyncio
+from datetime import datetime, timedelta
+from typing import List
+
+import pytest
+
+from bdo_daily_bot.core.raid.raid_time import RaidTime
+from bdo_daily_bot.core.tools.scheduler import Scheduler
+from bdo_daily_bot.settings import settings
+
+
+def produce_job(fired_jobs: List[str], name: str, duration: float = 0):
+    """
+    Produce job that remembers its run
+
+    :param fired_jobs: list to remember job name
+    :param name: job name
+    :param duration: seconds of the job run
+    :return: coroutine function of the job
+    """
+    async def job():
+        await asyncio.sleep(duration)
+        fired_jobs.append(name)
+    return job
+
+
+@pytest.mark.asyncio
+async def test_jobs_fired_in_batch(monkeypatch):
+    """Test that the jobs due in the same tick are fired together, jobs of the same key run in order."""
+    monkeypatch.setattr(settings, "SCHEDULER_TICK", 0.1)
+    fired_jobs, fired_batches = [], Scheduler.fired_batches
+    deadline = datetime.now() + timedelta(seconds=0.1)
+    Scheduler.schedule("Mandeson", "display", deadline, produce_job(fired_jobs, "Mandeson display", 0.05))
+    Scheduler.schedule("Mandeson", "leaving", deadline, produce_job(fired_jobs, "Mandeson leaving"))
+    Scheduler.schedule("Гуляка", "display", deadline + timedelta(seconds=0.05), produce_job(fired_jobs, "Гуляка"))
+    Scheduler.schedule("Гуляка", "end", deadline + timedelta(seconds=0.5), produce_job(fired_jobs, "Гуляка end"))
+
+    await asyncio.sleep(0.3)
+
+    assert fired_jobs == ["Гуляка", "Mandeson display", "Mandeson leaving"]
+    assert Scheduler.fired_batches - fired_batches == 1, "Jobs due in the same tick should be fired together"
+    assert [job.name for job in Scheduler.get_pending_jobs()] == ["end"]
+    Scheduler.cancel("Гуляка")
+    await asyncio.sleep(0.01)
+
+
+@pytest.mark.asyncio
+async def test_cancelled_jobs_not_fired():
+    """Test that the cancelled jobs are not fired and the earlier job wakes up sleeping scheduler."""
+    fired_jobs = []
+    Scheduler.schedule("Mandeson", "end", datetime.now() + timedelta(hours=1), produce_job(fired_jobs, "end"))
+    Scheduler.schedule("Mandeson", "display", datetime.now() + timedelta(seconds=0.1),
+                       produce_job(fired_jobs, "display"))
+    Scheduler.schedule("Гуляка", "display", datetime.now() + timedelta(seconds=0.1), produce_job(fired_jobs, "other"))
+    Scheduler.cancel("Mandeson")
+
+    await asyncio.sleep(0.2)
+
+    assert fired_jobs == ["other"]
+    assert not Scheduler.get_pending_jobs()
+
+
+def test_display_times():
+    """Test that the raid table display times are absolute times before leaving after the collection start."""
+    time_leaving = datetime.now().replace(microsecond=0) + timedelta(hours=3)
+    raid_time = RaidTime(time_leaving, time_leaving - timedelta(minutes=30))
+
+    assert raid_time.display_times == [time_leaving - timedelta(seconds=secs) for secs in (360, 60, 0)]
+    assert raid_time.normal_next_display_time == (time_leaving - timedelta(seconds=360)).strftime('%H:%M')
+    assert len(RaidTime(time_leaving, datetime.now()).display_times) == 6
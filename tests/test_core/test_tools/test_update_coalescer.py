@@ -0,0 +1,72 @@
+"""Test that the frequent update requests are merged into the one update."""
+import asyncio
+
+import pytest
+
+from bdo_daily_bot.core.tools.update_coalescer import UpdateCoalescer
+
+
+class UpdatesCounter:
+    """Update plug that counts updates"""
+
+    def __init__(self):
+        self.updates = 0
+
+    async def update(self):
+        """Count update"""
+        self.updates += 1
+
+
+@pytest.mark.asyncio
+async def test_requests_merged_in_window():
+    """Test that the requests during the window are merged and requests after update start new window."""
+    counter = UpdatesCounter()
+    coalescer = UpdateCoalescer(counter.update, "Test", window=0.05)
+
+    for _ in range(15):
+        coalescer.request()
+    assert counter.updates == 0, "Update should wait for the end of the window"
+
+    await asyncio.sleep(0.1)
+    assert counter.updates == 1
+
+    coalescer.request()
+    await asyncio.sleep(0.1)
+    assert counter.updates == 2
+
+
+@pytest.mark.asyncio
+async def test_pending_updates_flushed():
+    """Test that the flush runs pending updates immediately and only once."""
+    counters = [UpdatesCounter() for _ in range(3)]
+    coalescers = [UpdateCoalescer(counter.update, "Test", window=10) for counter in counters]
+    for coalescer in coalescers:
+        coalescer.request()
+        coalescer.request()
+
+    await UpdateCoalescer.flush_all()
+    await coalescers[0].flush()
+
+    assert [counter.updates for counter in counters] == [1, 1, 1]
+    assert not any(coalescer.is_pending for coalescer in coalescers)
+
+
+@pytest.mark.asyncio
+async def test_flush_waits_running_update():
+    """Test that the flush during the window update waits the update and the coalescer stays pending until then."""
+    update_started, update_finished = asyncio.Event(), asyncio.Event()
+
+    async def slow_update():
+        update_started.set()
+        await asyncio.sleep(0.05)
+        update_finished.set()
+
+    coalescer = UpdateCoalescer(slow_update, "Test", window=0)
+    coalescer.request()
+    await update_started.wait()
+    assert coalescer.is_pending, "Coalescer should be pending until the update is done"
+
+    await UpdateCoalescer.flush_all()
+    assert update_finished.is_set(), "Flush should wait the running update"
+    assert not coalescer.is_pending
+    assert coalescer.updates == 1
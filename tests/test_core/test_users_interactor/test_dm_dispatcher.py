@@ -0,0 +1,83 @@
+"""Test that the direct messages are sent by the bounded amount of workers, retried and dropped."""
+import asyncio
+from types import SimpleNamespace
+from typing import List
+
+import pytest
+from discord import Forbidden, HTTPException
+
+from bdo_daily_bot.core.users_interactor.dm_dispatcher import DirectMessageDispatcher
+from bdo_daily_bot.settings import settings
+
+
+class FakeUser:
+    """Discord user that remembers sent messages and fails the first sending with the given errors"""
+
+    active_sends = 0
+    max_active_sends = 0
+
+    def __init__(self, name: str, errors: List[Exception] = None):
+        self.id = hash(name)
+        self.name = name
+        self.errors = errors or []
+        self.messages = []
+
+    async def send(self, message: str) -> str:
+        FakeUser.active_sends += 1
+        FakeUser.max_active_sends = max(FakeUser.max_active_sends, FakeUser.active_sends)
+        try:
+            await asyncio.sleep(0.02)
+            if self.errors:
+                raise self.errors.pop(0)
+            self.messages.append(message)
+            return message
+        finally:
+            FakeUser.active_sends -= 1
+
+
+def produce_error(error_class: type, status: int) -> Exception:
+    """
+    Produce discord HTTP error with the given status
+
+    :param error_class: discord HTTP error class
+    :param status: HTTP status of the response
+    :return: discord HTTP error
+    """
+    return error_class(SimpleNamespace(status=status, reason="Error"), "Error")
+
+
+@pytest.fixture(autouse=True)
+def fast_dispatcher(monkeypatch):
+    """Shorten retries backoff and remove rate limit of the direct messages."""
+    monkeypatch.setattr(settings, "DM_RETRY_BACKOFF", 0.01)
+    monkeypatch.setattr(settings, "DM_RATE", 1000)
+    monkeypatch.setattr(settings, "DM_CONCURRENCY", 3)
+    FakeUser.max_active_sends = 0
+
+
+@pytest.mark.asyncio
+async def test_bounded_concurrency():
+    """Test that the dispatched messages are sent concurrently by no more than the configured workers."""
+    users = [FakeUser(f"Mandeson{number}") for number in range(10)]
+    for user in users:
+        DirectMessageDispatcher.dispatch(user, "notification")
+    await DirectMessageDispatcher.close()
+
+    assert all(user.messages == ["notification"] for user in users)
+    assert FakeUser.max_active_sends == settings.DM_CONCURRENCY
+
+
+@pytest.mark.asyncio
+async def test_retries():
+    """Test that the rate limited and failed by server messages are retried and forbidden ones are dropped."""
+    user = FakeUser("Mandeson", [produce_error(HTTPException, 429), produce_error(HTTPException, 502)])
+    closed_user = FakeUser("Гуляка", [produce_error(Forbidden, 403)])
+    dropped, failed = DirectMessageDispatcher.dropped, DirectMessageDispatcher.failed
+
+    assert await DirectMessageDispatcher.send(user, "notification") == "notification"
+    assert await DirectMessageDispatcher.send(closed_user, "notification") is None
+    await DirectMessageDispatcher.close()
+
+    assert user.messages == ["notification"]
+    assert DirectMessageDispatcher.dropped - dropped == 1
+    assert DirectMessageDispatcher.failed == failed
@@ -1,8 +1,19 @@
+"""
+Database tests fixtures
+
+Tests use MongoDB by default. Run them on the in-memory database without MongoDB:
+BDO_DAILY_BOT_DATABASE_BACKEND=memory python -m pytest test_database
+"""
 import asyncio
 
 import pytest
 from motor.motor_asyncio import AsyncIOMotorClient
 
+from bdo_daily_bot.core.database.database import Database
+from bdo_daily_bot.core.database.settings_cache import SettingsCache
+from bdo_daily_bot.core.database.user_cache import UserCache
+from bdo_daily_bot.settings import settings
+
 
 @pytest.fixture(scope="session")
 def event_loop():
@@ -19,5 +30,10 @@ def event_loop():
 @pytest.fixture(autouse=True)
 @pytest.mark.asyncio
 async def clear_database():
-    """Clear up the database after each test."""
-    await AsyncIOMotorClient().drop_database('test_discord')
+    """Clear up the database and the settings and users caches after each test."""
+    if settings.DATABASE_BACKEND == 'memory':
+        await Database().database.drop()
+    else:
+        await AsyncIOMotorClient().drop_database('test_discord')
+    SettingsCache.clear()
+    UserCache.clear()
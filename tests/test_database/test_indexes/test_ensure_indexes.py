@@ -0,0 +1,20 @@
+"""Test that all declared indexes are created and repeated creation doesn't fail."""
+import pytest
+from motor.motor_asyncio import AsyncIOMotorDatabase
+
+from test_framework.asserts.database_asserts.check_indexes import check_ensure_indexes
+from test_framework.scripts.common.data_factory import get_test_data
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize('test_data', get_test_data(__file__))
+async def test_ensure_indexes(database: AsyncIOMotorDatabase, test_data: dict):
+    """
+    Test that all declared indexes are created and repeated creation doesn't fail.
+
+    :param database: Mongo database.
+    :type database: AsyncIOMotorDatabase
+    :param test_data: Database indexes test data.
+    :type test_data: dict
+    """
+    await check_ensure_indexes(database, test_data)
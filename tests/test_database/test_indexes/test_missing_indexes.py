@@ -0,0 +1,20 @@
+"""Test that indexes of not indexed collections are reported as missing."""
+import pytest
+from motor.motor_asyncio import AsyncIOMotorDatabase
+
+from test_framework.asserts.database_asserts.check_indexes import check_missing_indexes
+from test_framework.scripts.common.data_factory import get_test_data
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize('test_data', get_test_data(__file__))
+async def test_missing_indexes(database: AsyncIOMotorDatabase, test_data: dict):
+    """
+    Test that indexes of not indexed collections are reported as missing.
+
+    :param database: Mongo database.
+    :type database: AsyncIOMotorDatabase
+    :param test_data: Database indexes test data.
+    :type test_data: dict
+    """
+    await check_missing_indexes(database, test_data)
@@ -0,0 +1,20 @@
+"""Test that the collection query scans the declared index instead of the whole collection."""
+import pytest
+from motor.motor_asyncio import AsyncIOMotorDatabase
+
+from test_framework.asserts.database_asserts.check_indexes import check_query_uses_index
+from test_framework.scripts.common.data_factory import get_test_data
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize('test_data', get_test_data(__file__))
+async def test_query_uses_index(database: AsyncIOMotorDatabase, test_data: dict):
+    """
+    Test that the collection query scans the declared index instead of the whole collection.
+
+    :param database: Mongo database.
+    :type database: AsyncIOMotorDatabase
+    :param test_data: Database indexes test data.
+    :type test_data: dict
+    """
+    await check_query_uses_index(database, test_data)
@@ -0,0 +1,20 @@
+"""Test that the raid member is added to the raid document once."""
+import pytest
+
+from bdo_daily_bot.core.database.raid_collection import RaidCollection
+from test_framework.asserts.database_asserts.check_raid_collection import check_add_raid_member
+from test_framework.scripts.common.data_factory import get_test_data
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize('test_data', get_test_data(__file__))
+async def test_add_raid_member(raid_collection: RaidCollection, test_data: dict):
+    """
+    Test that the raid member is added to the raid document once.
+
+    :param raid_collection: Database raid collection.
+    :type raid_collection: RaidCollection
+    :param test_data: Raid collection test data.
+    :type test_data: dict
+    """
+    await check_add_raid_member(raid_collection, test_data)